@@ -244,3 +244,8 @@ from .code.PythonicWrapper import (
     p,
     PythonicWrapper,
 )
+
+# Profiling - opt-in per-method timing of Operations calls
+from .code.BaseOperations import (
+    OperationsProfiler,
+)
@@ -13,6 +13,13 @@
 
 # --- Imports ------------------------------------------------------------------
 
+import bisect
+import collections.abc
+import itertools
+import operator
+import sys
+import time
+
 from .exceptions import (
     FP_ReadOnlyError,
     FP_NullParameterError,
@@ -28,8 +35,9 @@ class EnumerableWrapper:
     Wraps C# IEnumerable to provide Pythonic interface.
 
     C# IEnumerable collections don't support indexing or .Count in Python.
-    This wrapper makes them behave like Python sequences while maintaining
-    lazy evaluation when possible.
+    This wrapper makes them behave like Python sequences while keeping
+    evaluation lazy: simple questions about a large collection never copy
+    the whole collection into a Python list.
 
     Provides:
       - .Count property (returns count of items)
@@ -37,6 +45,24 @@ class EnumerableWrapper:
       - Iteration support (for item in collection)
       - Contains support (x in collection)
 
+    Lazy mode (the default) answers each question as cheaply as the source
+    allows:
+      - ``len()`` / ``.Count`` use the ``count`` argument, or the source's own
+        ``Count`` (owning sequences, collections), before falling back to a
+        counting pass that keeps nothing alive.
+      - Indexing uses the source's native indexer when it has one, otherwise
+        it enumerates only as far as the requested position.
+      - ``in`` stops at the first match; slicing stops at ``stop``.
+
+    Re-enumerable sources (anything exposing ``GetEnumerator``, or a Python
+    collection) are enumerated afresh for every question. One-shot sources
+    (Python iterators and generators) are buffered incrementally - only the
+    prefix actually consumed is kept - so they can still be iterated more
+    than once.
+
+    ``lazy=False`` restores the original behaviour: the first question
+    materializes the whole collection and later questions read that snapshot.
+
     Usage::
 
         items = GetWordforms()  # Returns IEnumerable
@@ -46,21 +72,74 @@ class EnumerableWrapper:
             ...
     """
 
-    def __init__(self, enumerable):
+    def __init__(self, enumerable, count=None, lazy=True):
         """Wrap an IEnumerable collection.
 
         Args:
-            enumerable: A C# IEnumerable object from LibLCM
+            enumerable: A C# IEnumerable object from LibLCM (or any Python
+                iterable).
+            count: Optional item count, either an int or a zero-argument
+                callable returning one (e.g. ``lambda: repo.Count``). Used by
+                ``len()`` so the collection need not be enumerated.
+            lazy: If False, materialize the collection on first access and
+                answer every later question from that snapshot.
         """
         self._enumerable = enumerable
+        self._count = count
+        self._lazy = lazy
         self._cached_list = None
+        # One-shot sources (iterators/generators) cannot be re-enumerated,
+        # so the consumed prefix is kept in _buffer.
+        self._one_shot = isinstance(enumerable, collections.abc.Iterator)
+        self._buffer = []
+        self._exhausted = False
 
     def _ensure_list(self):
-        """Convert to list on first access (lazy evaluation)."""
+        """Convert to list on first access (materializing path)."""
         if self._cached_list is None:
-            self._cached_list = list(self._enumerable)
+            self._cached_list = list(self._iter_items())
         return self._cached_list
 
+    def _fill(self, n=None):
+        """Pull from a one-shot source until ``n`` items are buffered (or all, if None)."""
+        buffer = self._buffer
+        while not self._exhausted and (n is None or len(buffer) < n):
+            try:
+                buffer.append(next(self._enumerable))
+            except StopIteration:
+                self._exhausted = True
+        return buffer
+
+    def _iter_items(self):
+        """Iterate the source without materializing it."""
+        if not self._one_shot:
+            return iter(self._enumerable)
+        return self._iter_buffered()
+
+    def _iter_buffered(self):
+        index = 0
+        while True:
+            if index >= len(self._buffer):
+                self._fill(index + 1)
+                if index >= len(self._buffer):
+                    return
+            yield self._buffer[index]
+            index += 1
+
+    def _native_count(self):
+        """Return the count without enumerating, or None if the source can't tell."""
+        if self._count is not None:
+            return self._count() if callable(self._count) else self._count
+        if self._one_shot:
+            return len(self._buffer) if self._exhausted else None
+        if isinstance(self._enumerable, collections.abc.Sized):
+            return len(self._enumerable)
+        try:
+            count = self._enumerable.Count
+        except AttributeError:
+            return None
+        return count if isinstance(count, int) else None
+
     @property
     def Count(self):
         """Get count of items in the collection (Pythonic for C# .Count).
@@ -73,7 +152,15 @@ class EnumerableWrapper:
             items = project.GetWordforms()
             count = items.Count  # Returns number of wordforms
         """
-        return len(self._ensure_list())
+        if self._cached_list is not None or not self._lazy:
+            return len(self._ensure_list())
+        count = self._native_count()
+        if count is not None:
+            return count
+        if self._one_shot:
+            return len(self._fill())
+        # Counting pass: O(n) time, but nothing is kept alive.
+        return sum(1 for _ in self._iter_items())
 
     def __len__(self):
         """Support len() function."""
@@ -95,22 +182,58 @@ class EnumerableWrapper:
             last = items[-1]      # Last item
             some = items[1:5]     # Slice
         """
-        return self._ensure_list()[index]
+        if self._cached_list is not None or not self._lazy:
+            return self._ensure_list()[index]
+
+        if isinstance(index, slice):
+            start, stop, step = index.start, index.stop, index.step
+            if any(v is not None and v < 0 for v in (start, stop, step)):
+                # Negative bounds/steps need the length first.
+                start, stop, step = index.indices(self.Count)
+                if step < 0:
+                    return list(self._iter_items())[index]
+            return list(itertools.islice(self._iter_items(), start, stop, step))
+
+        index = operator.index(index)
+        if index < 0:
+            index += self.Count
+            if index < 0:
+                raise IndexError("EnumerableWrapper index out of range")
+        if self._one_shot:
+            buffer = self._fill(index + 1)
+            if index < len(buffer):
+                return buffer[index]
+            raise IndexError("EnumerableWrapper index out of range")
+        if self._native_count() is not None and hasattr(type(self._enumerable), "__getitem__"):
+            # Owning sequences and collections have a native O(1) indexer.
+            try:
+                return self._enumerable[index]
+            except TypeError:
+                pass  # Not actually subscriptable; enumerate instead.
+        for item in itertools.islice(self._iter_items(), index, None):
+            return item
+        raise IndexError("EnumerableWrapper index out of range")
 
     def __iter__(self):
         """Support iteration (for item in collection)."""
-        return iter(self._ensure_list())
+        if self._cached_list is not None or not self._lazy:
+            return iter(self._ensure_list())
+        return self._iter_items()
 
     def __contains__(self, item):
         """Support 'in' operator.
 
+        Stops enumerating at the first match.
+
         Example::
 
             items = project.GetWordforms()
             if my_word in items:
                 ...
         """
-        return item in self._ensure_list()
+        if self._cached_list is not None or not self._lazy:
+            return item in self._ensure_list()
+        return any(candidate is item or candidate == item for candidate in self._iter_items())
 
     def __repr__(self):
         """String representation."""
@@ -189,6 +312,172 @@ class wrap_enumerable:
             return EnumerableWrapper(result)
         return result
 
+class _MethodStats:
+    """Accumulated profile figures for one Operations method."""
+
+    __slots__ = ("ncalls", "tottime", "cumtime", "round_trips")
+
+    def __init__(self):
+        self.ncalls = 0
+        self.tottime = 0.0
+        self.cumtime = 0.0
+        self.round_trips = 0
+
+    def __repr__(self):
+        return (f"_MethodStats(ncalls={self.ncalls}, tottime={self.tottime:.6f}, "
+                f"cumtime={self.cumtime:.6f}, round_trips={self.round_trips})")
+
+
+# The active OperationsProfiler, or None. OperationsMethod only checks this
+# global, so there is no per-call cost while profiling is off.
+_active_profiler = None
+
+
+class OperationsProfiler:
+    """
+    Opt-in instrumentation for Operations methods.
+
+    While active, every call to an ``@OperationsMethod`` is counted and timed,
+    and the .NET object lookups made by FLExProject (``Object``,
+    ``ObjectRepository``, ``GetService``) are attributed to the innermost
+    Operations method running at the time. When no profiler is active the
+    methods run exactly as before.
+
+    Figures follow ``pstats``: ``tottime`` excludes time spent in nested
+    Operations calls, ``cumtime`` includes it (recursive calls are counted
+    once).
+
+    Usage::
+
+        from flexlibs2.code.BaseOperations import OperationsProfiler
+
+        with OperationsProfiler() as prof:
+            for entry in project.LexEntry.GetAll():
+                project.LexEntry.GetHeadword(entry)
+
+        prof.print_stats(sort="cumulative", limit=10)
+
+    Note:
+        Only one profiler can be active at a time. Profiling is not
+        thread-aware; profile LCM work from a single thread.
+    """
+
+    _SORT_KEYS = {
+        "calls": lambda item: item[1].ncalls,
+        "ncalls": lambda item: item[1].ncalls,
+        "tottime": lambda item: item[1].tottime,
+        "time": lambda item: item[1].tottime,
+        "cumulative": lambda item: item[1].cumtime,
+        "cumtime": lambda item: item[1].cumtime,
+        "round_trips": lambda item: item[1].round_trips,
+        "name": lambda item: item[0],
+    }
+
+    def __init__(self, timer=time.perf_counter):
+        """
+        Args:
+            timer: Zero-argument clock returning seconds (for testing).
+        """
+        self._timer = timer
+        self.stats = {}
+        # Stack of [name, start, child_time] for calls in progress.
+        self._stack = []
+        self._active_names = {}
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disable()
+        return False
+
+    def enable(self):
+        """Start collecting. Raises FP_ParameterError if another profiler is active."""
+        global _active_profiler
+        if _active_profiler is not None and _active_profiler is not self:
+            raise FP_ParameterError("Another OperationsProfiler is already active")
+        _active_profiler = self
+
+    def disable(self):
+        """Stop collecting (collected stats are kept)."""
+        global _active_profiler
+        if _active_profiler is self:
+            _active_profiler = None
+
+    def reset(self):
+        """Discard all collected stats."""
+        self.stats.clear()
+
+    def _call(self, name, func, args, kwargs):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = _MethodStats()
+        stats.ncalls += 1
+        frame = [name, self._timer(), 0.0]
+        self._stack.append(frame)
+        depth = self._active_names.get(name, 0)
+        self._active_names[name] = depth + 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = self._timer() - frame[1]
+            self._stack.pop()
+            self._active_names[name] = depth
+            stats.tottime += elapsed - frame[2]
+            if depth == 0:
+                stats.cumtime += elapsed
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def _round_trip(self):
+        if self._stack:
+            self.stats[self._stack[-1][0]].round_trips += 1
+
+    def get_stats(self, sort="cumulative"):
+        """
+        Return the collected stats as a sorted list.
+
+        Args:
+            sort: One of "cumulative", "tottime", "calls", "round_trips"
+                or "name".
+
+        Returns:
+            list: ``(method name, _MethodStats)`` tuples, largest first
+            (alphabetical for "name").
+        """
+        key = self._SORT_KEYS.get(sort)
+        if key is None:
+            raise FP_ParameterError(f"Unknown sort key: {sort}")
+        return sorted(self.stats.items(), key=key, reverse=(sort != "name"))
+
+    def print_stats(self, sort="cumulative", limit=None, stream=None):
+        """
+        Print a pstats-style report.
+
+        Args:
+            sort: Sort key, as for get_stats().
+            limit: Print only the first ``limit`` rows.
+            stream: File-like object to write to (default sys.stdout).
+        """
+        stream = stream if stream is not None else sys.stdout
+        rows = self.get_stats(sort)
+        total_calls = sum(stats.ncalls for _, stats in rows)
+        total_time = sum(stats.tottime for _, stats in rows)
+        print(f"         {total_calls} operation calls in {total_time:.3f} seconds",
+              file=stream)
+        print(file=stream)
+        print(f"   Ordered by: {sort}", file=stream)
+        print(file=stream)
+        print("   ncalls  tottime  percall  cumtime  percall  round-trips  method",
+              file=stream)
+        for name, stats in rows[:limit]:
+            print(f"{stats.ncalls:9d} {stats.tottime:8.3f} "
+                  f"{stats.tottime / stats.ncalls:8.3f} {stats.cumtime:8.3f} "
+                  f"{stats.cumtime / stats.ncalls:8.3f} {stats.round_trips:12d}  {name}",
+                  file=stream)
+
+
 class OperationsMethod:
     """
     Descriptor enabling methods to work as both class and instance methods.
@@ -244,14 +533,85 @@ class OperationsMethod:
             def class_method(project, *args, **kwargs):
                 """Automatically instantiate and call the method."""
                 instance = objtype(project)
+                if _active_profiler is not None:
+                    return self.__get__(instance, objtype)(*args, **kwargs)
                 return func(instance, *args, **kwargs)
 
             return class_method
+        elif _active_profiler is not None:
+            # Profiling: time the call and attribute it to Class.Method.
+            bound = func.__get__(obj, objtype)
+            name = f"{type(obj).__name__}.{func.__name__}"
+
+            def profiled_method(*args, **kwargs):
+                profiler = _active_profiler
+                if profiler is None:
+                    return bound(*args, **kwargs)
+                return profiler._call(name, bound, args, kwargs)
+
+            return profiled_method
         else:
             # Called on instance: POSOperations(project).GetAll()
             return func.__get__(obj, objtype)
 
 
+def _increasing_subsequence(values):
+    """
+    Return the set of values on one longest strictly increasing subsequence.
+
+    Used by BaseOperations reordering: items whose current indices form
+    such a subsequence are already in the right relative order and never
+    need to move. O(n log n).
+    """
+    tails = []          # tails[k]: index into values of the smallest tail of a run of length k+1
+    tail_values = []    # values[tails[k]], kept for bisect
+    previous = [None] * len(values)
+    for i, value in enumerate(values):
+        k = bisect.bisect_left(tail_values, value)
+        if k:
+            previous[i] = tails[k - 1]
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[k] = i
+            tail_values[k] = value
+
+    run = set()
+    i = tails[-1] if tails else None
+    while i is not None:
+        run.add(values[i])
+        i = previous[i]
+    return run
+
+
+class _OccupiedSlots:
+    """
+    Fenwick tree over a fixed row of slots, each empty or occupied.
+
+    Used by BaseOperations._ApplyOrder: an item's current position in a
+    sequence is the number of occupied slots before its own, found in
+    O(log n) however far other items have moved.
+    """
+
+    def __init__(self, size):
+        self._tree = [0] * (size + 1)
+
+    def add(self, slot, delta):
+        i = slot + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def before(self, slot):
+        """Number of occupied slots with index < slot."""
+        total = 0
+        while slot:
+            total += self._tree[slot]
+            slot -= slot & -slot
+        return total
+
+
 class BaseOperations:
     """
     Base class for all FLEx operation classes.
@@ -261,7 +621,7 @@ class BaseOperations:
     to specify which OS property to reorder.
 
     All 43 operation classes inherit from this base class, gaining access
-    to 7 reordering methods without code duplication.
+    to 8 reordering methods without code duplication.
 
     Reordering Safety:
         - Reordering is SAFE - preserves all data connections
@@ -369,9 +729,11 @@ class BaseOperations:
         Notes:
             - Returns count even if order unchanged
             - Empty sequence returns 0
-            - Uses safe Clear/Add pattern - preserves all data
+            - Uses MoveTo - preserves all data
             - Sort is stable (equal elements maintain relative order)
             - If key_func raises exception, sort fails
+            - key_func is called once per item; the new order is then
+              applied with the fewest possible moves (see SetOrder)
 
         Linguistic Warning:
             Reordering changes linguistic behavior:
@@ -380,41 +742,95 @@ class BaseOperations:
             - Examples: Order may be pedagogically significant
 
         See Also:
-            MoveToIndex, MoveUp, MoveDown
+            SetOrder, MoveToIndex, MoveUp, MoveDown
         """
         parent = self._GetObject(parent_or_hvo)
         sequence = self._GetSequence(parent)
 
-        # Get all items with their indices
-        count = sequence.Count
+        # Read the sequence once; all further work is on Python lists
+        items = list(sequence)
+        count = len(items)
         if count <= 1:
             return count  # Nothing to sort
 
-        items_with_indices = [(i, sequence[i]) for i in range(count)]
-
-        # Sort based on key function or natural order
+        # Sort current indices based on key function or natural order
         if key_func:
-            items_with_indices.sort(key=lambda x: key_func(x[1]), reverse=reverse)
+            keys = [key_func(item) for item in items]
         else:
-            items_with_indices.sort(key=lambda x: x[1], reverse=reverse)
-
-        # Apply new order using MoveTo
-        # We need to move items from their current position to their target position
-        # Process from end to beginning to avoid index shifting issues
-        for target_index in range(count):
-            # Find where the item that should be at target_index currently is
-            current_index = target_index
-            for j in range(target_index, count):
-                if sequence[j] == items_with_indices[target_index][1]:
-                    current_index = j
-                    break
-
-            # Move it to the target position if not already there
-            if current_index != target_index:
-                sequence.MoveTo(current_index, current_index, sequence, target_index)
+            keys = items
+        order = sorted(range(count), key=keys.__getitem__, reverse=reverse)
+
+        if order != list(range(count)):
+            self._EnsureWriteEnabled()
+            with self._TransactionCM("Sort sequence"):
+                self._ApplyOrder(sequence, order)
 
         return count
 
+    @OperationsMethod
+    def SetOrder(self, parent_or_hvo, new_order):
+        """
+        Put every item of an owning sequence into a given order at once.
+
+        Applies a complete permutation of the sequence with the fewest
+        possible moves: items that are already in the right relative order
+        stay where they are, and every other item is moved exactly once.
+        All moves happen inside one transaction.
+
+        Args:
+            parent_or_hvo: The parent object or HVO containing the sequence.
+            new_order: The sequence's items (objects or HVOs) in the desired
+                order. Must contain every item of the sequence exactly once.
+
+        Returns:
+            int: Number of items that were moved.
+
+        Raises:
+            FP_ReadOnlyError: If the project is not opened with write enabled.
+            FP_NullParameterError: If new_order is None.
+            FP_ParameterError: If new_order is not a permutation of the
+                sequence's items.
+
+        Example:
+            >>> # Apply an order chosen in a drag-and-drop UI
+            >>> senses = list(entry.SensesOS)
+            >>> project.Senses.SetOrder(entry, [senses[2], senses[0], senses[1]])
+            1
+
+        Notes:
+            - Uses MoveTo - preserves all data (GUIDs, references, children)
+            - Reading the sequence and planning the moves costs one pass;
+              only the items that must move cost a .NET call
+            - Already-ordered input returns 0 without writing anything
+
+        See Also:
+            Sort, MoveToIndex
+        """
+        self._ValidateParam(new_order, "new_order")
+
+        parent = self._GetObject(parent_or_hvo)
+        sequence = self._GetSequence(parent)
+
+        index_of = {item.Hvo: i for i, item in enumerate(sequence)}
+        order = []
+        for item in new_order:
+            hvo = item if isinstance(item, int) else getattr(item, "Hvo", None)
+            index = index_of.pop(hvo, None)
+            if index is None:
+                raise FP_ParameterError(
+                    "new_order contains an item that is not in the sequence, or repeats one"
+                )
+            order.append(index)
+        if index_of:
+            raise FP_ParameterError(f"new_order is missing {len(index_of)} item(s) of the sequence")
+
+        if order == sorted(order):
+            return 0
+
+        self._EnsureWriteEnabled()
+        with self._TransactionCM("Reorder sequence"):
+            return self._ApplyOrder(sequence, order)
+
     @OperationsMethod
     def MoveUp(self, parent_or_hvo, item, positions=1):
         """
@@ -1328,6 +1744,72 @@ class BaseOperations:
 
     # ========== HELPER METHODS ==========
 
+    def _ApplyOrder(self, sequence, order):
+        """
+        Rearrange sequence so that item order[i] ends up at index i.
+
+        Args:
+            sequence: The owning sequence to rearrange.
+            order: A permutation of range(sequence.Count), giving for each
+                target position the item's current index.
+
+        Returns:
+            int: Number of MoveTo calls made.
+
+        Notes:
+            MoveTo takes an item out and reinserts it, so the fewest moves
+            is n minus the longest run of items already in increasing
+            order. Those items stay put; each other item is moved, in
+            target order, to just after its target predecessor.
+
+            Every place an item will occupy is known in advance: its
+            original place, and for a moved item the end of the run that
+            follows a kept item (or the front). Those places are laid out
+            as slots in sequence order, and an item's current position is
+            the number of occupied slots before its own (_OccupiedSlots).
+            Each move updates two slots, so planning costs O(log n) per
+            move and only the moves themselves reach .NET.
+        """
+        count = len(order)
+        keep = _increasing_subsequence(order)
+
+        # Slot keys sort in sequence order: (original, 0) for an item in
+        # its original place, (anchor, k) for the k-th item moved to just
+        # after kept item anchor (-1: the front).
+        moved_to = [None] * count
+        previous = (-1, 0)
+        for target, original in enumerate(order):
+            if original in keep:
+                previous = (original, 0)
+            else:
+                previous = (previous[0], previous[1] + 1)
+                moved_to[target] = previous
+        keys = [(i, 0) for i in range(count)] + [key for key in moved_to if key is not None]
+        slot = {key: i for i, key in enumerate(sorted(keys))}
+
+        occupied = _OccupiedSlots(len(slot))
+        for i in range(count):
+            occupied.add(slot[(i, 0)], 1)
+
+        moves = 0
+        for target, original in enumerate(order):
+            if moved_to[target] is None:
+                continue
+            old, new = slot[(original, 0)], slot[moved_to[target]]
+            src = occupied.before(old)
+            occupied.add(old, -1)
+            dest = occupied.before(new)   # index after the item is taken out
+            occupied.add(new, 1)
+            if src == dest:
+                continue
+            if src < dest:
+                # Moving forward - MoveTo counts the destination before removal
+                sequence.MoveTo(src, src, sequence, dest + 1)
+            else:
+                sequence.MoveTo(src, src, sequence, dest)
+            moves += 1
+        return moves
+
     def _GetSequence(self, parent):
         """
         Get the owning sequence from parent object.
@@ -1407,6 +1889,31 @@ class BaseOperations:
             return self.project.Object(obj_or_hvo)
         return obj_or_hvo
 
+    def _RepositoryObjects(self, repository):
+        """
+        Return every object in a repository as a lazy, count-aware sequence.
+
+        Args:
+            repository: The repository interface class, e.g.
+                ``ILexEntryRepository``.
+
+        Returns:
+            EnumerableWrapper: Iterates ``repository.AllInstances()``;
+            ``len()`` reads the repository's ``Count`` instead of enumerating,
+            and indexing/slicing/``in`` stop as soon as they have an answer.
+
+        Example:
+            >>> entries = self._RepositoryObjects(ILexEntryRepository)
+            >>> len(entries)        # repository Count, nothing enumerated
+            12034
+            >>> first = entries[0]  # enumerates one object
+
+        See Also:
+            EnumerableWrapper, FLExProject.ObjectsIn
+        """
+        repo = self.project.ObjectRepository(repository)
+        return EnumerableWrapper(repo.AllInstances(), count=lambda: repo.Count)
+
     def _GetTypedOwner(self, obj):
         """
         Return obj.Owner cast to its concrete LCM interface.
@@ -1705,6 +2212,9 @@ class BaseOperations:
                 named undo entry (the desired Phase 2 behavior). This means an
                 inner method's mutations are not separately undoable in Phase 2
                 - they are absorbed into the enclosing operation's undo task.
+            - Inside ``project.Batch()`` every ``_TransactionCM`` block is a
+              no-op in both phases; the batch's single outer transaction
+              captures all of the writes.
         """
         from .transaction import _NestingAwareTransaction
 
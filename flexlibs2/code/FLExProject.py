@@ -39,6 +39,11 @@ import os
 import clr
 
 from .Shared.string_utils import normalize_ws_handle
+from ._operations_registry import _operations_property
+from ._object_cache import _ObjectCache
+# Module, not its _active_profiler global: that is rebound when a profiler
+# starts, and the round-trip checks below must see the current value.
+from . import BaseOperations as _base_operations
 
 clr.AddReference("System")
 import System
@@ -232,6 +237,18 @@ class FLExProject(object):
         # nested Phase 2 UndoableOperation tasks (BeginUndoTask/EndUndoTask
         # cannot nest); only the outermost block opens an undo task.
         self._transaction_depth = 0
+        # Nesting depth of active Batch() blocks. While > 0, nested
+        # _TransactionCM blocks are no-ops (the batch owns the transaction).
+        self._batch_depth = 0
+        # Hvo/Guid -> object cache for Object(). Weakly referenced and
+        # bounded; see Object() for invalidation.
+        self._object_cache = _ObjectCache()
+        # Concordance index built by Segments.BuildConcordance(); None
+        # until built.
+        self._concordance = None
+        # Occurrence index built by Wordforms.BuildOccurrenceIndex(); None
+        # until built.
+        self._occurrences = None
 
         if self.writeEnabled and not self._undoable:
             # Phase 1 behavior: whole session is non-undoable (rollback transactions only)
@@ -251,6 +268,9 @@ class FLExProject(object):
         Save any pending changes and dispose of the LCM object.
         """
         if hasattr(self, "project"):
+            self._object_cache.clear()
+            self._concordance = None
+            self._occurrences = None
             if self.writeEnabled:
                 if not self._undoable:
                     # Phase 1: This must be called to mirror the call to BeginNonUndoableTask().
@@ -310,6 +330,8 @@ class FLExProject(object):
             >>> factory = project.GetService(IPhPhonemeFactory)
             >>> phoneme = factory.Create()
         """
+        if _base_operations._active_profiler is not None:
+            _base_operations._active_profiler._round_trip()
         return self.project.ServiceLocator.GetService(interface_type)
 
     def GetFactory(self, interface_type):
@@ -467,6 +489,53 @@ class FLExProject(object):
         mark_fn, rollback_fn = self._GetTransactionAPI()
         return _FLExTransaction(self, label, mark_fn, rollback_fn)
 
+    def Batch(self, label="batch", save=False):
+        """
+        Return a context manager that runs many operations as one transaction.
+
+        Every Operations method that writes more than one property wraps its
+        work in its own transaction. Inside a batch those per-call
+        transactions are skipped and the whole block is a single transaction
+        (Phase 1) or a single undo task (Phase 2), which makes bulk imports
+        much cheaper.
+
+        Args:
+            label (str): Human-readable description, used for logging and
+                as the FLEx undo menu entry in Phase 2. Default: "batch"
+            save (bool): If True, call SaveChanges() once when the outermost
+                batch completes without an exception. Default: False
+
+        Returns:
+            _FLExBatch: Context manager
+
+        Raises:
+            FP_ReadOnlyError: If the project is not write-enabled (raised on
+                entering the block).
+
+        Example::
+
+            project = FLExProject()
+            project.OpenProject("MyProject", writeEnabled=True)
+
+            with project.Batch("Import", save=True):
+                for word, gloss in rows:
+                    entry = project.LexEntry.Create(word, "stem",
+                                                    create_blank_sense=False)
+                    project.Senses.Create(entry, gloss)
+
+        Note:
+            - If an exception escapes the block, everything done inside it is
+              rolled back (Phase 1). An exception caught inside the block
+              does not roll back the failed call's partial writes.
+            - Batches nest: an inner batch joins the outer one.
+
+        See Also:
+            Transaction, UndoableOperation, SaveChanges
+        """
+        from .transaction import _FLExBatch
+
+        return _FLExBatch(self, label, save)
+
     def _GetTransactionAPI(self):
         """
         Internal: Discover the available LCM rollback API.
@@ -678,6 +747,9 @@ class FLExProject(object):
             undo_fn = getattr(undo_stack, "Undo", None)
             if undo_fn is not None:
                 undo_fn()
+                # Edits the indexes tracked may have been reversed.
+                self._concordance = None
+                self._occurrences = None
                 logging.getLogger(__name__).debug("Undo() called successfully")
                 return True
             else:
@@ -724,6 +796,9 @@ class FLExProject(object):
             redo_fn = getattr(undo_stack, "Redo", None)
             if redo_fn is not None:
                 redo_fn()
+                # Edits the indexes tracked may have been reversed.
+                self._concordance = None
+                self._occurrences = None
                 logging.getLogger(__name__).debug("Redo() called successfully")
                 return True
             else:
@@ -735,7 +810,53 @@ class FLExProject(object):
 
     # --- Advanced Operations ---
 
-    @property
+    def warm(self, names=None):
+        """
+        Pre-instantiate Operations classes so first use has no import cost.
+
+        The Operations properties (``POS``, ``LexEntry``, ``Texts``, ...) are
+        created lazily on first access and cached on the project. Long-running
+        services can call ``warm()`` once after opening the project to pay
+        all import and construction costs up front.
+
+        Args:
+            names: Iterable of Operations property names to instantiate,
+                e.g. ``["LexEntry", "Senses", "POS"]``. If None, every
+                registered Operations property is instantiated.
+
+        Returns:
+            list: The names that were instantiated by this call (already
+            cached Operations are skipped).
+
+        Raises:
+            FP_ParameterError: If a name is not a registered Operations
+                property.
+
+        Example:
+            >>> project = FLExProject()
+            >>> project.OpenProject("MyProject")
+            >>> project.warm(["LexEntry", "Senses", "WfiAnalyses"])
+            ['LexEntry', 'Senses', 'WfiAnalyses']
+        """
+        registry = type(self)._operations_registry
+        if names is None:
+            names = list(registry)
+        else:
+            names = list(names)
+            unknown = [name for name in names if name not in registry]
+            if unknown:
+                raise FP_ParameterError(
+                    f"Not Operations properties: {', '.join(unknown)}"
+                )
+
+        created = []
+        for name in names:
+            if name not in self.__dict__:
+                getattr(self, name)
+                created.append(name)
+        return created
+
+    @_operations_property("Grammar.POSOperations", "POSOperations")
     def POS(self):
         """
         Access to Parts of Speech operations.
@@ -756,13 +877,8 @@ class FLExProject(object):
             >>> if verb:
             ...     project.POS.SetAbbreviation(verb, "V")
         """
-        if "_pos_ops" not in self.__dict__:
-            from .Grammar.POSOperations import POSOperations
 
-            self._pos_ops = POSOperations(self)
-        return self._pos_ops
-
-    @property
+    @_operations_property("Lexicon.LexEntryOperations", "LexEntryOperations")
     def LexEntry(self):
         """
         Access to Lexical Entry operations.
@@ -783,13 +899,8 @@ class FLExProject(object):
             >>> # Set citation form
             >>> project.LexEntry.SetCitationForm(entry, "run")
         """
-        if "_lexentry_ops" not in self.__dict__:
-            from .Lexicon.LexEntryOperations import LexEntryOperations
-
-            self._lexentry_ops = LexEntryOperations(self)
-        return self._lexentry_ops
 
-    @property
+    @_operations_property("TextsWords.TextOperations", "TextOperations")
     def Texts(self):
         """
         Access to Text operations.
@@ -808,13 +919,8 @@ class FLExProject(object):
             >>> # Update text name
             >>> project.Texts.SetName(text, "Genesis Chapter 1")
         """
-        if "_text_ops" not in self.__dict__:
-            from .TextsWords.TextOperations import TextOperations
-
-            self._text_ops = TextOperations(self)
-        return self._text_ops
 
-    @property
+    @_operations_property("TextsWords.WordformOperations", "WordformOperations")
     def Wordforms(self):
         """
         Access to wordform operations (Work Stream 3 - MOST ACTIVE: 727+ commits in 2024).
@@ -835,13 +941,8 @@ class FLExProject(object):
             >>> if wf.AnalysesOC.Count > 0:
             ...     project.Wordforms.SetApprovedAnalysis(wf, wf.AnalysesOC[0])
         """
-        if "_wordform_ops" not in self.__dict__:
-            from .TextsWords.WordformOperations import WordformOperations as WfiWordformOperations
-
-            self._wordform_ops = WfiWordformOperations(self)
-        return self._wordform_ops
 
-    @property
+    @_operations_property("TextsWords.WfiAnalysisOperations", "WfiAnalysisOperations")
     def WfiAnalyses(self):
         """
         Access to wordform analysis operations (Work Stream 3).
@@ -864,13 +965,8 @@ class FLExProject(object):
             >>> # Get morph bundles
             >>> bundles = project.WfiAnalyses.GetMorphBundles(analysis)
         """
-        if "_wfianalysis_ops" not in self.__dict__:
-            from .TextsWords.WfiAnalysisOperations import WfiAnalysisOperations
 
-            self._wfianalysis_ops = WfiAnalysisOperations(self)
-        return self._wfianalysis_ops
-
-    @property
+    @_operations_property("TextsWords.ParagraphOperations", "ParagraphOperations")
     def Paragraphs(self):
         """
         Access to paragraph operations.
@@ -892,13 +988,8 @@ class FLExProject(object):
             >>> # Get style
             >>> style = project.Paragraphs.GetStyleName(para)
         """
-        if "_paragraph_ops" not in self.__dict__:
-            from .TextsWords.ParagraphOperations import ParagraphOperations
 
-            self._paragraph_ops = ParagraphOperations(self)
-        return self._paragraph_ops
-
-    @property
+    @_operations_property("TextsWords.SegmentOperations", "SegmentOperations")
     def Segments(self):
         """
         Access to segment operations.
@@ -919,13 +1010,8 @@ class FLExProject(object):
             >>> project.Segments.SetFreeTranslation(segment, "In the beginning...")
             >>> project.Segments.SetLiteralTranslation(segment, "In-the beginning...")
         """
-        if "_segment_ops" not in self.__dict__:
-            from .TextsWords.SegmentOperations import SegmentOperations
-
-            self._segment_ops = SegmentOperations(self)
-        return self._segment_ops
 
-    @property
+    @_operations_property("Grammar.PhonemeOperations", "PhonemeOperations")
     def Phonemes(self):
         """
         Access to phoneme operations.
@@ -951,13 +1037,8 @@ class FLExProject(object):
             >>> if project.Phonemes.IsConsonant(phoneme):
             ...     print("Consonant phoneme")
         """
-        if "_phoneme_ops" not in self.__dict__:
-            from .Grammar.PhonemeOperations import PhonemeOperations
-
-            self._phoneme_ops = PhonemeOperations(self)
-        return self._phoneme_ops
 
-    @property
+    @_operations_property("Grammar.NaturalClassOperations", "NaturalClassOperations")
     def NaturalClasses(self):
         """
         Access to natural class operations.
@@ -978,13 +1059,8 @@ class FLExProject(object):
             >>> phoneme_b = project.Phonemes.Find("/b/")
             >>> project.NaturalClasses.AddPhoneme(nc, phoneme_b)
         """
-        if "_naturalclass_ops" not in self.__dict__:
-            from .Grammar.NaturalClassOperations import NaturalClassOperations
-
-            self._naturalclass_ops = NaturalClassOperations(self)
-        return self._naturalclass_ops
 
-    @property
+    @_operations_property("Grammar.EnvironmentOperations", "EnvironmentOperations")
     def Environments(self):
         """
         Access to phonological environment operations.
@@ -1003,13 +1079,8 @@ class FLExProject(object):
             >>> # Create a new environment
             >>> env = project.Environments.Create("Between vowels", "V_V")
         """
-        if "_environment_ops" not in self.__dict__:
-            from .Grammar.EnvironmentOperations import EnvironmentOperations
 
-            self._environment_ops = EnvironmentOperations(self)
-        return self._environment_ops
-
-    @property
+    @_operations_property("Lexicon.AllomorphOperations", "AllomorphOperations")
     def Allomorphs(self):
         """
         Access to allomorph operations.
@@ -1028,13 +1099,8 @@ class FLExProject(object):
             >>> # Create a new allomorph
             >>> allo = project.Allomorphs.Create(entry, "-ed")
         """
-        if "_allomorph_ops" not in self.__dict__:
-            from .Lexicon.AllomorphOperations import AllomorphOperations
 
-            self._allomorph_ops = AllomorphOperations(self)
-        return self._allomorph_ops
-
-    @property
+    @_operations_property("Grammar.MorphRuleOperations", "MorphRuleOperations")
     def MorphRules(self):
         """
         Access to morphological rule operations.
@@ -1052,13 +1118,8 @@ class FLExProject(object):
             >>> # Create a compound rule
             >>> rule = project.MorphRules.CreateCompoundRule("Noun-Noun Compound")
         """
-        if "_morphrule_ops" not in self.__dict__:
-            from .Grammar.MorphRuleOperations import MorphRuleOperations
-
-            self._morphrule_ops = MorphRuleOperations(self)
-        return self._morphrule_ops
 
-    @property
+    @_operations_property("Grammar.InflectionFeatureOperations", "InflectionFeatureOperations")
     def InflectionFeatures(self):
         """
         Access to inflection feature operations.
@@ -1078,11 +1139,6 @@ class FLExProject(object):
             ...     name = project.InflectionFeatures.GetFeatureName(feat)
             ...     print(f"Feature: {name}")
         """
-        if "_inflectionfeature_ops" not in self.__dict__:
-            from .Grammar.InflectionFeatureOperations import InflectionFeatureOperations
-
-            self._inflectionfeature_ops = InflectionFeatureOperations(self)
-        return self._inflectionfeature_ops
 
     @property
     def Features(self):
@@ -1114,7 +1170,7 @@ class FLExProject(object):
         """
         return self.InflectionFeatures
 
-    @property
+    @_operations_property("Grammar.GramCatOperations", "GramCatOperations")
     def GramCat(self):
         """
         Access to grammatical category operations.
@@ -1132,13 +1188,8 @@ class FLExProject(object):
             >>> # Create a new category
             >>> gc = project.GramCat.Create("Transitive")
         """
-        if "_gramcat_ops" not in self.__dict__:
-            from .Grammar.GramCatOperations import GramCatOperations
-
-            self._gramcat_ops = GramCatOperations(self)
-        return self._gramcat_ops
 
-    @property
+    @_operations_property("Grammar.PhonologicalRuleOperations", "PhonologicalRuleOperations")
     def PhonRules(self):
         """
         Access to phonological rule operations.
@@ -1164,13 +1215,8 @@ class FLExProject(object):
             ...     right_context=[NC(vowels)],
             ... )
         """
-        if "_phonrule_ops" not in self.__dict__:
-            from .Grammar.PhonologicalRuleOperations import PhonologicalRuleOperations
 
-            self._phonrule_ops = PhonologicalRuleOperations(self)
-        return self._phonrule_ops
-
-    @property
+    @_operations_property("Grammar.PhonFeatureOperations", "PhonFeatureOperations")
     def PhonFeatures(self):
         """
         Access to phonological feature operations.
@@ -1192,13 +1238,8 @@ class FLExProject(object):
             >>> for v in project.PhonFeatures.GetValues(cons):
             ...     print(project.PhonFeatures.GetAbbreviation(v))
         """
-        if "_phonfeature_ops" not in self.__dict__:
-            from .Grammar.PhonFeatureOperations import PhonFeatureOperations
 
-            self._phonfeature_ops = PhonFeatureOperations(self)
-        return self._phonfeature_ops
-
-    @property
+    @_operations_property("Grammar.StratumOperations", "StratumOperations")
     def Strata(self):
         """
         Access to stratum operations.
@@ -1223,13 +1264,8 @@ class FLExProject(object):
             >>> # Round-trip syncable properties
             >>> props = project.Strata.GetSyncableProperties(new_stratum)
         """
-        if "_stratum_ops" not in self.__dict__:
-            from .Grammar.StratumOperations import StratumOperations
-
-            self._stratum_ops = StratumOperations(self)
-        return self._stratum_ops
 
-    @property
+    @_operations_property("Lexicon.LexSenseOperations", "LexSenseOperations")
     def Senses(self):
         """
         Access to lexical sense operations.
@@ -1254,13 +1290,8 @@ class FLExProject(object):
             >>> if domains:
             ...     project.Senses.AddSemanticDomain(sense, domains[0])
         """
-        if "_sense_ops" not in self.__dict__:
-            from .Lexicon.LexSenseOperations import LexSenseOperations
-
-            self._sense_ops = LexSenseOperations(self)
-        return self._sense_ops
 
-    @property
+    @_operations_property("Lexicon.MSAOperations", "MSAOperations")
     def MSA(self):
         """
         Access to morphosyntactic-analysis (MSA) creation operations.
@@ -1286,13 +1317,8 @@ class FLExProject(object):
             >>> v_pos = project.GramCat.Find("Verb")
             >>> project.MSA.CreateDerivAff(sense, from_pos=n_pos, to_pos=v_pos)
         """
-        if "_msa_ops" not in self.__dict__:
-            from .Lexicon.MSAOperations import MSAOperations
-
-            self._msa_ops = MSAOperations(self)
-        return self._msa_ops
 
-    @property
+    @_operations_property("Lexicon.ExampleOperations", "ExampleOperations")
     def Examples(self):
         """
         Access to example sentence operations.
@@ -1316,13 +1342,8 @@ class FLExProject(object):
             >>> project.Examples.SetTranslation(example, "Le chat a dormi.")
             >>> project.Examples.SetReference(example, "Corpus A:123")
         """
-        if "_example_ops" not in self.__dict__:
-            from .Lexicon.ExampleOperations import ExampleOperations
 
-            self._example_ops = ExampleOperations(self)
-        return self._example_ops
-
-    @property
+    @_operations_property("Lexicon.LexReferenceOperations", "LexReferenceOperations")
     def LexReferences(self):
         """
         Access to lexical reference and relation operations.
@@ -1354,13 +1375,8 @@ class FLExProject(object):
             ...     targets = project.LexReferences.GetTargets(ref)
             ...     print(f"Related to {len(targets)} items")
         """
-        if "_lexref_ops" not in self.__dict__:
-            from .Lexicon.LexReferenceOperations import LexReferenceOperations
 
-            self._lexref_ops = LexReferenceOperations(self)
-        return self._lexref_ops
-
-    @property
+    @_operations_property("Reversal.ReversalIndexOperations", "ReversalIndexOperations")
     def ReversalIndexes(self):
         """
         Access to reversal index operations (Work Stream 3).
@@ -1381,13 +1397,8 @@ class FLExProject(object):
             ...     form = project.ReversalEntries.GetForm(entry)
             ...     print(f"Reversal: {form}")
         """
-        if "_reversalindex_ops" not in self.__dict__:
-            from .Reversal.ReversalIndexOperations import ReversalIndexOperations
-
-            self._reversalindex_ops = ReversalIndexOperations(self)
-        return self._reversalindex_ops
 
-    @property
+    @_operations_property("Reversal.ReversalIndexEntryOperations", "ReversalIndexEntryOperations")
     def ReversalEntries(self):
         """
         Access to reversal index entry operations (Work Stream 3).
@@ -1408,13 +1419,8 @@ class FLExProject(object):
             ...     sense = lex_entry.SensesOS[0]
             ...     project.ReversalEntries.AddSense(entry, sense)
         """
-        if "_reversalentry_ops" not in self.__dict__:
-            from .Reversal.ReversalIndexEntryOperations import ReversalIndexEntryOperations
-
-            self._reversalentry_ops = ReversalIndexEntryOperations(self)
-        return self._reversalentry_ops
 
-    @property
+    @_operations_property("Lexicon.SemanticDomainOperations", "SemanticDomainOperations")
     def SemanticDomains(self):
         """
         Access to semantic domain operations.
@@ -1439,13 +1445,8 @@ class FLExProject(object):
             >>> # Create a custom domain
             >>> custom = project.SemanticDomains.Create("Technology", "900")
         """
-        if "_semantic_domain_ops" not in self.__dict__:
-            from .Lexicon.SemanticDomainOperations import SemanticDomainOperations
-
-            self._semantic_domain_ops = SemanticDomainOperations(self)
-        return self._semantic_domain_ops
 
-    @property
+    @_operations_property("Lexicon.PronunciationOperations", "PronunciationOperations")
     def Pronunciations(self):
         """
         Access to pronunciation operations.
@@ -1469,13 +1470,8 @@ class FLExProject(object):
             >>> media = project.Pronunciations.GetMediaFiles(pron)
             >>> print(f"Audio files: {len(media)}")
         """
-        if "_pronunciation_ops" not in self.__dict__:
-            from .Lexicon.PronunciationOperations import PronunciationOperations
 
-            self._pronunciation_ops = PronunciationOperations(self)
-        return self._pronunciation_ops
-
-    @property
+    @_operations_property("Lexicon.VariantOperations", "VariantOperations")
     def Variants(self):
         """
         Access to variant form operations.
@@ -1507,13 +1503,8 @@ class FLExProject(object):
             >>> variant_ref = project.Variants.Create(went_entry, "went", irregular_type)
             >>> project.Variants.AddComponentLexeme(variant_ref, go_entry)
         """
-        if "_variant_ops" not in self.__dict__:
-            from .Lexicon.VariantOperations import VariantOperations
 
-            self._variant_ops = VariantOperations(self)
-        return self._variant_ops
-
-    @property
+    @_operations_property("Lexicon.EtymologyOperations", "EtymologyOperations")
     def Etymology(self):
         """
         Access to etymology operations.
@@ -1537,13 +1528,8 @@ class FLExProject(object):
             ...     gloss = project.Etymology.GetGloss(etym)
             ...     print(f"{source}: {form} ({gloss})")
         """
-        if "_etymology_ops" not in self.__dict__:
-            from .Lexicon.EtymologyOperations import EtymologyOperations
-
-            self._etymology_ops = EtymologyOperations(self)
-        return self._etymology_ops
 
-    @property
+    @_operations_property("Lists.PossibilityListOperations", "PossibilityListOperations")
     def PossibilityLists(self):
         """
         Access to generic possibility list operations.
@@ -1580,13 +1566,8 @@ class FLExProject(object):
             ...     # Move items in hierarchy
             ...     project.PossibilityLists.MoveItem(folktale, None)  # Move to top
         """
-        if "_possibilitylist_ops" not in self.__dict__:
-            from .Lists.PossibilityListOperations import PossibilityListOperations
-
-            self._possibilitylist_ops = PossibilityListOperations(self)
-        return self._possibilitylist_ops
 
-    @property
+    @_operations_property("Lists.LocalizedListsOperations", "LocalizedListsOperations")
     def LocalizedLists(self):
         """
         Access to localized possibility-list translation-pack imports.
@@ -1618,13 +1599,8 @@ class FLExProject(object):
             >>> for code, reason in result.skipped:
             ...     print(f"  skipped {code}: {reason}")
         """
-        if "_localizedlists_ops" not in self.__dict__:
-            from .Lists.LocalizedListsOperations import LocalizedListsOperations
-
-            self._localizedlists_ops = LocalizedListsOperations(self)
-        return self._localizedlists_ops
 
-    @property
+    @_operations_property("System.CustomFieldOperations", "CustomFieldOperations")
     def CustomFields(self):
         """
         Access to custom field operations.
@@ -1652,13 +1628,8 @@ class FLExProject(object):
             >>> regions = project.CustomFields.GetListValues(sense, "Regions")
             >>> project.CustomFields.AddListValue(sense, "Regions", "North")
         """
-        if "_customfield_ops" not in self.__dict__:
-            from .System.CustomFieldOperations import CustomFieldOperations
 
-            self._customfield_ops = CustomFieldOperations(self)
-        return self._customfield_ops
-
-    @property
+    @_operations_property("System.WritingSystemOperations", "WritingSystemOperations")
     def WritingSystems(self):
         """
         Access to writing system operations.
@@ -1682,13 +1653,8 @@ class FLExProject(object):
             >>> if project.WritingSystems.Exists("ar"):
             ...     project.WritingSystems.SetRightToLeft("ar", True)
         """
-        if "_writingsystem_ops" not in self.__dict__:
-            from .System.WritingSystemOperations import WritingSystemOperations
 
-            self._writingsystem_ops = WritingSystemOperations(self)
-        return self._writingsystem_ops
-
-    @property
+    @_operations_property("TextsWords.WfiGlossOperations", "WfiGlossOperations")
     def WfiGlosses(self):
         """
         Access to wordform gloss operations (Work Stream 3).
@@ -1709,13 +1675,8 @@ class FLExProject(object):
             ...         form = project.WfiGlosses.GetForm(g, "en")
             ...         print(f"Gloss: {form}")
         """
-        if "_wfigloss_ops" not in self.__dict__:
-            from .TextsWords.WfiGlossOperations import WfiGlossOperations
-
-            self._wfigloss_ops = WfiGlossOperations(self)
-        return self._wfigloss_ops
 
-    @property
+    @_operations_property("TextsWords.WfiMorphBundleOperations", "WfiMorphBundleOperations")
     def WfiMorphBundles(self):
         """
         Access to wordform morpheme bundle operations (Work Stream 3).
@@ -1737,13 +1698,8 @@ class FLExProject(object):
             >>> # Set morpheme type
             >>> project.WfiMorphBundles.SetMorphemeType(stem, "stem")
         """
-        if "_wfimorphbundle_ops" not in self.__dict__:
-            from .TextsWords.WfiMorphBundleOperations import WfiMorphBundleOperations
-
-            self._wfimorphbundle_ops = WfiMorphBundleOperations(self)
-        return self._wfimorphbundle_ops
 
-    @property
+    @_operations_property("Shared.MediaOperations", "MediaOperations")
     def Media(self):
         """
         Access to media file operations.
@@ -1767,13 +1723,8 @@ class FLExProject(object):
             >>> orphans = project.Media.GetOrphanedMedia()
             >>> print(f"Found {len(orphans)} orphaned files")
         """
-        if "_media_ops" not in self.__dict__:
-            from .Shared.MediaOperations import MediaOperations
-
-            self._media_ops = MediaOperations(self)
-        return self._media_ops
 
-    @property
+    @_operations_property("Notebook.NoteOperations", "NoteOperations")
     def Notes(self):
         """
         Access to note and annotation operations.
@@ -1795,13 +1746,8 @@ class FLExProject(object):
             ...     replies = project.Notes.GetReplies(n)
             ...     print(f"Note: {content} ({len(replies)} replies)")
         """
-        if "_note_ops" not in self.__dict__:
-            from .Notebook.NoteOperations import NoteOperations
 
-            self._note_ops = NoteOperations(self)
-        return self._note_ops
-
-    @property
+    @_operations_property("Shared.FilterOperations", "FilterOperations")
     def Filters(self):
         """
         Access to filter and query operations.
@@ -1827,13 +1773,8 @@ class FLExProject(object):
             >>> # Export filter
             >>> json_str = project.Filters.ExportFilter(filter_obj)
         """
-        if "_filter_ops" not in self.__dict__:
-            from .Shared.FilterOperations import FilterOperations
 
-            self._filter_ops = FilterOperations(self)
-        return self._filter_ops
-
-    @property
+    @_operations_property("TextsWords.DiscourseOperations", "DiscourseOperations")
     def Discourse(self):
         """
         Access to discourse chart operations.
@@ -1856,13 +1797,8 @@ class FLExProject(object):
             ...     rows = project.Discourse.GetRows(c)
             ...     print(f"Chart: {name} ({len(rows)} rows)")
         """
-        if "_discourse_ops" not in self.__dict__:
-            from .TextsWords.DiscourseOperations import DiscourseOperations
-
-            self._discourse_ops = DiscourseOperations(self)
-        return self._discourse_ops
 
-    @property
+    @_operations_property("Notebook.PersonOperations", "PersonOperations")
     def Person(self):
         """
         Access to person operations for managing consultants, speakers, and researchers.
@@ -1889,13 +1825,8 @@ class FLExProject(object):
             ...     email = project.Person.GetEmail(person)
             ...     print(f"{name}: {email}")
         """
-        if "_person_ops" not in self.__dict__:
-            from .Notebook.PersonOperations import PersonOperations
-
-            self._person_ops = PersonOperations(self)
-        return self._person_ops
 
-    @property
+    @_operations_property("Notebook.LocationOperations", "LocationOperations")
     def Location(self):
         """
         Access to location operations for managing geographic places.
@@ -1920,13 +1851,8 @@ class FLExProject(object):
             ...     coords = project.Location.GetCoordinates(loc)
             ...     print(f"{name}: {coords}")
         """
-        if "_location_ops" not in self.__dict__:
-            from .Notebook.LocationOperations import LocationOperations
-
-            self._location_ops = LocationOperations(self)
-        return self._location_ops
 
-    @property
+    @_operations_property("Notebook.AnthropologyOperations", "AnthropologyOperations")
     def Anthropology(self):
         """
         Access to anthropology operations for managing cultural/ethnographic data.
@@ -1956,13 +1882,8 @@ class FLExProject(object):
             ...     code = project.Anthropology.GetAnthroCode(item)
             ...     print(f"{code}: {name}")
         """
-        if "_anthropology_ops" not in self.__dict__:
-            from .Notebook.AnthropologyOperations import AnthropologyOperations
 
-            self._anthropology_ops = AnthropologyOperations(self)
-        return self._anthropology_ops
-
-    @property
+    @_operations_property("System.ProjectSettingsOperations", "ProjectSettingsOperations")
     def ProjectSettings(self):
         """
         Access to project settings operations.
@@ -1983,13 +1904,8 @@ class FLExProject(object):
             >>> project.ProjectSettings.SetDefaultFont("en", "Charis SIL")
             >>> project.ProjectSettings.SetDefaultFontSize("en", 14)
         """
-        if "_projectsettings_ops" not in self.__dict__:
-            from .System.ProjectSettingsOperations import ProjectSettingsOperations
 
-            self._projectsettings_ops = ProjectSettingsOperations(self)
-        return self._projectsettings_ops
-
-    @property
+    @_operations_property("Lists.PublicationOperations", "PublicationOperations")
     def Publications(self):
         """
         Access to publication operations.
@@ -2010,13 +1926,8 @@ class FLExProject(object):
             ...     is_default = project.Publications.GetIsDefault(p)
             ...     print(f"{name} (default: {is_default})")
         """
-        if "_publication_ops" not in self.__dict__:
-            from .Lists.PublicationOperations import PublicationOperations
-
-            self._publication_ops = PublicationOperations(self)
-        return self._publication_ops
 
-    @property
+    @_operations_property("Lists.AgentOperations", "AgentOperations")
     def Agents(self):
         """
         Access to agent operations.
@@ -2041,13 +1952,8 @@ class FLExProject(object):
             ...         version = project.Agents.GetVersion(a)
             ...         print(f"Parser: {name} v{version}")
         """
-        if "_agent_ops" not in self.__dict__:
-            from .Lists.AgentOperations import AgentOperations
-
-            self._agent_ops = AgentOperations(self)
-        return self._agent_ops
 
-    @property
+    @_operations_property("Lists.ConfidenceOperations", "ConfidenceOperations")
     def Confidence(self):
         """
         Access to confidence level operations.
@@ -2067,13 +1973,8 @@ class FLExProject(object):
             >>> project.Confidence.SetDescription(verified,
             ...     "Confirmed by native speaker", "en")
         """
-        if "_confidence_ops" not in self.__dict__:
-            from .Lists.ConfidenceOperations import ConfidenceOperations
-
-            self._confidence_ops = ConfidenceOperations(self)
-        return self._confidence_ops
 
-    @property
+    @_operations_property("Lists.OverlayOperations", "OverlayOperations")
     def Overlays(self):
         """
         Access to discourse overlay operations.
@@ -2095,13 +1996,8 @@ class FLExProject(object):
             ...     name = project.Overlays.GetName(o)
             ...     print(f"Overlay: {name}")
         """
-        if "_overlay_ops" not in self.__dict__:
-            from .Lists.OverlayOperations import OverlayOperations
 
-            self._overlay_ops = OverlayOperations(self)
-        return self._overlay_ops
-
-    @property
+    @_operations_property("Lists.TranslationTypeOperations", "TranslationTypeOperations")
     def TranslationTypes(self):
         """
         Access to translation type operations.
@@ -2123,13 +2019,8 @@ class FLExProject(object):
             ...     abbr = project.TranslationTypes.GetAbbreviation(t)
             ...     print(f"{name} ({abbr})")
         """
-        if "_translationtype_ops" not in self.__dict__:
-            from .Lists.TranslationTypeOperations import TranslationTypeOperations
 
-            self._translationtype_ops = TranslationTypeOperations(self)
-        return self._translationtype_ops
-
-    @property
+    @_operations_property("System.AnnotationDefOperations", "AnnotationDefOperations")
     def AnnotationDefs(self):
         """
         Access to annotation definition operations.
@@ -2149,13 +2040,8 @@ class FLExProject(object):
             >>> note_type = project.AnnotationDefs.Create("Field Note", "en")
             >>> project.AnnotationDefs.SetUserCanCreate(note_type, True)
         """
-        if "_annotationdef_ops" not in self.__dict__:
-            from .System.AnnotationDefOperations import AnnotationDefOperations
-
-            self._annotationdef_ops = AnnotationDefOperations(self)
-        return self._annotationdef_ops
 
-    @property
+    @_operations_property("System.CheckOperations", "CheckOperations")
     def Checks(self):
         """
         Access to consistency check operations.
@@ -2180,13 +2066,8 @@ class FLExProject(object):
             ...     status = project.Checks.GetCheckStatus(c)
             ...     print(f"{name}: {status}")
         """
-        if "_check_ops" not in self.__dict__:
-            from .System.CheckOperations import CheckOperations
-
-            self._check_ops = CheckOperations(self)
-        return self._check_ops
 
-    @property
+    @_operations_property("Notebook.DataNotebookOperations", "DataNotebookOperations")
     def DataNotebook(self):
         """
         Access to data notebook operations for research notes and observations.
@@ -2215,13 +2096,8 @@ class FLExProject(object):
             ...     date = project.DataNotebook.GetDateOfEvent(rec)
             ...     print(f"{title} ({date})")
         """
-        if "_datanotebook_ops" not in self.__dict__:
-            from .Notebook.DataNotebookOperations import DataNotebookOperations
-
-            self._datanotebook_ops = DataNotebookOperations(self)
-        return self._datanotebook_ops
 
-    @property
+    @_operations_property("Discourse.ConstChartOperations", "ConstChartOperations")
     def ConstCharts(self):
         """
         Access to constituent chart operations for discourse analysis.
@@ -2242,13 +2118,8 @@ class FLExProject(object):
             ...     rows = project.ConstCharts.GetRows(chart)
             ...     print(f"Chart: {name} ({len(rows)} rows)")
         """
-        if "_constchart_ops" not in self.__dict__:
-            from .Discourse.ConstChartOperations import ConstChartOperations
 
-            self._constchart_ops = ConstChartOperations(self)
-        return self._constchart_ops
-
-    @property
+    @_operations_property("Discourse.ConstChartRowOperations", "ConstChartRowOperations")
     def ConstChartRows(self):
         """
         Access to constituent chart row operations for discourse analysis.
@@ -2271,13 +2142,8 @@ class FLExProject(object):
             ...     label = project.ConstChartRows.GetLabel(row)
             ...     print(f"Row: {label}")
         """
-        if "_constchartrow_ops" not in self.__dict__:
-            from .Discourse.ConstChartRowOperations import ConstChartRowOperations
 
-            self._constchartrow_ops = ConstChartRowOperations(self)
-        return self._constchartrow_ops
-
-    @property
+    @_operations_property("Discourse.ConstChartWordGroupOperations", "ConstChartWordGroupOperations")
     def ConstChartWordGroups(self):
         """
         Access to word group operations for constituent chart rows.
@@ -2300,13 +2166,8 @@ class FLExProject(object):
             ...     begin = project.ConstChartWordGroups.GetBeginSegment(wg)
             ...     print(f"Word group starts at segment {begin.Hvo}")
         """
-        if "_constchartwordgroup_ops" not in self.__dict__:
-            from .Discourse.ConstChartWordGroupOperations import ConstChartWordGroupOperations
-
-            self._constchartwordgroup_ops = ConstChartWordGroupOperations(self)
-        return self._constchartwordgroup_ops
 
-    @property
+    @_operations_property("Discourse.ConstChartMovedTextOperations", "ConstChartMovedTextOperations")
     def ConstChartMovedText(self):
         """
         Access to moved text marker operations for constituent charts.
@@ -2330,13 +2191,8 @@ class FLExProject(object):
             ...     wg = project.ConstChartMovedText.GetWordGroup(marker)
             ...     print(f"Moved text in word group {wg.Hvo}")
         """
-        if "_constchartmovedtext_ops" not in self.__dict__:
-            from .Discourse.ConstChartMovedTextOperations import ConstChartMovedTextOperations
-
-            self._constchartmovedtext_ops = ConstChartMovedTextOperations(self)
-        return self._constchartmovedtext_ops
 
-    @property
+    @_operations_property("Discourse.ConstChartMarkerOperations", "ConstChartMarkerOperations")
     def ConstChartMarkers(self):
         """
         Access to project-wide chart-marker (CmPossibility) operations.
@@ -2348,14 +2204,8 @@ class FLExProject(object):
         Returns:
             ConstChartMarkerOperations
         """
-        if "_constchartmarker_ops" not in self.__dict__:
-            from .Discourse.ConstChartMarkerOperations import (
-                ConstChartMarkerOperations,
-            )
-            self._constchartmarker_ops = ConstChartMarkerOperations(self)
-        return self._constchartmarker_ops
 
-    @property
+    @_operations_property("Discourse.ConstChartCellTagOperations", "ConstChartCellTagOperations")
     def ConstChartCellTags(self):
         """
         Access to per-cell IConstChartTag operations.
@@ -2369,14 +2219,8 @@ class FLExProject(object):
         Returns:
             ConstChartCellTagOperations
         """
-        if "_constchartcelltag_ops" not in self.__dict__:
-            from .Discourse.ConstChartCellTagOperations import (
-                ConstChartCellTagOperations,
-            )
-            self._constchartcelltag_ops = ConstChartCellTagOperations(self)
-        return self._constchartcelltag_ops
 
-    @property
+    @_operations_property("Discourse.ConstChartClauseMarkerOperations", "ConstChartClauseMarkerOperations")
     def ConstChartClauseMarkers(self):
         """
         Access to clause marker operations for constituent chart rows.
@@ -2401,11 +2245,6 @@ class FLExProject(object):
             ...     wg = project.ConstChartClauseMarkers.GetWordGroup(marker)
             ...     print(f"Clause marker for word group {wg.Hvo}")
         """
-        if "_constchartclausemarker_ops" not in self.__dict__:
-            from .Discourse.ConstChartClauseMarkerOperations import ConstChartClauseMarkerOperations
-
-            self._constchartclausemarker_ops = ConstChartClauseMarkerOperations(self)
-        return self._constchartclausemarker_ops
 
     # Singular aliases for backward compatibility
 
@@ -2963,6 +2802,8 @@ class FLExProject(object):
             - `ILexEntryRepository`
         """
 
+        if _base_operations._active_profiler is not None:
+            _base_operations._active_profiler._round_trip()
         return self.project.ServiceLocator.GetService(repository)
 
     def ObjectCountFor(self, repository):
@@ -3001,17 +2842,39 @@ class FLExProject(object):
         """
         Returns the `CmObject` for the given Hvo or guid (`str` or `System.Guid`).
         Refer to `.ClassName` to determine the LCM class.
+
+        Resolved objects are kept in a bounded, weak-reference cache, so
+        repeated lookups of the same Hvo/Guid don't call
+        `ServiceLocator.GetObject()` again. A cached object that has since
+        been deleted (`IsValidObject` is False) is dropped and looked up
+        afresh; the cache is cleared by `CloseProject()`.
         """
+        if isinstance(hvoOrGuid, str):
+            key = hvoOrGuid.lower()
+        elif isinstance(hvoOrGuid, int):
+            key = hvoOrGuid
+        elif isinstance(hvoOrGuid, System.Guid):
+            key = str(hvoOrGuid).lower()
+        else:
+            raise FP_ParameterError("hvoOrGuid must be an Hvo (int), System.Guid or str")
+
+        obj = self._object_cache.get(key)
+        if obj is not None:
+            if obj.IsValidObject:
+                return obj
+            self._object_cache.discard(key)
+
         if isinstance(hvoOrGuid, str):
             try:
                 hvoOrGuid = System.Guid(hvoOrGuid)
             except System.FormatException:
                 raise FP_ParameterError("Invalid parameter, hvoOrGuid")
 
-        if isinstance(hvoOrGuid, (System.Guid, int)):
-            return self.project.ServiceLocator.GetObject(hvoOrGuid)
-        else:
-            raise FP_ParameterError("hvoOrGuid must be an Hvo (int), System.Guid or str")
+        if _base_operations._active_profiler is not None:
+            _base_operations._active_profiler._round_trip()
+        obj = self.project.ServiceLocator.GetObject(hvoOrGuid)
+        self._object_cache.put(key, obj)
+        return obj
 
     # --- Lexicon ---
 
@@ -4403,6 +4266,11 @@ class FLExProject(object):
         Passing `supplyName`/`Text` = `False` returns only the texts or names.
 
         Note: This method now delegates to TextOperations.GetAll() for retrieving texts.
+        Each text is read in full (every paragraph) before it is yielded.
+        For segment-level interlinear data, streamed without building whole
+        texts in memory, use Texts.IterInterlinear() or
+        Texts.ExportInterlinearJSONL(). To read only part of a text, call
+        Texts.IterParagraphs() or Texts.IterSegments() directly.
         """
 
         if not supplyText:
@@ -4411,10 +4279,9 @@ class FLExProject(object):
         else:
             for t in self.Texts.GetAll():
                 content = []
-                if t.ContentsOA:
-                    for p in t.ContentsOA.ParagraphsOS:
-                        if para := ITsString(IStTxtPara(p).Contents).Text:
-                            content.append(para)
+                for p in self.Texts.IterParagraphs(t):
+                    if para := ITsString(p.Contents).Text:
+                        content.append(para)
 
                 if supplyName:
                     name = ITsString(t.Name.BestVernacularAnalysisAlternative).Text
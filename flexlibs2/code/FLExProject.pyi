@@ -10,7 +10,7 @@
 #   Copyright 2025
 #
 
-from typing import Any, Optional, Iterator, Union, List
+from typing import Any, Optional, Iterable, Iterator, Union, List
 from .Grammar.POSOperations import POSOperations
 from .Grammar.PhonemeOperations import PhonemeOperations
 from .Grammar.NaturalClassOperations import NaturalClassOperations
@@ -185,6 +185,8 @@ class FLExProject:
     # Lifecycle methods
     def OpenProject(self, projectName: str, writeEnabled: bool = False) -> None: ...
     def CloseProject(self, save: bool = True) -> None: ...
+    def warm(self, names: Optional[Iterable[str]] = None) -> List[str]: ...
+    def Batch(self, label: str = "batch", save: bool = False) -> Any: ...
 
     # Utility methods
     def GetFieldID(self, className: str, fieldName: str) -> Optional[int]: ...
@@ -12,6 +12,7 @@
 #
 
 import logging
+from collections.abc import Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,9 @@ from ..FLExProject import (
 # Import string utilities
 from ..Shared.string_utils import normalize_text, normalize_match_key, best_analysis_text, best_vernacular_text
 
+# Row keys that describe a sense in CreateBulk() input
+_BULK_SENSE_KEYS = ("gloss", "definition", "pos", "semantic_domains")
+
 
 class LexEntryOperations(BaseOperations):
     """
@@ -117,7 +121,9 @@ class LexEntryOperations(BaseOperations):
             house (4 senses)
 
         Notes:
-            - Returns an iterator for memory efficiency with large lexicons
+            - Returns a lazy sequence: iteration streams from the repository,
+              len() reads the repository Count, and entries[0] or slicing
+              stop enumerating early
             - Entries are returned in database order (not alphabetical)
             - Use GetHeadword() to access the display form
             - For sorted entries, use FLExProject.LexiconAllEntriesSorted()
@@ -125,7 +131,7 @@ class LexEntryOperations(BaseOperations):
         See Also:
             Find, Create, GetHeadword
         """
-        return self.project.ObjectsIn(ILexEntryRepository)
+        return self._RepositoryObjects(ILexEntryRepository)
 
     @OperationsMethod
     def Create(self, lexeme_form, morph_type_name=None, wsHandle=None, create_blank_sense=True):
@@ -239,6 +245,173 @@ class LexEntryOperations(BaseOperations):
 
             return new_entry
 
+    @OperationsMethod
+    def CreateBulk(self, rows, wsHandle=None, analysisWsHandle=None, label=None):
+        """
+        Create many lexical entries, with their senses, in one batch.
+
+        Takes spreadsheet-shaped input and resolves every distinct morph
+        type, part of speech, semantic domain and writing system once, up
+        front. All entries are then created inside a single
+        project.Batch(), so the per-row cost is only the factory calls and
+        property writes.
+
+        Args:
+            rows: Either a list of row dicts, or a dict of equal-length
+                columns (column name -> list of values). Recognized keys:
+
+                - 'lexeme_form' (str, required): the lexeme form.
+                - 'morph_type' (str, optional): morph type name; default
+                  "stem".
+                - 'gloss', 'definition' (optional): a string in the
+                  analysis writing system, or a dict mapping writing
+                  system tags/handles to strings.
+                - 'pos' (optional): part of speech name, object or HVO.
+                - 'semantic_domains' (optional): a list of domain numbers
+                  (e.g. "1.1"), names, objects or HVOs.
+                - 'senses' (optional): a list of dicts with the sense keys
+                  above, for entries with several senses. Without it, the
+                  row's own sense keys (if any are set) make one sense.
+
+            wsHandle: Vernacular writing system for lexeme forms. Defaults
+                to the default vernacular WS.
+            analysisWsHandle: Writing system for plain-string glosses and
+                definitions. Defaults to the default analysis WS.
+            label (str, optional): Label for the batch transaction.
+
+        Returns:
+            list: The new ILexEntry objects, in row order.
+
+        Raises:
+            FP_ReadOnlyError: If project is not opened with write enabled
+            FP_NullParameterError: If rows is None
+            FP_ParameterError: If a row has no lexeme form, or names a morph
+                type, part of speech or semantic domain that does not exist,
+                or columns have different lengths. Raised before anything
+                is created.
+            FP_WritingSystemError: If a writing system tag is not found.
+
+        Example:
+            >>> entries = project.LexEntry.CreateBulk({
+            ...     "lexeme_form": ["famba", "-ile", "nyumba"],
+            ...     "morph_type": ["stem", "suffix", "stem"],
+            ...     "gloss": ["walk", "PERF", "house"],
+            ...     "pos": ["Verb", "Verb", "Noun"],
+            ... })
+            >>> len(entries)
+            3
+
+            >>> project.LexEntry.CreateBulk([
+            ...     {"lexeme_form": "bank", "senses": [
+            ...         {"gloss": {"en": "bank", "fr": "rive"}, "pos": "Noun",
+            ...          "semantic_domains": ["1.3.1"]},
+            ...         {"gloss": "lean", "pos": "Verb"},
+            ...     ]},
+            ... ])
+
+        Notes:
+            - Entries get no blank sense; a row without sense keys creates
+              an entry with no senses
+            - Stem morph types get a MoStemAllomorph and stem MSAs; affix
+              morph types get a MoAffixAllomorph and inflectional affix MSAs
+              (as Senses.SetPartOfSpeech does by default)
+            - All rows are validated before the first entry is created
+
+        See Also:
+            Create, LexSenseOperations.Create, FLExProject.Batch
+        """
+        self._EnsureWriteEnabled()
+        self._ValidateParam(rows, "rows")
+
+        if isinstance(rows, Mapping):
+            rows = self.__ColumnsToRows(rows)
+        else:
+            rows = list(rows)
+
+        vern_ws = self.__WSHandle(wsHandle)
+        anal_ws = self.__WSHandleAnalysis(analysisWsHandle)
+
+        # Resolve every row before writing anything. Each lookup table is
+        # filled on first use, so a name costs one search however many rows
+        # use it.
+        morph_types = {}
+        parts_of_speech = {}
+        domains = {}
+        domain_numbers = None   # number -> domain, read on first use
+        ws_handles = {}
+        plans = []
+
+        for row_number, row in enumerate(rows, 1):
+            lexeme_form = row.get("lexeme_form")
+            if not lexeme_form or not str(lexeme_form).strip():
+                raise FP_ParameterError(f"Row {row_number}: lexeme_form is required")
+
+            morph_type_name = row.get("morph_type") or "stem"
+            if morph_type_name not in morph_types:
+                morph_type = self.__FindMorphType(morph_type_name)
+                if morph_type is None:
+                    raise FP_ParameterError(f"Row {row_number}: morph type '{morph_type_name}' not found")
+                morph_types[morph_type_name] = (morph_type, self.__IsStemType(morph_type))
+            morph_type, is_stem = morph_types[morph_type_name]
+
+            sense_rows = row.get("senses")
+            if sense_rows is None:
+                has_sense = any(row.get(key) for key in _BULK_SENSE_KEYS)
+                sense_rows = [row] if has_sense else []
+
+            sense_plans = []
+            for sense_row in sense_rows:
+                sense_domains = []
+                for domain in sense_row.get("semantic_domains") or ():
+                    if isinstance(domain, str) and domain_numbers is None:
+                        domain_numbers = self.__DomainNumbers()
+                    sense_domains.append(self.__BulkDomain(domain, domains, domain_numbers, row_number))
+                sense_plans.append((
+                    self.__BulkTexts(sense_row.get("gloss"), anal_ws, ws_handles),
+                    self.__BulkTexts(sense_row.get("definition"), anal_ws, ws_handles),
+                    self.__BulkPOS(sense_row.get("pos"), parts_of_speech, row_number),
+                    sense_domains,
+                ))
+
+            plans.append((lexeme_form, morph_type, is_stem, sense_plans))
+
+        service_locator = self.project.project.ServiceLocator
+        entry_factory = service_locator.GetService(ILexEntryFactory)
+        stem_factory = service_locator.GetService(IMoStemAllomorphFactory)
+        affix_factory = service_locator.GetService(IMoAffixAllomorphFactory)
+        sense_factory = service_locator.GetService(ILexSenseFactory)
+        msa_ops = self.project.MSA
+
+        created = []
+        with self.project.Batch(label or f"Create {len(plans)} entries"):
+            for lexeme_form, morph_type, is_stem, sense_plans in plans:
+                entry = entry_factory.Create()
+                lexeme_form_obj = (stem_factory if is_stem else affix_factory).Create()
+                # Attach lexeme form to entry FIRST (must be done before setting properties)
+                entry.LexemeFormOA = lexeme_form_obj
+                lexeme_form_obj.Form.set_String(vern_ws, TsStringUtils.MakeString(lexeme_form, vern_ws))
+                lexeme_form_obj.MorphTypeRA = morph_type
+
+                for glosses, definitions, pos, sense_domains in sense_plans:
+                    sense = sense_factory.Create()
+                    entry.SensesOS.Add(sense)
+                    for ws, text in glosses:
+                        sense.Gloss.set_String(ws, TsStringUtils.MakeString(text, ws))
+                    for ws, text in definitions:
+                        sense.Definition.set_String(ws, TsStringUtils.MakeString(text, ws))
+                    if pos is not None:
+                        if is_stem:
+                            msa_ops.CreateStem(sense, pos)
+                        else:
+                            msa_ops.CreateInflAff(sense, pos)
+                    for domain in sense_domains:
+                        if domain not in sense.SemanticDomainsRC:
+                            sense.SemanticDomainsRC.Add(domain)
+
+                created.append(entry)
+
+        return created
+
     @OperationsMethod
     def Delete(self, entry_or_hvo):
         """
@@ -3150,6 +3323,83 @@ class LexEntryOperations(BaseOperations):
             return self.project.project.DefaultAnalWs
         return self.project._FLExProject__WSHandle(wsHandle, self.project.project.DefaultAnalWs)
 
+    def __ColumnsToRows(self, columns):
+        """
+        Turn CreateBulk() columnar input (name -> list) into row dicts.
+        """
+        columns = {name: list(values) for name, values in columns.items()}
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise FP_ParameterError("All CreateBulk() columns must have the same length")
+        names = list(columns)
+        return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+    def __BulkTexts(self, value, default_ws, ws_handles):
+        """
+        Resolve a CreateBulk() gloss/definition value to [(ws, text), ...].
+
+        value is None, a string (in default_ws), or a dict of writing
+        system tag/handle -> string. ws_handles caches tag lookups.
+        """
+        if not value:
+            return []
+        if isinstance(value, str):
+            return [(default_ws, value)]
+        texts = []
+        for ws, text in value.items():
+            if not text:
+                continue
+            if ws not in ws_handles:
+                ws_handles[ws] = self.__WSHandleAnalysis(ws)
+            texts.append((ws_handles[ws], text))
+        return texts
+
+    def __BulkPOS(self, value, parts_of_speech, row_number):
+        """
+        Resolve a CreateBulk() part of speech (name, object or HVO), once
+        per distinct value.
+        """
+        if value is None or value == "":
+            return None
+        if isinstance(value, int):
+            return self.project.Object(value)
+        if not isinstance(value, str):
+            return value
+        if value not in parts_of_speech:
+            pos_ops = self.project.POS
+            pos = pos_ops.Find(value)
+            if pos is None:
+                raise FP_ParameterError(f"Row {row_number}: part of speech '{value}' not found")
+            parts_of_speech[value] = pos
+        return parts_of_speech[value]
+
+    def __DomainNumbers(self):
+        """Map every semantic domain number to its domain, in one pass."""
+        domain_ops = self.project.SemanticDomains
+        numbers = {}
+        for domain in domain_ops.GetAll():
+            numbers.setdefault(domain_ops.GetNumber(domain), domain)
+        return numbers
+
+    def __BulkDomain(self, value, domains, domain_numbers, row_number):
+        """
+        Resolve a CreateBulk() semantic domain (number, name, object or
+        HVO), once per distinct value. domain_numbers is the
+        __DomainNumbers() map; it is only read for string values.
+        """
+        if isinstance(value, int):
+            return self.project.Object(value)
+        if not isinstance(value, str):
+            return value
+        if value not in domains:
+            domain = domain_numbers.get(value.strip())
+            if domain is None:
+                domain = self.project.SemanticDomains.FindByName(value)
+            if domain is None:
+                raise FP_ParameterError(f"Row {row_number}: semantic domain '{value}' not found")
+            domains[value] = domain
+        return domains[value]
+
     def __FindMorphType(self, name):
         """
         Find a morph type by name (case-insensitive).
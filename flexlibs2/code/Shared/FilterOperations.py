@@ -21,8 +21,10 @@ clr.AddReference("System")
 import System
 from System import Guid
 
+import itertools
 import json
 import os
+import re
 
 # Import FLEx LCM types
 from SIL.LCModel import (
@@ -33,6 +35,13 @@ from SIL.LCModel import (
     IWfiWordform,
     IText,
     ICmObjectRepository,
+    ILexEntryRepository,
+    ILexSenseRepository,
+    ILexExampleSentenceRepository,
+    IRnGenericRecRepository,
+    IReversalIndexEntryRepository,
+    IWfiWordformRepository,
+    ITextRepository,
 )
 
 from SIL.LCModel.Core.KernelInterfaces import ITsString
@@ -50,7 +59,7 @@ from ..lcm_casting import get_pos_from_msa
 from .string_utils import normalize_text, normalize_match_key
 
 # Import BaseOperations decorators
-from ..BaseOperations import OperationsMethod, wrap_enumerable
+from ..BaseOperations import BaseOperations, OperationsMethod, wrap_enumerable
 
 # --- Filter Type Constants ---
 
@@ -64,14 +73,95 @@ class FilterTypes:
     WORDFORM = "Wordform"  # Wordform filters
     TEXT = "Text"  # Text filters
     SENSE = "Sense"  # Sense filters
+    EXAMPLE = "Example"  # Example sentence filters
+    NOTEBOOK_RECORD = "NotebookRecord"  # Data notebook record filters
+    REVERSAL_ENTRY = "ReversalEntry"  # Reversal index entry filters
     ALLOMORPH = "Allomorph"  # Allomorph filters
     CUSTOM = "Custom"  # Custom/generic filters
 
 
+# --- Compiled Filters ---
+
+
+class _CompiledFilter:
+    """
+    A filter's criteria compiled into a reusable predicate.
+
+    Holds an ordered list of check callables, cheapest first; an object
+    matches when every check returns True. Regexes are precompiled and
+    name criteria (POS, morph type, genre) are resolved to Hvo sets once,
+    so evaluating an object only costs the LCM reads the checks need.
+
+    Calling the compiled filter with an object returns True/False. Any
+    unexpected error while checking an object is logged and counts as a
+    non-match, as _ObjectMatchesCriteria always did.
+    """
+
+    __slots__ = ("filter_type", "checks")
+
+    def __init__(self, filter_type, checks):
+        self.filter_type = filter_type
+        self.checks = tuple(checks)
+
+    def __call__(self, obj):
+        try:
+            for check in self.checks:
+                if not check(obj):
+                    return False
+            return True
+        except Exception as e:
+            logger.error(f"Error matching criteria: {e}")
+            return False
+
+
+def _best_text(multi_string, vernacular=False):
+    """Read BestAnalysis/BestVernacular alternative text; None on failure."""
+    alt = multi_string.BestVernacularAlternative if vernacular else multi_string.BestAnalysisAlternative
+    return normalize_text(ITsString(alt).Text)
+
+
+def _guarded(check):
+    """Turn LCM attribute/type errors inside check into a non-match."""
+
+    def guarded_check(obj):
+        try:
+            return check(obj)
+        except (TypeError, AttributeError, KeyError):
+            return False
+
+    return guarded_check
+
+
+def _pattern_check(pattern, read_text):
+    """Check: text matches the (precompiled) regex; empty text passes."""
+    try:
+        search = re.compile(pattern).search
+    except (re.error, TypeError) as e:
+        raise FP_ParameterError(f"Invalid regular expression {pattern!r}: {e}")
+
+    def pattern_check(obj):
+        text = read_text(obj)
+        return not text or search(text) is not None
+
+    return _guarded(pattern_check)
+
+
+# Repository enumerated for each filter type that has native matchers
+_FILTER_TYPE_REPOSITORIES = {
+    FilterTypes.LEXENTRY: ILexEntryRepository,
+    FilterTypes.SENSE: ILexSenseRepository,
+    FilterTypes.EXAMPLE: ILexExampleSentenceRepository,
+    FilterTypes.NOTEBOOK_RECORD: IRnGenericRecRepository,
+    FilterTypes.REVERSAL_ENTRY: IReversalIndexEntryRepository,
+    FilterTypes.WORDFORM: IWfiWordformRepository,
+    FilterTypes.TEXT: ITextRepository,
+}
+
+
 # --- FilterOperations Class ---
 
 
-class FilterOperations:
+class FilterOperations(BaseOperations):
     """
     This class provides operations for managing saved filters and queries
     in a FieldWorks project.
@@ -128,8 +218,10 @@ class FilterOperations:
         Args:
             project: The FLExProject instance to operate on.
         """
-        self.project = project
+        super().__init__(project)
         self._filter_cache = {}  # Cache for filter objects
+        # Compiled predicates: guid -> (date_modified, criteria key, _CompiledFilter)
+        self._compiled_filters = {}
 
     # --- Core Filter Management ---
 
@@ -213,9 +305,14 @@ class FilterOperations:
             - Filter is immediately saved to the project
             - A unique GUID is automatically assigned
             - Common criteria keys depend on filter type:
-              - LexEntry: pos, morph_type, date_created, etc.
-              - Wordform: spelling_status, form_pattern, etc.
-              - Text: genre, title_pattern, etc.
+              - LexEntry: pos, morph_type, form_pattern
+              - Sense: gloss_pattern, definition_pattern, pos,
+                semantic_domain, has_examples
+              - Example: example_pattern, has_translation
+              - NotebookRecord: title_pattern, record_type
+              - ReversalEntry: form_pattern, pos
+              - Wordform: spelling_status, form_pattern
+              - Text: genre, title_pattern
 
         See Also:
             Delete, Find, GetCriteria, SetCriteria
@@ -237,6 +334,9 @@ class FilterOperations:
             FilterTypes.WORDFORM,
             FilterTypes.TEXT,
             FilterTypes.SENSE,
+            FilterTypes.EXAMPLE,
+            FilterTypes.NOTEBOOK_RECORD,
+            FilterTypes.REVERSAL_ENTRY,
             FilterTypes.ALLOMORPH,
             FilterTypes.CUSTOM,
         ]
@@ -687,7 +787,8 @@ class FilterOperations:
 
         Raises:
             FP_NullParameterError: If filter_obj or object_collection is None
-            FP_ParameterError: If filter_obj is invalid
+            FP_ParameterError: If filter_obj is invalid, or a pattern
+                criterion is not a valid regular expression
 
         Example:
             >>> # Filter lexical entries
@@ -711,9 +812,101 @@ class FilterOperations:
             - Empty collection returns empty list
             - Objects that don't match criteria are excluded
             - Filtering is done in Python (not database-level)
+            - The criteria are compiled once (see CompileFilter) and the
+              compiled predicate is reused until the filter is modified
+
+        See Also:
+            CompileFilter, GetMatchCount, GetCriteria, GetFilterType
+        """
+        matches = self.CompileFilter(filter_obj)
+        return [obj for obj in object_collection if matches(obj)]
+
+    @OperationsMethod
+    def IterFilter(self, filter_obj, object_collection=None, limit=None, offset=0):
+        """
+        Iterate over the objects matching a filter, lazily.
+
+        The arguments are checked and the filter compiled when this is
+        called. Unlike ApplyFilter(), no result list is built: the returned
+        iterator checks objects as they are read from the collection, and
+        enumeration stops as soon as ``limit`` matches have been yielded.
+
+        Args:
+            filter_obj (dict): The filter object to apply
+            object_collection: Optional iterable of objects to filter. If
+                None, streams all objects of the filter's type from the
+                project.
+            limit (int): Optional maximum number of matches to yield.
+            offset (int): Number of leading matches to skip (for paging).
+
+        Returns:
+            iterator: The matching objects, in collection order.
+
+        Raises:
+            FP_NullParameterError: If filter_obj is None
+            FP_ParameterError: If filter_obj is invalid, a pattern
+                criterion is not a valid regular expression, or
+                limit/offset is negative
+
+        Example:
+            >>> verb_filter = project.Filter.Find("Verbs")
+            >>> # Second page of 50 verbs; stops reading after match 100
+            >>> for entry in project.Filter.IterFilter(verb_filter, limit=50, offset=50):
+            ...     print(project.LexEntry.GetHeadword(entry))
+
+        Notes:
+            - Uses the same compiled predicate as ApplyFilter()
+            - Memory use is O(1) in the size of the collection
+
+        See Also:
+            ApplyFilter, GetMatchCount, CompileFilter
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise FP_ParameterError("limit and offset must not be negative")
+
+        matches = self.CompileFilter(filter_obj)
+        if object_collection is None:
+            object_collection = self._GetAllObjectsOfType(matches.filter_type)
+
+        stop = None if limit is None else offset + limit
+        return itertools.islice(filter(matches, object_collection), offset, stop)
+
+    @OperationsMethod
+    def CompileFilter(self, filter_obj):
+        """
+        Compile a filter's criteria into a reusable predicate.
+
+        The compiled predicate precompiles regex criteria, resolves POS,
+        morph type and genre names to Hvo sets once, and orders the checks
+        so the cheapest run first. It is cached per filter GUID and
+        modification date, so repeated ApplyFilter()/GetMatchCount() calls
+        don't recompile.
+
+        Args:
+            filter_obj (dict): The filter object to compile
+
+        Returns:
+            callable: ``predicate(obj) -> bool``; True if obj matches all
+            criteria.
+
+        Raises:
+            FP_NullParameterError: If filter_obj is None
+            FP_ParameterError: If filter_obj is invalid, or a pattern
+                criterion is not a valid regular expression
+
+        Example:
+            >>> verb_filter = project.Filter.Find("Verbs")
+            >>> is_verb = project.Filter.CompileFilter(verb_filter)
+            >>> verbs = [e for e in project.LexEntry.GetAll() if is_verb(e)]
+
+        Notes:
+            - Name criteria are resolved when the filter is compiled; a POS,
+              morph type or genre created afterwards is not seen until the
+              filter is modified (or compiled from a fresh filter dict)
+            - Unknown filter types match every object
 
         See Also:
-            GetMatchCount, GetCriteria, GetFilterType
+            ApplyFilter, GetMatchCount
         """
         self._ValidateParam(filter_obj, "filter_obj")
 
@@ -723,13 +916,21 @@ class FilterOperations:
         criteria = self.GetCriteria(filter_obj)
         filter_type = self.GetFilterType(filter_obj)
 
-        matching_objects = []
+        guid = filter_obj.get("guid")
+        if guid is None:
+            return self._CompileCriteria(criteria, filter_type)
 
-        for obj in object_collection:
-            if self._ObjectMatchesCriteria(obj, criteria, filter_type):
-                matching_objects.append(obj)
+        # The criteria fingerprint guards against edits made within the
+        # one-second resolution of date_modified.
+        criteria_key = (filter_type, json.dumps(criteria, sort_keys=True, default=str))
+        modified = filter_obj.get("date_modified")
+        cached = self._compiled_filters.get(guid)
+        if cached is not None and cached[0] == modified and cached[1] == criteria_key:
+            return cached[2]
 
-        return matching_objects
+        compiled = self._CompileCriteria(criteria, filter_type)
+        self._compiled_filters[guid] = (modified, criteria_key, compiled)
+        return compiled
 
     @OperationsMethod
     def GetMatchCount(self, filter_obj, object_collection=None):
@@ -746,7 +947,8 @@ class FilterOperations:
 
         Raises:
             FP_NullParameterError: If filter_obj is None
-            FP_ParameterError: If filter_obj is invalid
+            FP_ParameterError: If filter_obj is invalid, or a pattern
+                criterion is not a valid regular expression
 
         Example:
             >>> verb_filter = project.Filter.Find("Verbs")
@@ -762,26 +964,16 @@ class FilterOperations:
             ... )
 
         Notes:
-            - More efficient than len(ApplyFilter(...))
+            - More efficient than len(ApplyFilter(...)): matches are
+              counted as the collection streams past, no list is built
             - If no collection provided, searches entire project
             - Returns 0 if no matches found
             - Useful for filter validation and reporting
 
         See Also:
-            ApplyFilter, GetCriteria
+            ApplyFilter, IterFilter, GetCriteria
         """
-        self._ValidateParam(filter_obj, "filter_obj")
-
-        if not isinstance(filter_obj, dict):
-            raise FP_ParameterError("Invalid filter object")
-
-        # If no collection provided, get all objects of the filter type
-        if object_collection is None:
-            filter_type = self.GetFilterType(filter_obj)
-            object_collection = self._GetAllObjectsOfType(filter_type)
-
-        matching = self.ApplyFilter(filter_obj, object_collection)
-        return len(matching)
+        return sum(1 for _ in self.IterFilter(filter_obj, object_collection))
 
     # --- Filter Import/Export ---
 
@@ -1072,23 +1264,23 @@ class FilterOperations:
             filter_type (str): The filter type
 
         Returns:
-            list: All objects of that type
+            Iterable of all objects of that type, streamed from the
+            repository (not materialized).
         """
-        if filter_type == FilterTypes.LEXENTRY:
-            return list(self.project.LexEntry.GetAll())
-        elif filter_type == FilterTypes.WORDFORM:
-            return list(self.project.Wordforms.GetAll())
-        elif filter_type == FilterTypes.TEXT:
-            return list(self.project.Texts.GetAll())
-        else:
+        repository = _FILTER_TYPE_REPOSITORIES.get(filter_type)
+        if repository is None:
             # For other types, return empty list
             logger.warning(f"GetAllObjectsOfType not implemented for {filter_type}")
             return []
+        return self.project.ObjectsIn(repository)
 
     def _ObjectMatchesCriteria(self, obj, criteria, filter_type):
         """
         Check if an object matches filter criteria.
 
+        Compiles the criteria on every call; use CompileFilter() when
+        checking more than one object.
+
         Args:
             obj: The object to check
             criteria (dict): The filter criteria
@@ -1097,148 +1289,357 @@ class FilterOperations:
         Returns:
             bool: True if object matches all criteria, False otherwise
         """
-        try:
-            if filter_type == FilterTypes.LEXENTRY:
-                return self._MatchLexEntryCriteria(obj, criteria)
-            elif filter_type == FilterTypes.WORDFORM:
-                return self._MatchWordformCriteria(obj, criteria)
-            elif filter_type == FilterTypes.TEXT:
-                return self._MatchTextCriteria(obj, criteria)
-            else:
-                # For custom or unknown types, always return True
-                return True
-        except Exception as e:
-            logger.error(f"Error matching criteria: {e}")
-            return False
+        return self._CompileCriteria(criteria, filter_type)(obj)
 
-    def _MatchLexEntryCriteria(self, entry, criteria):
+    def _CompileCriteria(self, criteria, filter_type):
         """
-        Check if a lexical entry matches criteria.
+        Build a _CompiledFilter for criteria of the given filter type.
 
         Args:
-            entry: ILexEntry object
-            criteria (dict): Filter criteria
+            criteria (dict): The filter criteria
+            filter_type (str): The filter type
 
         Returns:
-            bool: True if matches all criteria
+            _CompiledFilter: The compiled predicate
         """
-        # Example criteria matching for lexical entries
-        # This can be extended based on actual requirements
+        if filter_type == FilterTypes.LEXENTRY:
+            checks = self._CompileLexEntryChecks(criteria)
+        elif filter_type == FilterTypes.SENSE:
+            checks = self._CompileSenseChecks(criteria)
+        elif filter_type == FilterTypes.EXAMPLE:
+            checks = self._CompileExampleChecks(criteria)
+        elif filter_type == FilterTypes.NOTEBOOK_RECORD:
+            checks = self._CompileNotebookRecordChecks(criteria)
+        elif filter_type == FilterTypes.REVERSAL_ENTRY:
+            checks = self._CompileReversalEntryChecks(criteria)
+        elif filter_type == FilterTypes.WORDFORM:
+            checks = self._CompileWordformChecks(criteria)
+        elif filter_type == FilterTypes.TEXT:
+            checks = self._CompileTextChecks(criteria)
+        else:
+            # For custom or unknown types, always match
+            checks = []
+        return _CompiledFilter(filter_type, checks)
 
-        # Check POS (part of speech)
-        if "pos" in criteria:
-            pos_name = criteria["pos"].lower()
-            # Get entry's POS and compare
-            # Use get_pos_from_msa() to handle pythonnet interface casting
+    def _ResolveNamesToHvos(self, items, name):
+        """
+        Return the Hvos of the possibilities whose analysis name is name.
+
+        Args:
+            items: Iterable of CmPossibility-like objects
+            name (str): Name to match (case-insensitive)
+
+        Returns:
+            frozenset: Matching Hvos
+        """
+        wanted = name.lower()
+        hvos = set()
+        for item in items:
             try:
-                senses = list(entry.SensesOS)
-                if senses:
-                    for sense in senses:
-                        if sense.MorphoSyntaxAnalysisRA:
-                            pos = get_pos_from_msa(sense.MorphoSyntaxAnalysisRA)
-                            if pos:
-                                pos_text = normalize_text(ITsString(pos.Name.BestAnalysisAlternative).Text)
-                                if pos_text and pos_text.lower() == pos_name:
-                                    return True
-                return False
-            except (TypeError, AttributeError, KeyError) as e:
-                return False
+                item_name = _best_text(item.Name)
+            except (TypeError, AttributeError, KeyError):
+                continue
+            if item_name and item_name.lower() == wanted:
+                hvos.add(item.Hvo)
+        return frozenset(hvos)
+
+    def _AllPossibilities(self, possibility_list):
+        """Yield every item of a possibility list, including subitems."""
+        if possibility_list is None:
+            return
+        pending = list(possibility_list.PossibilitiesOS)
+        while pending:
+            item = pending.pop()
+            yield item
+            pending.extend(item.SubPossibilitiesOS)
+
+    def _CompileLexEntryChecks(self, criteria):
+        """
+        Compile lexical entry criteria (cheapest checks first).
 
-        # Check morph type
+        Supported criteria: morph_type, form_pattern, pos.
+
+        Args:
+            criteria (dict): Filter criteria
+
+        Returns:
+            list: Check callables
+        """
+        checks = []
+
+        # Check morph type: entries without a morph type pass.
         if "morph_type" in criteria:
-            morph_type_name = criteria["morph_type"].lower()
-            try:
-                if entry.LexemeFormOA and entry.LexemeFormOA.MorphTypeRA:
-                    mt = entry.LexemeFormOA.MorphTypeRA
-                    mt_text = normalize_text(ITsString(mt.Name.BestAnalysisAlternative).Text)
-                    if mt_text and mt_text.lower() != morph_type_name:
-                        return False
-            except (TypeError, AttributeError, KeyError) as e:
-                return False
+            morph_type_hvos = self._ResolveNamesToHvos(
+                self._AllPossibilities(self.project.lexDB.MorphTypesOA),
+                criteria["morph_type"],
+            )
+
+            def morph_type_check(entry):
+                form = entry.LexemeFormOA
+                morph_type = form.MorphTypeRA if form else None
+                return morph_type is None or morph_type.Hvo in morph_type_hvos
+
+            checks.append(_guarded(morph_type_check))
 
         # Check form pattern (regex)
         if "form_pattern" in criteria:
-            import re
+            checks.append(_pattern_check(
+                criteria["form_pattern"],
+                lambda entry: _best_text(entry.LexemeFormOA.Form, vernacular=True),
+            ))
 
-            pattern = criteria["form_pattern"]
-            try:
-                form = normalize_text(ITsString(entry.LexemeFormOA.Form.BestVernacularAlternative).Text)
-                if form and not re.search(pattern, form):
-                    return False
-            except (TypeError, AttributeError, KeyError) as e:
+        # Check POS: any sense whose MSA has the POS. Walks senses and
+        # casts MSAs, so it goes last.
+        if "pos" in criteria:
+            sense_has_pos = self._SensePOSCheck(criteria["pos"])
+
+            def pos_check(entry):
+                return any(sense_has_pos(sense) for sense in entry.SensesOS)
+
+            checks.append(_guarded(pos_check))
+
+        return checks
+
+    def _SensePOSCheck(self, pos_name):
+        """
+        Build a check: the sense's MSA has the named part of speech.
+
+        Args:
+            pos_name (str): POS name (case-insensitive)
+
+        Returns:
+            callable: ``check(sense) -> bool``
+        """
+        pos_ops = self.project.POS
+        pos_hvos = self._ResolveNamesToHvos(pos_ops.GetAll(), pos_name)
+
+        def sense_has_pos(sense):
+            if not pos_hvos:
+                return False
+            msa = sense.MorphoSyntaxAnalysisRA
+            if not msa:
                 return False
+            pos = get_pos_from_msa(msa)
+            return bool(pos) and pos.Hvo in pos_hvos
+
+        return sense_has_pos
+
+    def _CompileSenseChecks(self, criteria):
+        """
+        Compile sense criteria (cheapest checks first).
+
+        Supported criteria: has_examples, gloss_pattern,
+        definition_pattern, semantic_domain, pos.
+
+        Args:
+            criteria (dict): Filter criteria
+
+        Returns:
+            list: Check callables
+        """
+        checks = []
+
+        # Check whether the sense has example sentences
+        if "has_examples" in criteria:
+            wanted = bool(criteria["has_examples"])
+            checks.append(_guarded(lambda sense: (sense.ExamplesOS.Count > 0) == wanted))
+
+        # Check gloss pattern (regex)
+        if "gloss_pattern" in criteria:
+            checks.append(_pattern_check(
+                criteria["gloss_pattern"],
+                lambda sense: _best_text(sense.Gloss),
+            ))
+
+        # Check definition pattern (regex)
+        if "definition_pattern" in criteria:
+            checks.append(_pattern_check(
+                criteria["definition_pattern"],
+                lambda sense: _best_text(sense.Definition),
+            ))
+
+        # Check semantic domain: any domain with the given name
+        if "semantic_domain" in criteria:
+            domain_hvos = self._ResolveNamesToHvos(
+                self._AllPossibilities(self.project.lp.SemanticDomainListOA),
+                criteria["semantic_domain"],
+            )
+
+            def semantic_domain_check(sense):
+                return any(domain.Hvo in domain_hvos for domain in sense.SemanticDomainsRC)
+
+            checks.append(_guarded(semantic_domain_check))
+
+        # Check POS (casts the MSA, so it goes last)
+        if "pos" in criteria:
+            checks.append(_guarded(self._SensePOSCheck(criteria["pos"])))
+
+        return checks
+
+    def _CompileExampleChecks(self, criteria):
+        """
+        Compile example sentence criteria (cheapest checks first).
+
+        Supported criteria: has_translation, example_pattern.
+
+        Args:
+            criteria (dict): Filter criteria
+
+        Returns:
+            list: Check callables
+        """
+        checks = []
+
+        # Check whether the example has any translation
+        if "has_translation" in criteria:
+            wanted = bool(criteria["has_translation"])
+            checks.append(_guarded(lambda example: (example.TranslationsOC.Count > 0) == wanted))
 
-        # If no criteria specified or all matched, return True
-        return True
+        # Check example text pattern (regex)
+        if "example_pattern" in criteria:
+            checks.append(_pattern_check(
+                criteria["example_pattern"],
+                lambda example: _best_text(example.Example, vernacular=True),
+            ))
 
-    def _MatchWordformCriteria(self, wordform, criteria):
+        return checks
+
+    def _CompileNotebookRecordChecks(self, criteria):
+        """
+        Compile data notebook record criteria (cheapest checks first).
+
+        Supported criteria: record_type, title_pattern.
+
+        Args:
+            criteria (dict): Filter criteria
+
+        Returns:
+            list: Check callables
+        """
+        checks = []
+
+        # Check record type (Interview, Observation, ...)
+        if "record_type" in criteria:
+            notebook = self.project.lp.ResearchNotebookOA
+            type_hvos = self._ResolveNamesToHvos(
+                self._AllPossibilities(notebook.RecTypesOA if notebook else None),
+                criteria["record_type"],
+            )
+
+            def record_type_check(record):
+                record_type = record.TypeRA
+                return record_type is not None and record_type.Hvo in type_hvos
+
+            checks.append(_guarded(record_type_check))
+
+        # Check title pattern (regex)
+        if "title_pattern" in criteria:
+            checks.append(_pattern_check(
+                criteria["title_pattern"],
+                lambda record: _best_text(record.Title),
+            ))
+
+        return checks
+
+    def _CompileReversalEntryChecks(self, criteria):
+        """
+        Compile reversal index entry criteria (cheapest checks first).
+
+        Supported criteria: pos, form_pattern.
+
+        Args:
+            criteria (dict): Filter criteria
+
+        Returns:
+            list: Check callables
+        """
+        checks = []
+
+        # Check POS. Each reversal index has its own POS list.
+        if "pos" in criteria:
+            pos_hvos = set()
+            for index in self.project.lexDB.ReversalIndexesOC:
+                pos_hvos |= self._ResolveNamesToHvos(
+                    self._AllPossibilities(index.PartsOfSpeechOA), criteria["pos"]
+                )
+
+            def reversal_pos_check(entry):
+                pos = entry.PartOfSpeechRA
+                return pos is not None and pos.Hvo in pos_hvos
+
+            checks.append(_guarded(reversal_pos_check))
+
+        # Check reversal form pattern (regex)
+        if "form_pattern" in criteria:
+            checks.append(_pattern_check(
+                criteria["form_pattern"],
+                lambda entry: _best_text(entry.ReversalForm),
+            ))
+
+        return checks
+
+    def _CompileWordformChecks(self, criteria):
         """
-        Check if a wordform matches criteria.
+        Compile wordform criteria (cheapest checks first).
+
+        Supported criteria: spelling_status, form_pattern.
 
         Args:
-            wordform: IWfiWordform object
             criteria (dict): Filter criteria
 
         Returns:
-            bool: True if matches all criteria
+            list: Check callables
         """
+        checks = []
+
         # Check spelling status
         if "spelling_status" in criteria:
             expected_status = criteria["spelling_status"]
-            if wordform.SpellingStatus != expected_status:
-                return False
+            checks.append(lambda wordform: wordform.SpellingStatus == expected_status)
 
         # Check form pattern (regex)
         if "form_pattern" in criteria:
-            import re
-
-            pattern = criteria["form_pattern"]
-            try:
-                form = ITsString(wordform.Form.BestVernacularAlternative).Text
-                if form and not re.search(pattern, form):
-                    return False
-            except (TypeError, AttributeError, KeyError) as e:
-                return False
+            checks.append(_pattern_check(
+                criteria["form_pattern"],
+                lambda wordform: ITsString(wordform.Form.BestVernacularAlternative).Text,
+            ))
 
-        return True
+        return checks
 
-    def _MatchTextCriteria(self, text, criteria):
+    def _CompileTextChecks(self, criteria):
         """
-        Check if a text matches criteria.
+        Compile text criteria (cheapest checks first).
+
+        Supported criteria: title_pattern, genre.
 
         Args:
-            text: IText object
             criteria (dict): Filter criteria
 
         Returns:
-            bool: True if matches all criteria
+            list: Check callables
         """
-        # Check genre
-        if "genre" in criteria:
-            genre_name = criteria["genre"].lower()
-            try:
-                if text.GenresRC and text.GenresRC.Count > 0:
-                    for genre in text.GenresRC:
-                        genre_text = ITsString(genre.Name.BestAnalysisAlternative).Text
-                        if genre_text and genre_text.lower() == genre_name:
-                            return True
-                return False
-            except (TypeError, AttributeError, KeyError) as e:
-                return False
+        checks = []
 
         # Check title pattern (regex)
         if "title_pattern" in criteria:
-            import re
+            checks.append(_pattern_check(
+                criteria["title_pattern"],
+                lambda text: ITsString(text.Title.BestAnalysisAlternative).Text,
+            ))
 
-            pattern = criteria["title_pattern"]
-            try:
-                title = ITsString(text.Title.BestAnalysisAlternative).Text
-                if title and not re.search(pattern, title):
-                    return False
-            except (TypeError, AttributeError, KeyError) as e:
-                return False
+        # Check genre: any genre with the given name
+        if "genre" in criteria:
+            genre_hvos = self._ResolveNamesToHvos(
+                self._AllPossibilities(self.project.lp.GenreListOA),
+                criteria["genre"],
+            )
+
+            def genre_check(text):
+                return any(genre.Hvo in genre_hvos for genre in text.GenresRC)
+
+            checks.append(_guarded(genre_check))
 
-        return True
+        return checks
 
     @OperationsMethod
     def Duplicate(self, item_or_hvo, insert_after=True):
@@ -129,6 +129,65 @@ def normalize_ws_handle(ws):
     )
 
 
+def changed_span(old, new):
+    """
+    Find the single span where two strings differ.
+
+    Strips the longest common prefix and then the longest common suffix
+    (never overlapping the prefix), so replacing old[start:old_end] with
+    new[start:new_end] turns old into new.
+
+    Args:
+        old: The original string (None is treated as "").
+        new: The edited string (None is treated as "").
+
+    Returns:
+        tuple: (start, old_end, new_end), or None if the strings are equal.
+
+    Example:
+        >>> changed_span("The dog ran.", "The dogs ran.")
+        (7, 7, 8)
+    """
+    old = old or ""
+    new = new or ""
+    if old == new:
+        return None
+
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+
+    suffix = 0
+    while (suffix < limit - start
+           and old[len(old) - 1 - suffix] == new[len(new) - 1 - suffix]):
+        suffix += 1
+
+    return start, len(old) - suffix, len(new) - suffix
+
+
+def utf16_offset(text, index):
+    """
+    Convert a Python string index to a UTF-16 code unit offset.
+
+    ITsString offsets (ISegment.BeginOffset/EndOffset, ITsStrBldr.Replace)
+    count UTF-16 code units, so every character outside the Basic
+    Multilingual Plane before index counts twice.
+
+    Args:
+        text: The string (None is treated as "").
+        index (int): A code point index into text.
+
+    Returns:
+        int: The same position in UTF-16 code units.
+
+    Example:
+        >>> utf16_offset("\U0001D11E ab", 2)
+        3
+    """
+    return index + sum(1 for ch in (text or "")[:index] if ord(ch) > 0xFFFF)
+
+
 def is_empty_text(text):
     """
     Check if a text value from LCM is empty (None, empty string, or '***').
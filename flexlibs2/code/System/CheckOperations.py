@@ -19,6 +19,7 @@ import clr
 
 clr.AddReference("System")
 import System
+import functools
 from datetime import datetime
 
 # Import FLEx LCM types
@@ -38,11 +39,126 @@ from ..FLExProject import (
     FP_ParameterError,
 )
 from ..BaseOperations import BaseOperations, OperationsMethod
+from ..lcm_casting import get_pos_from_msa
 
 # Import string utilities
 from ..Shared.string_utils import normalize_text, normalize_match_key
 
 
+# --- Built-in checks ---
+#
+# Each check takes (entry, senses, wsHandle) and returns "error", "warning",
+# or None if the entry passed. senses is the entry's SensesOS, read once by
+# the caller and shared between checks.
+
+
+def _check_missing_gloss(entry, senses, wsHandle):
+    # ERROR: Senses without glosses
+    for sense in senses:
+        gloss_text = ITsString(sense.Gloss.get_String(wsHandle)).Text
+        if not gloss_text or not gloss_text.strip():
+            return "error"
+    return None
+
+
+def _check_missing_definition(entry, senses, wsHandle):
+    # WARNING: Senses without definitions
+    for sense in senses:
+        def_text = ITsString(sense.Definition.get_String(wsHandle)).Text
+        if not def_text or not def_text.strip():
+            return "warning"
+    return None
+
+
+def _check_missing_example(entry, senses, wsHandle):
+    # WARNING: Senses without examples
+    for sense in senses:
+        if sense.ExamplesOS.Count == 0:
+            return "warning"
+    return None
+
+
+def _check_missing_grammatical_info(entry, senses, wsHandle):
+    # ERROR: Senses without POS/MSA
+    for sense in senses:
+        if sense.MorphoSyntaxAnalysisRA is None:
+            return "error"
+    return None
+
+
+class _GroupingCheck:
+    """
+    A check that compares entries with each other rather than one at a time.
+
+    key_func(entry, senses, wsHandle) returns a hashable key, or None to
+    skip the entry. Every entry that shares its key with at least one other
+    entry is reported with the given severity; the others pass.
+    """
+
+    def __init__(self, key_func, severity="warning"):
+        self.key_func = key_func
+        self.severity = severity
+
+
+def _duplicate_entry_key(entry, senses, wsHandle, match_pos=False):
+    """
+    Grouping key for duplicate detection: the lexeme form (normalized and
+    casefolded, with runs of whitespace collapsed) and morph type, plus the
+    set of sense POS if match_pos is True.
+    """
+    lexeme = entry.LexemeFormOA
+    if lexeme is None:
+        return None
+    form = " ".join(normalize_match_key(lexeme.Form.BestVernacularAlternative.Text).split())
+    if not form:
+        return None
+
+    morph_type = lexeme.MorphTypeRA
+    key = (form, morph_type.Hvo if morph_type else None)
+    if match_pos:
+        pos_hvos = set()
+        for sense in senses:
+            msa = sense.MorphoSyntaxAnalysisRA
+            pos = get_pos_from_msa(msa) if msa is not None else None
+            if pos is not None:
+                pos_hvos.add(pos.Hvo)
+        key += (frozenset(pos_hvos),)
+    return key
+
+
+def _check_missing_etymology(entry, senses, wsHandle):
+    # WARNING: Entries without etymology
+    if entry.EtymologyOS.Count == 0:
+        return "warning"
+    return None
+
+
+# Check type name -> check function (exact name matching, Craig's pattern)
+_BUILTIN_CHECKS = {
+    "Missing Gloss": _check_missing_gloss,
+    "Missing Definition": _check_missing_definition,
+    "Missing Example": _check_missing_example,
+    "Missing Grammatical Info": _check_missing_grammatical_info,
+    "Missing Part of Speech": _check_missing_grammatical_info,
+    # WARNING: Entries with the same lexeme form and morph type
+    "Duplicate Entries": _GroupingCheck(_duplicate_entry_key),
+    # WARNING: ... and the same set of sense parts of speech
+    "Duplicate Entries (Same POS)": _GroupingCheck(
+        functools.partial(_duplicate_entry_key, match_pos=True)
+    ),
+    "Missing Etymology": _check_missing_etymology,
+}
+
+
+def _to_net_datetime(timestamp):
+    """Convert a Python datetime to a System.DateTime for LCM comparisons."""
+    return System.DateTime(
+        timestamp.year, timestamp.month, timestamp.day,
+        timestamp.hour, timestamp.minute, timestamp.second,
+        timestamp.microsecond // 1000,
+    )
+
+
 class CheckOperations(BaseOperations):
     """
     This class provides operations for managing consistency checks and
@@ -99,6 +215,8 @@ class CheckOperations(BaseOperations):
         self._check_results = {}
         self._check_last_run = {}
         self._check_enabled = {}
+        # Check type name -> check function
+        self._check_registry = dict(_BUILTIN_CHECKS)
 
     # --- Core CRUD Operations ---
 
@@ -511,7 +629,7 @@ class CheckOperations(BaseOperations):
     # --- Execution Methods ---
 
     @OperationsMethod
-    def RunCheck(self, check_or_hvo, target_objects=None):
+    def RunCheck(self, check_or_hvo, target_objects=None, incremental=False):
         """
         Run a consistency check on project data.
 
@@ -524,12 +642,16 @@ class CheckOperations(BaseOperations):
             target_objects (list, optional): List of specific objects to check.
                 If None, checks all relevant objects in the project.
                 Defaults to None.
+            incremental (bool, optional): If True and the check has cached
+                results, only recheck objects whose DateModified is later
+                than the last run, and merge them into the cached results.
+                Defaults to False.
 
         Returns:
             dict: Results dictionary containing:
-                - 'errors': list of error items
-                - 'warnings': list of warning items
-                - 'passed': list of items that passed
+                - 'errors': dict mapping HVO to each item with an error
+                - 'warnings': dict mapping HVO to each item with a warning
+                - 'passed_count': number of items that passed
                 - 'timestamp': datetime when check was run
 
         Raises:
@@ -548,20 +670,32 @@ class CheckOperations(BaseOperations):
             Warnings: 3
 
             >>> # Run check on specific entries
-            >>> entries = list(project.LexiconGetAllEntries())[:10]
+            >>> entries = list(project.LexiconAllEntries())[:10]
             >>> results = project.Checks.RunCheck(check, entries)
 
+            >>> # Later: recheck only entries edited since the last run
+            >>> results = project.Checks.RunCheck(check, incremental=True)
+
         Notes:
             - Check must be enabled before running
             - Results are cached until next run
+            - Items that passed are counted, not kept, so the cache does not
+              hold a reference to every object checked
+            - Incremental runs fall back to a full run if the check has no
+              cached results; deleted objects are dropped from the results
             - Timestamp records when check was executed
             - Validation logic determined by check type name
             - Supports: Missing Gloss, Missing Definition, Missing Example,
-              Missing Grammatical Info, Duplicate Entries, Missing Etymology
+              Missing Grammatical Info, Duplicate Entries, Duplicate Entries
+              (Same POS), Missing Etymology
             - Unknown check types will mark all objects as passed
+            - Custom check logic can be added with RegisterCheck()
+            - 'errors' and 'warnings' were lists up to 4.0.1: iterate
+              results['errors'].values() for the objects. The old
+              'passed' list is now 'passed_count'
 
         See Also:
-            GetCheckStatus, GetCheckResults, GetErrorCount, EnableCheck
+            RunChecks, RegisterCheck, GetCheckStatus, GetCheckResults
         """
         check_obj = self.__GetCheckObject(check_or_hvo)
 
@@ -569,22 +703,162 @@ class CheckOperations(BaseOperations):
         if not self.IsEnabled(check_obj):
             raise FP_ParameterError("Check must be enabled before running")
 
-        # Initialize results
-        results = {"errors": [], "warnings": [], "passed": [], "timestamp": datetime.now()}
+        return self._RunAndStore([check_obj], target_objects, incremental)[0]
 
-        # Get target objects if not specified
-        if target_objects is None:
-            target_objects = self._GetDefaultCheckTargets(check_obj)
+    @OperationsMethod
+    def RunChecks(self, checks=None, target_objects=None, incremental=False):
+        """
+        Run several consistency checks in a single pass over the data.
 
-        # Run the check (placeholder - actual implementation would vary by check type)
-        results = self._ExecuteCheck(check_obj, target_objects)
+        Each target entry and its senses are read once and fed to every
+        check, so running all six built-in checks costs roughly one walk
+        of the lexicon instead of six. Results are stored per check exactly
+        as RunCheck() stores them.
 
-        # Cache results
-        guid = check_obj.Guid
-        self._check_results[guid] = results
-        self._check_last_run[guid] = results["timestamp"]
+        Args:
+            checks (list, optional): Check type objects, HVOs or names to
+                run. If None, runs every enabled check.
+            target_objects (list, optional): Specific objects to check.
+                If None, checks all lexical entries in the project.
+            incremental (bool, optional): If True, only recheck objects
+                modified since the checks last ran (see RunCheck()).
+                Defaults to False.
+
+        Returns:
+            dict: Maps each check's name to its results dictionary (see
+                RunCheck()).
+
+        Raises:
+            FP_NullParameterError: If an item of checks is None.
+            FP_ParameterError: If a check type does not exist (including
+                an unknown check name), is invalid, or is not enabled.
 
-        return results
+        Example:
+            >>> names = ["Missing Gloss", "Missing Definition", "Missing Example"]
+            >>> all_results = project.Checks.RunChecks(names)
+            >>> for name, results in all_results.items():
+            ...     print(f"{name}: {len(results['errors'])} errors")
+
+        See Also:
+            RunCheck, GetEnabledChecks, GetCheckResults
+        """
+        if checks is None:
+            check_objs = list(self.GetEnabledChecks())
+        else:
+            check_objs = []
+            for check in checks:
+                if isinstance(check, str):
+                    check_obj = self.FindCheckType(check)
+                    if check_obj is None:
+                        raise FP_ParameterError(f"Unknown check type: '{check}'")
+                    check_objs.append(check_obj)
+                else:
+                    check_objs.append(self.__GetCheckObject(check))
+
+        for check_obj in check_objs:
+            if not self.IsEnabled(check_obj):
+                raise FP_ParameterError("Check must be enabled before running")
+
+        if not check_objs:
+            return {}
+
+        all_results = self._RunAndStore(check_objs, target_objects, incremental)
+
+        return {
+            self.GetName(check_obj): results
+            for check_obj, results in zip(check_objs, all_results)
+        }
+
+    @OperationsMethod
+    def RegisterCheck(self, name, check_func, grouping=False, severity="warning"):
+        """
+        Register the logic for a check type by name.
+
+        RunCheck() and RunChecks() look up each check type's name in this
+        registry. Registering a name that already exists (including a
+        built-in one) replaces its logic.
+
+        Args:
+            name (str): The check type name, matched exactly.
+            check_func (callable): Called as check_func(entry, senses,
+                wsHandle) for each ILexEntry, where senses is a list of the
+                entry's senses and wsHandle the default analysis writing
+                system. Returns "error", "warning", or None if the entry
+                passed. For a grouping check, returns a hashable key
+                instead, or None to leave the entry out.
+            grouping (bool, optional): If True, the check compares entries
+                with each other, like "Duplicate Entries": every entry that
+                shares its key with at least one other entry is reported
+                with the given severity. Defaults to False.
+            severity (str, optional): "error" or "warning", the severity of
+                a grouping check's issues. Defaults to "warning".
+
+        Raises:
+            FP_NullParameterError: If name or check_func is None.
+            FP_ParameterError: If check_func is not callable, or severity
+                is not "error" or "warning".
+
+        Example:
+            >>> def missing_citation(entry, senses, ws):
+            ...     if not entry.CitationForm.BestVernacularAlternative.Text:
+            ...         return "warning"
+            >>> project.Checks.RegisterCheck("Missing Citation Form", missing_citation)
+            >>> check = project.Checks.CreateCheckType("Missing Citation Form")
+            >>> project.Checks.EnableCheck(check)
+            >>> results = project.Checks.RunCheck(check)
+
+            >>> # Entries sharing a citation form
+            >>> def citation_key(entry, senses, ws):
+            ...     return entry.CitationForm.BestVernacularAlternative.Text or None
+            >>> project.Checks.RegisterCheck("Same Citation Form", citation_key, grouping=True)
+
+        Notes:
+            - Cached results of checks with this name are discarded, so the
+              next incremental run rechecks everything
+            - Grouping checks always see every target, so incremental runs
+              check them in full
+
+        See Also:
+            UnregisterCheck, RunCheck, RunChecks, FindDuplicateEntries
+        """
+        self._ValidateParam(name, "name")
+        self._ValidateParam(check_func, "check_func")
+        if not callable(check_func):
+            raise FP_ParameterError("check_func must be callable")
+        if severity not in ("error", "warning"):
+            raise FP_ParameterError("severity must be 'error' or 'warning'")
+
+        self._check_registry[name] = _GroupingCheck(check_func, severity) if grouping else check_func
+        self._ForgetResultsNamed(name)
+
+    @OperationsMethod
+    def UnregisterCheck(self, name):
+        """
+        Remove the logic registered for a check type name.
+
+        Args:
+            name (str): The check type name.
+
+        Returns:
+            bool: True if a check function was removed, False if none was
+                registered under that name.
+
+        Raises:
+            FP_NullParameterError: If name is None.
+
+        Example:
+            >>> project.Checks.UnregisterCheck("Missing Citation Form")
+            True
+
+        See Also:
+            RegisterCheck
+        """
+        self._ValidateParam(name, "name")
+
+        if self._check_registry.pop(name, None) is None:
+            return False
+        self._ForgetResultsNamed(name)
+        return True
 
     @OperationsMethod
     def GetCheckStatus(self, check_or_hvo):
@@ -679,8 +953,8 @@ class CheckOperations(BaseOperations):
         """
         Get the full results from the last check execution.
 
-        Retrieves all results including errors, warnings, and passed items
-        from the most recent run of the check.
+        Retrieves all results including errors, warnings, and the number of
+        passed items from the most recent run of the check.
 
         Args:
             check_or_hvo: Either an ICmPossibility check type object or its
@@ -688,9 +962,9 @@ class CheckOperations(BaseOperations):
 
         Returns:
             dict or None: Results dictionary containing:
-                - 'errors': list of error items
-                - 'warnings': list of warning items
-                - 'passed': list of items that passed
+                - 'errors': dict mapping HVO to each item with an error
+                - 'warnings': dict mapping HVO to each item with a warning
+                - 'passed_count': number of items that passed
                 - 'timestamp': datetime when check was run
             Returns None if check has never been run.
 
@@ -705,11 +979,16 @@ class CheckOperations(BaseOperations):
             >>> if results:
             ...     print(f"Errors: {len(results['errors'])}")
             ...     print(f"Warnings: {len(results['warnings'])}")
-            ...     print(f"Passed: {len(results['passed'])}")
+            ...     print(f"Passed: {results['passed_count']}")
             Errors: 15
             Warnings: 3
             Passed: 142
 
+        Notes:
+            - 'errors' and 'warnings' were lists up to 4.0.1: iterate
+              results['errors'].values() for the objects. The old
+              'passed' list is now 'passed_count'
+
         See Also:
             RunCheck, GetErrorCount, GetWarningCount
         """
@@ -999,9 +1278,9 @@ class CheckOperations(BaseOperations):
 
         items = []
         if issue_type in ["all", "errors"]:
-            items.extend(results.get("errors", []))
+            items.extend(results["errors"].values())
         if issue_type in ["all", "warnings"]:
-            items.extend(results.get("warnings", []))
+            items.extend(results["warnings"].values())
 
         return items
 
@@ -1016,7 +1295,8 @@ class CheckOperations(BaseOperations):
         Args:
             check_or_hvo: Either an ICmPossibility check type object or its
                 HVO (integer identifier).
-            obj: The object to get issues for (e.g., ILexEntry, IText, etc.).
+            obj: The object to get issues for (e.g., ILexEntry, IText, etc.),
+                or its HVO.
 
         Returns:
             list: List of issue descriptions for the object. Returns empty
@@ -1031,7 +1311,7 @@ class CheckOperations(BaseOperations):
             >>> project.Checks.RunCheck(check)
             >>>
             >>> # Get issues for a specific entry
-            >>> entry = list(project.LexiconGetAllEntries())[0]
+            >>> entry = list(project.LexiconAllEntries())[0]
             >>> issues = project.Checks.GetIssuesForObject(check, entry)
             >>> for issue in issues:
             ...     print(f"- {issue}")
@@ -1042,7 +1322,7 @@ class CheckOperations(BaseOperations):
             - Returns issues from most recent check execution only
             - Returns empty list if object passed the check
             - Issue descriptions are human-readable strings
-            - Useful for displaying issues in UI or reports
+            - Lookup is by HVO, so it is cheap enough to call per row in a UI
 
         See Also:
             FindItemsWithIssues, RunCheck, GetCheckResults
@@ -1056,22 +1336,70 @@ class CheckOperations(BaseOperations):
         if not results:
             return []
 
-        # Search for object in errors and warnings
+        hvo = obj if isinstance(obj, int) else getattr(obj, "Hvo", None)
+
         issues = []
-        for item in results.get("errors", []):
-            if hasattr(item, "Hvo") and hasattr(obj, "Hvo"):
-                if item.Hvo == obj.Hvo:
-                    issues.append(f"Error: {self._GetIssueDescription(item)}")
+        item = results["errors"].get(hvo)
+        if item is not None:
+            issues.append(f"Error: {self._GetIssueDescription(item)}")
 
-        for item in results.get("warnings", []):
-            if hasattr(item, "Hvo") and hasattr(obj, "Hvo"):
-                if item.Hvo == obj.Hvo:
-                    issues.append(f"Warning: {self._GetIssueDescription(item)}")
+        item = results["warnings"].get(hvo)
+        if item is not None:
+            issues.append(f"Warning: {self._GetIssueDescription(item)}")
 
         return issues
 
     # --- Metadata Methods ---
 
+    @OperationsMethod
+    def FindDuplicateEntries(self, match_pos=False, target_objects=None):
+        """
+        Find groups of lexical entries that duplicate each other.
+
+        Entries are grouped in a single pass by their normalized lexeme form
+        (see normalize_match_key; runs of whitespace are collapsed) and morph
+        type, and optionally by the set of parts of speech of their senses.
+        This is the same grouping used by the "Duplicate Entries" check, or
+        by "Duplicate Entries (Same POS)" when match_pos is True.
+
+        Args:
+            match_pos (bool, optional): If True, entries must also have the
+                same set of sense parts of speech to be duplicates.
+                Defaults to False.
+            target_objects (list, optional): Entries to compare. If None,
+                compares all lexical entries in the project.
+
+        Returns:
+            list: One list of ILexEntry objects per duplicate group (each
+                with two or more entries), in lexicon order.
+
+        Example:
+            >>> for group in project.Checks.FindDuplicateEntries(match_pos=True):
+            ...     print(", ".join(project.LexEntry.GetHeadword(e) for e in group))
+            bank1, bank2
+
+        Notes:
+            - Runs in linear time; no pairwise comparison of entries
+            - Entries without a lexeme form are ignored
+            - Homographs count as duplicates: review the groups to decide
+              which are genuinely separate words
+
+        See Also:
+            RunCheck, GetIssuesForObject
+        """
+        if target_objects is None:
+            target_objects = self._GetDefaultCheckTargets(None)
+
+        groups = {}
+        for obj in target_objects:
+            entry = obj if isinstance(obj, ILexEntry) else ILexEntry(obj)
+            senses = list(entry.SensesOS) if match_pos else []
+            key = _duplicate_entry_key(entry, senses, None, match_pos)
+            if key is not None:
+                groups.setdefault(key, []).append(entry)
+
+        return [members for members in groups.values() if len(members) > 1]
+
     @OperationsMethod
     def GetGuid(self, check_or_hvo):
         """
@@ -1205,9 +1533,69 @@ class CheckOperations(BaseOperations):
         Returns:
             list: List of default objects to check.
         """
-        # Default to all lexical entries
+        # Default to all lexical entries, streamed from the repository
         # Actual implementation would vary based on check type
-        return list(self.project.LexiconGetAllEntries())
+        return self.project.LexiconAllEntries()
+
+    def _RunAndStore(self, check_objs, target_objects, incremental):
+        """
+        Run check_objs over target_objects and cache the results.
+
+        Returns:
+            list: One results dictionary per check, in order.
+        """
+        if target_objects is None:
+            target_objects = self._GetDefaultCheckTargets(None)
+
+        selection = None
+        if incremental:
+            grouping = [c for c in check_objs if self._IsGroupingCheck(c)]
+            if grouping and len(grouping) < len(check_objs):
+                # Grouping checks compare entries with each other, so they
+                # always need every target: run them as their own full pass.
+                if iter(target_objects) is target_objects:
+                    target_objects = list(target_objects)
+                grouping_guids = {c.Guid for c in grouping}
+                per_entry = [c for c in check_objs if c.Guid not in grouping_guids]
+                results_by_guid = {}
+                for subset, subset_incremental in ((grouping, False), (per_entry, True)):
+                    subset_results = self._RunAndStore(subset, target_objects, subset_incremental)
+                    for check_obj, results in zip(subset, subset_results):
+                        results_by_guid[check_obj.Guid] = results
+                return [results_by_guid[c.Guid] for c in check_objs]
+            if not grouping:
+                selection = self._SelectModifiedTargets(check_objs, target_objects)
+        if selection is not None:
+            target_objects, total = selection
+
+        all_results = self._ExecuteChecks(check_objs, target_objects)
+
+        if selection is not None:
+            rechecked_hvos = {getattr(obj, "Hvo", None) for obj in target_objects}
+            all_results = [
+                self._MergeResults(
+                    self._check_results[check_obj.Guid], fresh, rechecked_hvos, total
+                )
+                for check_obj, fresh in zip(check_objs, all_results)
+            ]
+
+        for check_obj, results in zip(check_objs, all_results):
+            guid = check_obj.Guid
+            self._check_results[guid] = results
+            self._check_last_run[guid] = results["timestamp"]
+
+        return all_results
+
+    def _IsGroupingCheck(self, check_obj):
+        """Return True if check_obj's logic compares entries with each other."""
+        return isinstance(self._check_registry.get(self.GetName(check_obj)), _GroupingCheck)
+
+    def _ForgetResultsNamed(self, name):
+        """Drop cached results of every check type called name."""
+        for check_obj in self.GetAllCheckTypes():
+            if self.GetName(check_obj) == name:
+                self._check_results.pop(check_obj.Guid, None)
+                self._check_last_run.pop(check_obj.Guid, None)
 
     def _ExecuteCheck(self, check_obj, target_objects):
         """
@@ -1218,103 +1606,168 @@ class CheckOperations(BaseOperations):
             target_objects: List of objects to check.
 
         Returns:
-            dict: Results dictionary with errors, warnings, and passed items.
+            dict: Results dictionary with errors, warnings, and passed count.
+        """
+        return self._ExecuteChecks([check_obj], target_objects)[0]
 
-        Notes:
-            Implements common FLEx consistency checks:
-            - Missing Gloss (ERROR): Senses without glosses
-            - Missing Definition (WARNING): Senses without definitions
-            - Missing Example (WARNING): Senses without examples
-            - Missing Grammatical Info (ERROR): Senses without POS
-            - Duplicate Entries (WARNING): Entries with same lexeme form
-            - Missing Etymology (WARNING): Entries without etymology
-        """
-        results = {"errors": [], "warnings": [], "passed": [], "timestamp": datetime.now()}
-
-        # Get check name - use exact matching (Craig's pattern)
-        check_name = self.GetName(check_obj)
+    def _ExecuteChecks(self, check_objs, target_objects):
+        """
+        Execute several checks in a single traversal of the targets.
+
+        Each target entry, and its senses, are read once; every check is
+        then evaluated against that entry. Grouping checks collect a key per
+        entry and report the entries whose key is shared once the traversal
+        is complete.
+
+        Args:
+            check_objs: List of check type ICmPossibility objects.
+            target_objects: Iterable of objects to check.
+
+        Returns:
+            list: One results dictionary (errors, warnings, passed_count,
+                timestamp) per check, in the order of check_objs.
+        """
+        timestamp = datetime.now()
+        check_names = [self.GetName(check_obj) for check_obj in check_objs]
+        # Per check: key -> entries for grouping checks, None otherwise
+        all_groups = [
+            {} if isinstance(self._check_registry.get(name), _GroupingCheck) else None
+            for name in check_names
+        ]
+        all_results = [
+            {"errors": {}, "warnings": {}, "passed_count": 0, "timestamp": timestamp}
+            for _ in check_objs
+        ]
         wsHandle = self.project.project.DefaultAnalWs
 
-        # Perform check based on exact check type name
         for obj in target_objects:
+            # Ensure we're working with ILexEntry
+            if not isinstance(obj, ILexEntry):
+                try:
+                    obj = ILexEntry(obj)
+                except TypeError:
+                    # Object is not a lexical entry - skip it
+                    for results in all_results:
+                        results["passed_count"] += 1
+                    continue
+
+            entry = obj
             try:
-                # Ensure we're working with ILexEntry
-                if not isinstance(obj, ILexEntry):
-                    try:
-                        obj = ILexEntry(obj)
-                    except TypeError:
-                        # Object is not a lexical entry - skip it
-                        results["passed"].append(obj)
-                        continue
-
-                entry = obj
-                has_issue = False
-
-                # Use exact name matching for check types (Craig's pattern)
-                if check_name == "Missing Gloss":
-                    # ERROR: Senses without glosses
-                    for sense in entry.SensesOS:
-                        gloss_text = ITsString(sense.Gloss.get_String(wsHandle)).Text
-                        if not gloss_text or not gloss_text.strip():
-                            results["errors"].append(entry)
-                            has_issue = True
-                            break
-
-                elif check_name == "Missing Definition":
-                    # WARNING: Senses without definitions
-                    for sense in entry.SensesOS:
-                        def_text = ITsString(sense.Definition.get_String(wsHandle)).Text
-                        if not def_text or not def_text.strip():
-                            results["warnings"].append(entry)
-                            has_issue = True
-                            break
-
-                elif check_name == "Missing Example":
-                    # WARNING: Senses without examples
-                    for sense in entry.SensesOS:
-                        if sense.ExamplesOS.Count == 0:
-                            results["warnings"].append(entry)
-                            has_issue = True
-                            break
-
-                elif check_name == "Missing Grammatical Info" or check_name == "Missing Part of Speech":
-                    # ERROR: Senses without POS/MSA
-                    for sense in entry.SensesOS:
-                        if sense.MorphoSyntaxAnalysisRA is None:
-                            results["errors"].append(entry)
-                            has_issue = True
-                            break
-
-                elif check_name == "Duplicate Entries":
-                    # WARNING: Entries with same lexeme form lacking homograph numbers
-                    if hasattr(entry, "HomographNumber") and entry.HomographNumber == 0:
-                        results["warnings"].append(entry)
-                        has_issue = True
-
-                elif check_name == "Missing Etymology":
-                    # WARNING: Entries without etymology
-                    if entry.EtymologyOS.Count == 0:
-                        results["warnings"].append(entry)
-                        has_issue = True
-
+                senses = list(entry.SensesOS)
+            except (AttributeError, KeyError) as e:
+                logger.warning(f"Entry {obj} incompatible with checks: {e}")
+                for results in all_results:
+                    results["passed_count"] += 1
+                continue
+
+            for check_name, groups, results in zip(check_names, all_groups, all_results):
+                try:
+                    if groups is not None:
+                        key = self._check_registry[check_name].key_func(entry, senses, wsHandle)
+                        if key is not None:
+                            groups.setdefault(key, []).append(entry)
+                            continue
+                        severity = None
+                    else:
+                        severity = self._EvaluateCheck(check_name, entry, senses, wsHandle)
+                except (AttributeError, KeyError) as e:
+                    # Entry structure incompatible with this check type
+                    logger.warning(f"Entry {obj} incompatible with check '{check_name}': {e}")
+                    results["passed_count"] += 1
+                    continue
+                except Exception as e:
+                    # Unexpected error - this indicates a bug, don't hide it
+                    logger.error(f"Unexpected error checking entry {obj} with '{check_name}': {e}")
+                    raise
+
+                if severity == "error":
+                    results["errors"][entry.Hvo] = entry
+                elif severity == "warning":
+                    results["warnings"][entry.Hvo] = entry
                 else:
-                    # Unknown check type - mark as passed (don't fail on custom checks)
-                    pass
+                    results["passed_count"] += 1
+
+        for check_name, groups, results in zip(check_names, all_groups, all_results):
+            if groups is None:
+                continue
+            severity = self._check_registry[check_name].severity
+            issues = results["errors" if severity == "error" else "warnings"]
+            for members in groups.values():
+                if len(members) > 1:
+                    for entry in members:
+                        issues[entry.Hvo] = entry
+                else:
+                    results["passed_count"] += 1
 
-                # If no issue found, mark as passed
-                if not has_issue:
-                    results["passed"].append(entry)
+        return all_results
 
-            except (AttributeError, KeyError) as e:
-                # Entry structure incompatible with this check type
-                logger.warning(f"Entry {obj} incompatible with check '{check_name}': {e}")
-                results["passed"].append(obj)
-            except Exception as e:
-                # Unexpected error - this indicates a bug, don't hide it
-                logger.error(f"Unexpected error checking entry {obj} with '{check_name}': {e}")
-                raise
-
-        return results
+    def _EvaluateCheck(self, check_name, entry, senses, wsHandle):
+        """
+        Evaluate one check against one entry.
+
+        Args:
+            check_name (str): The check type name.
+            entry: The ILexEntry being checked.
+            senses (list): The entry's senses (already read from SensesOS).
+            wsHandle (int): Analysis writing system for text checks.
+
+        Returns:
+            str or None: "error", "warning", or None if the entry passed.
+        """
+        check_func = self._check_registry.get(check_name)
+        if check_func is None:
+            # Unknown check type - mark as passed (don't fail on custom checks)
+            return None
+        return check_func(entry, senses, wsHandle)
+
+    def _SelectModifiedTargets(self, check_objs, target_objects):
+        """
+        Narrow target_objects to those changed since the checks last ran.
+
+        Returns:
+            tuple or None: (modified targets, total number of targets), or
+                None if any check has no cached results (so a full run is
+                needed).
+        """
+        last_runs = []
+        for check_obj in check_objs:
+            guid = check_obj.Guid
+            if guid not in self._check_results or guid not in self._check_last_run:
+                return None
+            last_runs.append(self._check_last_run[guid])
+
+        since = _to_net_datetime(min(last_runs))
+        modified = []
+        total = 0
+        for obj in target_objects:
+            total += 1
+            date_modified = getattr(obj, "DateModified", None)
+            # Objects without a modification date are always rechecked
+            if date_modified is None or date_modified > since:
+                modified.append(obj)
+        return modified, total
+
+    def _MergeResults(self, cached, fresh, rechecked_hvos, total):
+        """
+        Merge the results of an incremental run into cached results.
+
+        Rechecked objects and objects that have since been deleted are
+        removed from the cached issues before the fresh ones are added.
+        Every target that is not an error or warning has passed, so the
+        passed count is derived from the total number of targets.
+        """
+        merged = {"timestamp": fresh["timestamp"]}
+        for key in ("errors", "warnings"):
+            issues = {
+                hvo: obj for hvo, obj in cached[key].items()
+                if hvo not in rechecked_hvos and getattr(obj, "IsValidObject", True)
+            }
+            issues.update(fresh[key])
+            merged[key] = issues
+        merged["passed_count"] = max(
+            0, total - len(merged["errors"]) - len(merged["warnings"])
+        )
+        return merged
 
     def _GetIssueDescription(self, obj):
         """
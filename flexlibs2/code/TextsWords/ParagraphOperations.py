@@ -8,6 +8,8 @@
 #   Copyright Craig Farrow, 2008 - 2025
 #
 
+import hashlib
+
 import clr
 
 clr.AddReference("System")
@@ -26,6 +28,8 @@ from ..FLExProject import (
     FP_ParameterError,
 )
 from ..BaseOperations import BaseOperations, OperationsMethod, wrap_enumerable
+from .._concordance import drop_from_concordance, refresh_concordance
+from .._occurrence_index import drop_from_occurrences, refresh_occurrences
 
 
 class ParagraphOperations(BaseOperations):
@@ -235,8 +239,12 @@ class ParagraphOperations(BaseOperations):
         owner = self._GetTypedOwner(para_obj)
         if owner is None:
             raise FP_ParameterError("Paragraph has no valid owner or cannot be removed")
+        para_hvo = para_obj.Hvo
         owner.ParagraphsOS.Remove(para_obj)
 
+        drop_from_concordance(self.project, [para_hvo])
+        drop_from_occurrences(self.project, [para_hvo])
+
     @OperationsMethod
     def Duplicate(self, item_or_hvo, insert_after=True, deep=True):
         """
@@ -575,6 +583,9 @@ class ParagraphOperations(BaseOperations):
         mkstr = TsStringUtils.MakeString(content_str, wsHandle)
         para_obj.Contents = mkstr
 
+        refresh_concordance(self.project, para_obj)
+        refresh_occurrences(self.project, para_obj)
+
     @OperationsMethod
     def GetSegments(self, paragraph_or_hvo):
         """
@@ -607,15 +618,46 @@ class ParagraphOperations(BaseOperations):
             - Returns empty list if the paragraph has no segments
             - Segments are created during text analysis
             - Use GetSegmentCount() for a quick count without creating a list
+            - Use IterSegments() to stop early without reading every segment
 
         See Also:
-            GetSegmentCount, GetText, Create
+            GetSegmentCount, IterSegments, GetText, Create
         """
         para_obj = self.__GetParagraphObject(paragraph_or_hvo)
 
         # Return list of segments
         return list(para_obj.SegmentsOS)
 
+    @OperationsMethod
+    def IterSegments(self, paragraph_or_hvo):
+        """
+        Iterate over the segments of a paragraph without building a list.
+
+        The paragraph is resolved and checked when this is called; the
+        returned iterator reads SegmentsOS on demand, so stopping early
+        (break, or itertools.islice) does not read the remaining segments.
+
+        Args:
+            paragraph_or_hvo: Either an IStTxtPara object or its HVO (integer identifier).
+
+        Returns:
+            iterator: ISegment objects, in order.
+
+        Raises:
+            FP_NullParameterError: If paragraph_or_hvo is None.
+            FP_ParameterError: If the paragraph does not exist or is invalid.
+
+        Example:
+            >>> first = next(project.Paragraphs.IterSegments(para), None)
+            >>> if first is not None:
+            ...     print(first.BaselineText.Text)
+
+        See Also:
+            GetSegments, GetSegmentCount, project.Texts.IterSegments
+        """
+        para_obj = self.__GetParagraphObject(paragraph_or_hvo)
+        return iter(para_obj.SegmentsOS)
+
     @OperationsMethod
     def GetSegmentCount(self, paragraph_or_hvo):
         """
@@ -653,6 +695,80 @@ class ParagraphOperations(BaseOperations):
         # Return segment count
         return para_obj.SegmentsOS.Count
 
+    @OperationsMethod
+    def GetFingerprint(self, paragraph_or_hvo):
+        """
+        Get a content fingerprint of a paragraph.
+
+        Hashes the paragraph text, each segment's offsets, the analyses
+        assigned to its words (AnalysesRS), and its free and literal
+        translations in every writing system. Any edit to these gives a
+        different fingerprint, so a stored fingerprint can tell a sync or
+        export tool whether the paragraph changed since it last looked.
+
+        Args:
+            paragraph_or_hvo: Either an IStTxtPara object or its HVO.
+
+        Returns:
+            str: A 40-character hex digest.
+
+        Raises:
+            FP_NullParameterError: If paragraph_or_hvo is None.
+            FP_ParameterError: If the paragraph does not exist or is invalid.
+
+        Example:
+            >>> fp = project.Paragraphs.GetFingerprint(para)
+            >>> if fp != saved_fingerprints.get(str(para.Guid)):
+            ...     export_paragraph(para)
+
+        Notes:
+            - Computing a fingerprint reads the whole paragraph: every
+              segment, analysis reference and translation. It saves the
+              export or sync work for unchanged paragraphs, not the reads
+            - Analyses are hashed by identity: assigning a different
+              analysis or gloss changes the fingerprint, but editing the
+              text of a gloss in the wordform inventory does not
+            - Fingerprints are stable across sessions for unchanged data:
+              translations are keyed by writing system tag, not handle
+
+        See Also:
+            project.Texts.GetFingerprint, project.Texts.GetManifest,
+            project.Wordforms.GetChecksum
+        """
+        para_obj = self.__GetParagraphObject(paragraph_or_hvo)
+
+        ws_tags = {}
+        digest = hashlib.sha1()
+        digest.update((ITsString(para_obj.Contents).Text or "").encode("utf-8"))
+        for segment in para_obj.SegmentsOS:
+            parts = [
+                "\x1e",
+                str(segment.BeginOffset),
+                str(segment.EndOffset),
+                ",".join(str(a.Guid) for a in segment.AnalysesRS),
+                self.__MultiStringKey(segment.FreeTranslation, ws_tags),
+                self.__MultiStringKey(segment.LiteralTranslation, ws_tags),
+            ]
+            digest.update("\x1f".join(parts).encode("utf-8"))
+        return digest.hexdigest()
+
+    def __MultiStringKey(self, multi_string, ws_tags):
+        """
+        All (ws tag, text) alternatives of an IMultiString, in a stable
+        order. Handles are per-session, so they are mapped to tags
+        (cached in ws_tags).
+        """
+        if multi_string is None:
+            return ""
+        alternatives = []
+        for i in range(multi_string.StringCount):
+            ts, ws = multi_string.GetStringFromIndex(i)
+            if ws not in ws_tags:
+                engine = self.project.project.WritingSystemFactory.get_EngineOrNull(ws)
+                ws_tags[ws] = engine.Id if engine is not None else str(ws)
+            alternatives.append(f"{ws_tags[ws]}={ts.Text or ''}")
+        return "\x1d".join(sorted(alternatives))
+
     @OperationsMethod
     def InsertAt(self, text_or_hvo, index, content, wsHandle=None):
         """
@@ -12,6 +12,8 @@
 #
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
+
 import clr
 
 clr.AddReference("System")
@@ -31,6 +33,10 @@ from ..FLExProject import (
     FP_ReadOnlyError,
 )
 from ..BaseOperations import BaseOperations, OperationsMethod, wrap_enumerable
+from .._concordance import _ConcordanceIndex, paragraph_segments, refresh_concordance
+from .._occurrence_index import refresh_occurrences
+from .._segment_checks import check_paragraph, check_segment_offsets
+from ..Shared.string_utils import changed_span, utf16_offset
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +45,10 @@ logger = logging.getLogger(__name__)
 # Use these instead of bare strings to avoid silent routing to the wrong branch.
 # ---------------------------------------------------------------------------
 
+# ValidateCorpus runs the checks in-process below this many paragraphs;
+# starting worker processes costs more than checking a small corpus.
+_PARALLEL_MIN_PARAGRAPHS = 500
+
 TRANSLATION_POLICY_MIGRATE = "migrate"
 TRANSLATION_POLICY_DISCARD = "discard"
 TRANSLATION_POLICY_REJECT = "reject"
@@ -292,8 +302,14 @@ class SegmentOperations(BaseOperations):
             >>> segment = segments[0]
             >>> project.Segments.SetBaselineText(segment, "In the beginning...")
 
+        Notes:
+            - Each call rewrites the paragraph Contents and re-runs the
+              analysis adjuster; to change several segments of one
+              paragraph, use SetBaselineTexts
+
         See Also:
-            GetBaselineText, SetFreeTranslation, SetLiteralTranslation
+            GetBaselineText, SetBaselineTexts, SetFreeTranslation,
+            SetLiteralTranslation
         """
         self._EnsureWriteEnabled()
         self._ValidateParam(segment_or_hvo, "segment_or_hvo")
@@ -306,10 +322,88 @@ class SegmentOperations(BaseOperations):
             raise FP_ParameterError("Segment has no owning paragraph; cannot write BaselineText")
         begin = segment_obj.BeginOffset
         end = segment_obj.EndOffset
-        bldr = para.Contents.GetBldr()
-        new_run = TsStringUtils.MakeString(text, ws)
-        bldr.ReplaceTsString(begin, end, new_run)
-        para.Contents = bldr.GetString()
+
+        with self._TransactionCM("Set baseline text"):
+            bldr = para.Contents.GetBldr()
+            new_run = TsStringUtils.MakeString(text, ws)
+            bldr.ReplaceTsString(begin, end, new_run)
+            para.Contents = bldr.GetString()
+
+        self.__RefreshIndexes(para)
+
+    @OperationsMethod
+    def SetBaselineTexts(self, paragraph_or_hvo, edits, wsHandle=None):
+        """
+        Set the baseline text of several segments of a paragraph at once.
+
+        Composes all the edits into one new Contents string and assigns it
+        once, so the paragraph is re-segmented once instead of once per
+        segment as with repeated SetBaselineText calls. Edits are applied
+        from the end of the paragraph backwards, so each segment's
+        offsets are still those it had before any edit.
+
+        Args:
+            paragraph_or_hvo: The IStTxtPara object or HVO.
+            edits: (segment_or_hvo, text) pairs, or a dict mapping
+                segment_or_hvo to text. Every segment must belong to the
+                paragraph.
+            wsHandle: Optional writing system handle. Defaults to vernacular WS.
+
+        Returns:
+            int: The number of segments whose text changed. Segments whose
+                text already equals the new text are left alone.
+
+        Raises:
+            FP_ReadOnlyError: If project is not opened with writeEnabled=True.
+            FP_NullParameterError: If paragraph_or_hvo or edits is None.
+            FP_ParameterError: If a segment is not in the paragraph or is
+                given more than once.
+
+        Example:
+            >>> para = project.Object(para_hvo)
+            >>> edits = {seg: convert(project.Segments.GetBaselineText(seg))
+            ...          for seg in project.Segments.GetAll(para)}
+            >>> project.Segments.SetBaselineTexts(para, edits)
+            3
+
+        See Also:
+            SetBaselineText, IncrementalReparse
+        """
+        self._EnsureWriteEnabled()
+        self._ValidateParam(paragraph_or_hvo, "paragraph_or_hvo")
+        self._ValidateParam(edits, "edits")
+
+        para = self.__GetParagraphObject(paragraph_or_hvo)
+        ws = self.__WSHandleVern(wsHandle)
+        if hasattr(edits, "items"):
+            edits = edits.items()
+
+        para_segments = {seg.Hvo for seg in para.SegmentsOS}
+        changes = {}
+        for segment_or_hvo, text in edits:
+            self._ValidateParam(segment_or_hvo, "segment_or_hvo")
+            seg = self.__GetSegmentObject(segment_or_hvo)
+            if seg.Hvo not in para_segments:
+                raise FP_ParameterError(f"Segment {seg.Hvo} is not in this paragraph")
+            if seg.Hvo in changes:
+                raise FP_ParameterError(f"Segment {seg.Hvo} is given more than once")
+            changes[seg.Hvo] = (seg, text or "")
+
+        # Validate everything before touching Contents; then skip no-ops.
+        pending = [(seg.BeginOffset, seg.EndOffset, text)
+                   for seg, text in changes.values()
+                   if self.GetBaselineText(seg) != text]
+        if not pending:
+            return 0
+
+        with self._TransactionCM("Set baseline texts"):
+            bldr = para.Contents.GetBldr()
+            for begin, end, text in sorted(pending, reverse=True):
+                bldr.ReplaceTsString(begin, end, TsStringUtils.MakeString(text, ws))
+            para.Contents = bldr.GetString()
+
+        self.__RefreshIndexes(para)
+        return len(pending)
 
     @OperationsMethod
     def GetFreeTranslation(self, segment_or_hvo, wsHandle=None):
@@ -560,6 +654,7 @@ class SegmentOperations(BaseOperations):
             # AnalysisAdjuster (fired by the Contents setter above) will set
             # seg.BeginOffset / seg.EndOffset when the paragraph is re-parsed.
 
+            self.__RefreshIndexes(para)
             return seg
 
     @OperationsMethod
@@ -595,6 +690,7 @@ class SegmentOperations(BaseOperations):
         if owner is None:
             raise FP_ParameterError("Segment has no owning paragraph")
         owner.SegmentsOS.Remove(segment_obj)
+        self.__RefreshIndexes(owner)
 
     @OperationsMethod
     def SplitSegment(self, segment_or_hvo, offset_within_segment):
@@ -670,6 +766,7 @@ class SegmentOperations(BaseOperations):
             new_seg = factory.Create()
             para.SegmentsOS.Insert(idx + 1, new_seg)
 
+            self.__RefreshIndexes(para)
             return (seg, new_seg)
 
     @OperationsMethod
@@ -810,6 +907,7 @@ class SegmentOperations(BaseOperations):
             if seg2 in list(para.SegmentsOS):
                 para.SegmentsOS.Remove(seg2)
 
+            self.__RefreshIndexes(para)
             return seg1
 
     def __MigrateTranslations(self, seg1, seg2):
@@ -895,13 +993,14 @@ class SegmentOperations(BaseOperations):
             Rebuilt 3 segments
 
         See Also:
-            SplitSegment, MergeSegments, AppendSentence
+            SplitSegment, MergeSegments, AppendSentence, IncrementalReparse
 
         Warning:
             This destroys all existing wordform analyses (AnalysesRS) on the
             paragraph. FreeTranslation, LiteralTranslation, and Notes are NOT
             cleared. Use SplitSegment or MergeSegments for non-destructive
-            structural edits.
+            structural edits, or IncrementalReparse to apply a text change
+            without touching unchanged segments.
         """
         self._EnsureWriteEnabled()
         self._ValidateParam(paragraph_or_hvo, "paragraph_or_hvo")
@@ -914,8 +1013,91 @@ class SegmentOperations(BaseOperations):
         snapshot = para.Contents
         para.Contents = snapshot
 
+        self.__RefreshIndexes(para)
         return para.SegmentsOS
 
+    @OperationsMethod
+    def IncrementalReparse(self, paragraph_or_hvo, new_text):
+        """
+        Change a paragraph's text, re-segmenting only what changed.
+
+        Compares the current Contents with new_text, finds the single
+        span where they differ, and replaces just that span. The Contents
+        setter then runs AnalysisAdjuster over the edited range only:
+        segments before and after the change keep their AnalysesRS,
+        translations and notes, and only the segments overlapping the
+        change are re-derived. Text outside the span keeps its writing
+        system and formatting.
+
+        Args:
+            paragraph_or_hvo: The IStTxtPara object or HVO.
+            new_text (str): The complete new text of the paragraph.
+
+        Returns:
+            dict: What was done:
+                - 'changed': bool - False if new_text equals the current text
+                  (nothing is written)
+                - 'start', 'end': the replaced span in the old text, in
+                  UTF-16 code units like segment offsets (None if
+                  unchanged)
+                - 'affected': list of HVOs of the segments that overlapped
+                  the change (their analyses may be re-derived)
+                - 'preserved': int - number of segments left untouched
+
+        Raises:
+            FP_ReadOnlyError: If project is not opened with writeEnabled=True.
+            FP_NullParameterError: If paragraph_or_hvo or new_text is None.
+
+        Example:
+            >>> para = project.Object(para_hvo)
+            >>> fixed = para.Contents.Text.replace(" ,", ",")
+            >>> result = project.Segments.IncrementalReparse(para, fixed)
+            >>> print(f"Re-derived {len(result['affected'])}, "
+            ...       f"kept {result['preserved']} segments")
+
+        Notes:
+            - Several separate edits are applied as one span running from
+              the first to the last difference; segments in between are
+              treated as affected. To change several segments' text
+              independently, use SetBaselineTexts
+
+        See Also:
+            ReparseParagraph, SetBaselineText, SetBaselineTexts
+        """
+        self._EnsureWriteEnabled()
+        self._ValidateParam(paragraph_or_hvo, "paragraph_or_hvo")
+        self._ValidateParam(new_text, "new_text")
+
+        para = self.__GetParagraphObject(paragraph_or_hvo)
+        segments = list(para.SegmentsOS)
+
+        old_text = para.Contents.Text or ""
+        span = changed_span(old_text, new_text)
+        if span is None:
+            return {"changed": False, "start": None, "end": None,
+                    "affected": [], "preserved": len(segments)}
+        start, old_end, new_end = span
+        inserted = new_text[start:new_end]
+        # changed_span() counts code points; segment offsets and the
+        # string builder count UTF-16 code units.
+        start, old_end = utf16_offset(old_text, start), utf16_offset(old_text, old_end)
+
+        # Segments touching the span, including ones that only share a
+        # boundary with it: an edit there can move that boundary.
+        affected = [seg.Hvo for seg in segments
+                    if seg.BeginOffset <= old_end and seg.EndOffset >= start]
+
+        with self._TransactionCM("Reparse paragraph"):
+            bldr = para.Contents.GetBldr()
+            # No text properties: the inserted run takes those of the
+            # neighbouring text.
+            bldr.Replace(start, old_end, inserted, None)
+            para.Contents = bldr.GetString()
+
+        self.__RefreshIndexes(para)
+        return {"changed": True, "start": start, "end": old_end,
+                "affected": affected, "preserved": len(segments) - len(affected)}
+
     # ========== QUERY/VALIDATION METHODS ==========
 
     @OperationsMethod
@@ -1104,56 +1286,220 @@ class SegmentOperations(BaseOperations):
             ...         print(f"Error: {error}")
 
         See Also:
-            ReparseParagraph, GetBeginOffset, GetEndOffset
+            ReparseParagraph, GetBeginOffset, GetEndOffset, ValidateCorpus
         """
         self._ValidateParam(paragraph_or_hvo, "paragraph_or_hvo")
 
         para_obj = self.__GetParagraphObject(paragraph_or_hvo)
         segments_list = list(para_obj.SegmentsOS)
 
-        errors = []
-        warnings = []
+        errors, warnings = check_segment_offsets([
+            (getattr(segment, "BeginOffset", None),
+             getattr(segment, "EndOffset", None),
+             self.GetBaselineText(segment))
+            for segment in segments_list
+        ])
+
+        return {"valid": not errors, "errors": errors, "warnings": warnings,
+                "segment_count": len(segments_list)}
+
+    @OperationsMethod
+    def ValidateCorpus(self, texts=None, workers=None, chunk_size=64):
+        """
+        Validate the segments of every paragraph in a corpus, optionally
+        using several processes.
+
+        Reads each paragraph's text length and segment offsets once (LCM
+        objects cannot leave the calling thread), then runs the
+        ValidateSegments checks on those plain values, in this process or
+        in a ProcessPoolExecutor. Also reports segments that extend past
+        the end of the paragraph text.
+
+        Args:
+            texts (iterable, optional): IText objects or HVOs to validate.
+                If None, validates all texts in the project.
+            workers (int, optional): Number of worker processes. None (the
+                default) or 1 runs the checks in this process. Corpora
+                under a few hundred paragraphs are always checked
+                in-process.
+            chunk_size (int): Paragraphs sent to a worker at a time.
+
+        Returns:
+            list: One dict per paragraph that has errors or warnings, with
+                keys 'text' and 'paragraph' (HVOs), 'valid', 'errors',
+                'warnings' and 'segment_count' (as for ValidateSegments).
+                An empty list means every paragraph passed.
+
+        Example:
+            >>> if __name__ == "__main__":
+            ...     issues = project.Segments.ValidateCorpus(workers=4)
+            ...     for rec in issues:
+            ...         for error in rec['errors']:
+            ...             print(rec['paragraph'], error)
+
+        Notes:
+            - Worker processes import the checks from flexlibs2, so each
+              one loads pythonnet and the FieldWorks assemblies before
+              doing any work; workers only pay off on large corpora. Scripts
+              that use workers must guard their entry point with
+              ``if __name__ == "__main__":`` (worker processes re-import
+              the main module on Windows)
+            - Paragraphs with no segments are reported with a warning,
+              as in ValidateSegments
+
+        See Also:
+            ValidateSegments
+        """
+        if texts is None:
+            texts = self.project.Texts.GetAll()
+
+        text_hvos = []
+        records = []
+        for text in texts:
+            if isinstance(text, int):
+                text = self.project.Object(text)
+            contents = text.ContentsOA
+            if contents is None:
+                continue
+            for para in contents.ParagraphsOS:
+                para = IStTxtPara(para)
+                segments = [
+                    (seg.BeginOffset, seg.EndOffset, len(self.GetBaselineText(seg)))
+                    for seg in para.SegmentsOS
+                ]
+                text_hvos.append(text.Hvo)
+                records.append((para.Hvo, para.Contents.Length, segments))
+
+        if workers is None or workers <= 1 or len(records) < _PARALLEL_MIN_PARAGRAPHS:
+            results = map(check_paragraph, records)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(check_paragraph, records, chunksize=chunk_size))
+
+        issues = []
+        for text_hvo, result in zip(text_hvos, results):
+            if result["errors"] or result["warnings"]:
+                result["text"] = text_hvo
+                issues.append(result)
+        return issues
+
+    # ========== CONCORDANCE METHODS ==========
+
+    @OperationsMethod
+    def BuildConcordance(self, texts=None, include_analyses=False):
+        """
+        Build the in-memory concordance (keyword-in-context) index.
+
+        Walks every paragraph and segment once and indexes the normalized
+        words of each baseline text with their offsets. The index is kept
+        on the project and updated automatically by the SegmentOperations
+        methods that edit text or segments (SetBaselineText(s),
+        AppendSentence, Delete, SplitSegment, MergeSegments and the
+        Reparse methods), by Paragraphs.SetText/Delete and by
+        Texts.Delete, so Concordance() queries do not walk the texts
+        again. Building replaces any previous index.
+
+        Args:
+            texts (iterable, optional): IText objects or HVOs to index. If
+                None, indexes all texts in the project.
+            include_analyses (bool): If True, also index the HVO of each
+                token's gloss and of the morph (MorphRA) of each of its
+                morph bundles, so Concordance() can be queried by HVO.
+
+        Returns:
+            int: The number of segments indexed.
+
+        Example:
+            >>> project.Segments.BuildConcordance(include_analyses=True)
+            1532
+            >>> for line in project.Segments.Concordance("water"):
+            ...     print(f"{line['left']:>40} [{line['match']}] {line['right']}")
 
-        if not segments_list:
-            warnings.append("Paragraph has no segments")
-            return {"valid": True, "errors": errors, "warnings": warnings, "segment_count": 0}
+        Notes:
+            - Words are runs of letters, combining marks and digits,
+              matched case-insensitively after NFD normalization
+            - Edits made outside SegmentOperations (e.g. assigning
+              para.Contents directly) are not seen; rebuild afterwards
+            - A transaction rollback, Undo() or Redo() discards the index,
+              since the edits it tracked may have been reversed
 
-        prev_end = -1
-        for i, segment in enumerate(segments_list):
-            if not hasattr(segment, "BeginOffset") or not hasattr(segment, "EndOffset"):
-                warnings.append(f"Segment {i} missing offset attributes")
+        See Also:
+            Concordance, DropConcordance
+        """
+        if texts is None:
+            texts = self.project.Texts.GetAll()
+
+        index = _ConcordanceIndex(include_analyses)
+        for text in texts:
+            if isinstance(text, int):
+                text = self.project.Object(text)
+            contents = text.ContentsOA
+            if contents is None:
                 continue
+            for para in contents.ParagraphsOS:
+                para = IStTxtPara(para)
+                index.index_paragraph(para.Hvo, paragraph_segments(para, include_analyses))
 
-            begin = segment.BeginOffset
-            end = segment.EndOffset
+        self.project._concordance = index
+        return len(index)
 
-            if begin < 0 or end < 0:
-                errors.append(f"Segment {i} has negative offset (begin={begin}, end={end})")
+    @OperationsMethod
+    def Concordance(self, query, width=40):
+        """
+        Find every occurrence of a word (or HVO) with its context.
 
-            if begin >= end:
-                errors.append(f"Segment {i} has invalid offsets (begin={begin} >= end={end})")
+        Builds the index with default options on first use if
+        BuildConcordance() has not been called.
 
-            if prev_end >= 0:
-                if begin > prev_end + 1:
-                    warnings.append(
-                        f"Gap between segment {i-1} and {i} "
-                        f"(prev_end={prev_end}, begin={begin})"
-                    )
-                elif begin < prev_end:
-                    errors.append(
-                        f"Overlap between segment {i-1} and {i} "
-                        f"(prev_end={prev_end}, begin={begin})"
-                    )
+        Args:
+            query: A word (str), matched after normalization, or a gloss or
+                morph HVO (int) if the index was built with
+                include_analyses=True.
+            width (int): Maximum number of context characters on each side.
 
-            baseline = self.GetBaselineText(segment)
-            if not baseline:
-                warnings.append(f"Segment {i} has empty baseline text")
+        Returns:
+            list: One dict per occurrence with keys:
+                - 'segment': segment HVO
+                - 'paragraph': paragraph HVO
+                - 'begin', 'end': offsets of the match within the paragraph,
+                  in UTF-16 code units (as ISegment.BeginOffset)
+                - 'left', 'match', 'right': the context before, the matched
+                  text, and the context after
+
+        Raises:
+            FP_NullParameterError: If query is None.
 
-            prev_end = end
+        Example:
+            >>> hits = project.Segments.Concordance("God", width=20)
+            >>> print(len(hits), hits[0]['left'], hits[0]['match'])
+            32 In the beginning  God
+
+        See Also:
+            BuildConcordance, GetBeginOffset, GetEndOffset
+        """
+        self._ValidateParam(query, "query")
 
-        valid = len(errors) == 0
+        index = getattr(self.project, "_concordance", None)
+        if index is None:
+            self.BuildConcordance()
+            index = self.project._concordance
+        return index.kwic(query, width)
+
+    @OperationsMethod
+    def DropConcordance(self):
+        """
+        Discard the concordance index and stop maintaining it.
+
+        See Also:
+            BuildConcordance
+        """
+        self.project._concordance = None
 
-        return {"valid": valid, "errors": errors, "warnings": warnings, "segment_count": len(segments_list)}
+    def __RefreshIndexes(self, para):
+        """Re-index an edited paragraph in the concordance and occurrence
+        indexes, for whichever of them covers it."""
+        refresh_concordance(self.project, para)
+        refresh_occurrences(self.project, para)
 
     # ========== SYNC INTEGRATION METHODS ==========
 
@@ -8,6 +8,9 @@
 #   Copyright Craig Farrow, 2008 - 2024
 #
 
+import hashlib
+import json
+
 import clr
 
 clr.AddReference("System")
@@ -34,6 +37,8 @@ from ..FLExProject import (
 )
 from ..BaseOperations import BaseOperations, OperationsMethod, wrap_enumerable
 from ..Shared.string_utils import normalize_match_key
+from .._concordance import drop_from_concordance
+from .._occurrence_index import drop_from_occurrences
 
 
 class TextOperations(BaseOperations):
@@ -205,11 +210,16 @@ class TextOperations(BaseOperations):
         self._EnsureWriteEnabled()
 
         text_obj = self.__GetTextObject(text_or_hvo)
+        contents = text_obj.ContentsOA
+        para_hvos = [para.Hvo for para in contents.ParagraphsOS] if contents else []
 
         # Remove from collection. See note in Create() about the LCM API
         # rename from TextsOC to Texts (issue #22).
         self.project.lp.Texts.Remove(text_obj)
 
+        drop_from_concordance(self.project, para_hvos)
+        drop_from_occurrences(self.project, para_hvos)
+
     @OperationsMethod
     def Duplicate(self, item_or_hvo, deep=True):
         """
@@ -461,9 +471,10 @@ class TextOperations(BaseOperations):
         """
         Get all texts in the project.
 
-        Returns a generator that yields IText objects. This is a wrapper around
+        Returns a lazy sequence of IText objects. This is a wrapper around
         the existing TextsGetAll method but returns the raw IText objects instead
-        of (name, content) tuples.
+        of (name, content) tuples. len() reads the repository Count without
+        enumerating the texts.
 
         Yields:
             IText: Each text object in the project.
@@ -474,14 +485,13 @@ class TextOperations(BaseOperations):
             ...     name = text.Name.BestAnalysisAlternative.Text
             ...     print(f"Text: {name}")
 
-            >>> # Get as list
-            >>> all_texts = list(project.Texts.GetAll())
-            >>> print(f"Total texts: {len(all_texts)}")
+            >>> # Count without enumerating
+            >>> print(f"Total texts: {len(project.Texts.GetAll())}")
 
         See Also:
             Create, Delete, Exists, project.TextsGetAll()
         """
-        return self.project.ObjectsIn(ITextRepository)
+        return self._RepositoryObjects(ITextRepository)
 
     @OperationsMethod
     def Find(self, title, wsHandle=None):
@@ -757,7 +767,7 @@ class TextOperations(BaseOperations):
             ...     print(f"Paragraph {i}: {content}")
 
         See Also:
-            GetContents, GetParagraphCount
+            GetContents, GetParagraphCount, IterParagraphs
         """
         text_obj = self.__GetTextObject(text_or_hvo)
         if text_obj.ContentsOA:
@@ -765,6 +775,75 @@ class TextOperations(BaseOperations):
             return [IStTxtPara(para) for para in text_obj.ContentsOA.ParagraphsOS]
         return []
 
+    @OperationsMethod
+    def IterParagraphs(self, text_or_hvo):
+        """
+        Iterate over the paragraphs of a text without building a list.
+
+        The text is resolved and checked when this is called; the
+        returned iterator then reads each paragraph of
+        ContentsOA.ParagraphsOS only when the caller asks for it, so
+        stopping early (break, or itertools.islice) never touches the
+        rest of the text.
+
+        Args:
+            text_or_hvo: Either an IText object or its HVO (integer identifier).
+
+        Returns:
+            iterator: IStTxtPara objects, in order.
+
+        Raises:
+            FP_NullParameterError: If text_or_hvo is None.
+            FP_ParameterError: If the HVO doesn't refer to a text object.
+
+        Example:
+            >>> from itertools import islice
+            >>> first = next(project.Texts.IterParagraphs(text), None)
+            >>> for para in islice(project.Texts.IterParagraphs(text), 3):
+            ...     print(para.Contents.Text)
+
+        See Also:
+            GetParagraphs, IterSegments
+        """
+        text_obj = self.__GetTextObject(text_or_hvo)
+        contents = text_obj.ContentsOA
+        if contents is None:
+            return iter(())
+        return (IStTxtPara(para) for para in contents.ParagraphsOS)
+
+    @OperationsMethod
+    def IterSegments(self, text_or_hvo):
+        """
+        Iterate over the segments (sentences) of a whole text, lazily.
+
+        The text is checked when this is called; the returned iterator
+        walks paragraphs and their SegmentsOS on demand, so previews such
+        as "the first N sentences of each text" stop reading as soon as
+        they have enough.
+
+        Args:
+            text_or_hvo: Either an IText object or its HVO (integer identifier).
+
+        Returns:
+            iterator: ISegment objects, in text order.
+
+        Raises:
+            FP_NullParameterError: If text_or_hvo is None.
+            FP_ParameterError: If the HVO doesn't refer to a text object.
+
+        Example:
+            >>> from itertools import islice
+            >>> for text in project.Texts.GetAll():
+            ...     preview = [project.Segments.GetBaselineText(seg)
+            ...                for seg in islice(project.Texts.IterSegments(text), 3)]
+            ...     print(" ".join(preview))
+
+        See Also:
+            IterParagraphs, IterInterlinear, project.Paragraphs.IterSegments
+        """
+        paragraphs = self.IterParagraphs(text_or_hvo)
+        return (segment for para in paragraphs for segment in para.SegmentsOS)
+
     @OperationsMethod
     def GetParagraphCount(self, text_or_hvo):
         """
@@ -797,6 +876,222 @@ class TextOperations(BaseOperations):
             return text_obj.ContentsOA.ParagraphsOS.Count
         return 0
 
+    @OperationsMethod
+    def GetFingerprint(self, text_or_hvo):
+        """
+        Get a content fingerprint of a text.
+
+        Combines the fingerprints of the text's paragraphs, in order (see
+        project.Paragraphs.GetFingerprint), so it changes whenever the
+        text's contents, segmentation, analysis assignments or
+        translations change, or when paragraphs are added, removed or
+        reordered.
+
+        Args:
+            text_or_hvo: Either an IText object or its HVO.
+
+        Returns:
+            str: A 40-character hex digest.
+
+        Raises:
+            FP_NullParameterError: If text_or_hvo is None.
+            FP_ParameterError: If the HVO doesn't refer to a text object.
+
+        Example:
+            >>> fp = project.Texts.GetFingerprint(text)
+
+        Notes:
+            - Reads every paragraph and segment of the text each time; the
+              fingerprint saves export or sync work, not corpus reads
+            - The title, genre and other metadata are not included
+            - A text with no contents has the fingerprint of an empty text
+
+        See Also:
+            GetManifest, project.Paragraphs.GetFingerprint
+        """
+        text_obj = self.__GetTextObject(text_or_hvo)
+
+        digest = hashlib.sha1()
+        if text_obj.ContentsOA:
+            paragraphs = self.project.Paragraphs
+            for para in text_obj.ContentsOA.ParagraphsOS:
+                digest.update(paragraphs.GetFingerprint(IStTxtPara(para)).encode("ascii"))
+        return digest.hexdigest()
+
+    @OperationsMethod
+    def GetManifest(self, texts=None):
+        """
+        Get the fingerprints of many texts, keyed by text GUID.
+
+        Store the manifest after an export or sync; next time, compare a
+        fresh manifest with it and process only the texts whose
+        fingerprint changed or is new. GUIDs are used as keys because,
+        unlike HVOs, they are stable across sessions and copies of a
+        project.
+
+        Args:
+            texts (iterable, optional): IText objects or HVOs. If None,
+                includes all texts in the project.
+
+        Returns:
+            dict: Text GUID (str) -> fingerprint (str).
+
+        Example:
+            >>> old = json.load(open("manifest.json"))
+            >>> new = project.Texts.GetManifest()
+            >>> changed = [guid for guid, fp in new.items() if old.get(guid) != fp]
+            >>> deleted = old.keys() - new.keys()
+            >>> json.dump(new, open("manifest.json", "w"))
+
+        Notes:
+            - Building a manifest is one full read of the texts (see
+              GetFingerprint). What it saves is re-exporting unchanged
+              texts
+
+        See Also:
+            GetFingerprint, ExportInterlinearJSONL
+        """
+        if texts is None:
+            texts = self.GetAll()
+
+        manifest = {}
+        for text in texts:
+            text_obj = self.__GetTextObject(text)
+            manifest[str(text_obj.Guid)] = self.GetFingerprint(text_obj)
+        return manifest
+
+    @OperationsMethod
+    def IterInterlinear(self, texts=None, wsHandle=None):
+        """
+        Stream the interlinear corpus one segment at a time.
+
+        The texts are resolved and checked when this is called; the
+        returned iterator then walks their paragraphs and segments in
+        order and produces one record per segment. Only the current
+        segment's record is held in memory, so the whole corpus can be
+        processed without building per-text strings or lists first
+        (compare project.TextsGetAll()).
+
+        Args:
+            texts (iterable, optional): IText objects or HVOs to walk. If
+                None, walks all texts in the project.
+            wsHandle: Optional writing system handle for the free and
+                literal translations. Defaults to the analysis WS.
+
+        Returns:
+            iterator: JSON-serializable dicts, one per segment, with keys:
+                - 'text': text HVO
+                - 'paragraph': paragraph HVO
+                - 'paragraph_index': index of the paragraph in the text
+                - 'segment': segment HVO
+                - 'segment_index': index of the segment in the paragraph
+                - 'baseline': baseline text of the segment
+                - 'free_translation': free translation ('' if not set)
+                - 'literal_translation': literal translation ('' if not set)
+                - 'tokens': list of dicts, one per analysis in the segment,
+                  with 'wordform', 'analysis' and 'gloss' HVOs (None where
+                  the token is not analyzed to that level) and
+                  'morph_bundles', a list of morph bundle HVOs. Punctuation
+                  tokens have a None wordform.
+
+        Raises:
+            FP_NullParameterError: If an item of texts is None.
+            FP_ParameterError: If an HVO in texts is not a text.
+
+        Example:
+            >>> for rec in project.Texts.IterInterlinear():
+            ...     glossed = sum(1 for t in rec['tokens'] if t['gloss'])
+            ...     print(rec['segment'], rec['baseline'], glossed)
+
+        See Also:
+            ExportInterlinearJSONL, GetParagraphs, project.TextsGetAll()
+        """
+        if texts is None:
+            texts = self.GetAll()
+        text_objs = [self.__GetTextObject(text) for text in texts]
+        return self.__InterlinearRecords(text_objs, wsHandle)
+
+    def __InterlinearRecords(self, text_objs, wsHandle):
+        segments = self.project.Segments
+        for text_obj in text_objs:
+            for para_index, para in enumerate(self.IterParagraphs(text_obj)):
+                for seg_index, segment in enumerate(para.SegmentsOS):
+                    yield {
+                        "text": text_obj.Hvo,
+                        "paragraph": para.Hvo,
+                        "paragraph_index": para_index,
+                        "segment": segment.Hvo,
+                        "segment_index": seg_index,
+                        "baseline": segments.GetBaselineText(segment),
+                        "free_translation": segments.GetFreeTranslation(segment, wsHandle),
+                        "literal_translation": segments.GetLiteralTranslation(segment, wsHandle),
+                        "tokens": [self.__TokenRecord(a) for a in segment.AnalysesRS],
+                    }
+
+    @staticmethod
+    def __TokenRecord(token):
+        """Return the HVOs for one segment analysis (IAnalysis)."""
+        wordform = token.Wordform
+        analysis = token.Analysis
+        return {
+            "wordform": wordform.Hvo if wordform is not None else None,
+            "analysis": analysis.Hvo if analysis is not None else None,
+            "gloss": token.Hvo if token.ClassName == "WfiGloss" else None,
+            "morph_bundles": ([mb.Hvo for mb in analysis.MorphBundlesOS]
+                              if analysis is not None else []),
+        }
+
+    @OperationsMethod
+    def ExportInterlinearJSONL(self, destination, texts=None, wsHandle=None):
+        """
+        Write the interlinear corpus as JSON lines, one segment per line.
+
+        Records come from IterInterlinear() and are written as they are
+        produced, so memory use does not grow with the size of the corpus.
+
+        Args:
+            destination: A file path, or a writable text file object.
+            texts (iterable, optional): IText objects or HVOs to export. If
+                None, exports all texts in the project.
+            wsHandle: Optional writing system handle for the translations.
+                Defaults to the analysis WS.
+
+        Returns:
+            int: The number of segment records written.
+
+        Raises:
+            FP_NullParameterError: If destination, or an item of texts, is
+                None.
+            FP_ParameterError: If an HVO in texts is not a text.
+
+        Example:
+            >>> n = project.Texts.ExportInterlinearJSONL("corpus.jsonl")
+            >>> print(f"Exported {n} segments")
+
+        Notes:
+            - Every text is checked before the destination file is opened,
+              so a bad HVO does not leave an existing file truncated
+
+        See Also:
+            IterInterlinear
+        """
+        self._ValidateParam(destination, "destination")
+        records = self.IterInterlinear(texts, wsHandle)
+
+        if hasattr(destination, "write"):
+            return self.__WriteJSONL(destination, records)
+        with open(destination, "w", encoding="utf-8") as f:
+            return self.__WriteJSONL(f, records)
+
+    @staticmethod
+    def __WriteJSONL(stream, records):
+        count = 0
+        for record in records:
+            stream.write(json.dumps(record, ensure_ascii=False))
+            stream.write("\n")
+            count += 1
+        return count
+
     @OperationsMethod
     def GetMediaFiles(self, text_or_hvo):
         """
@@ -35,10 +35,12 @@ from ..FLExProject import (
     FP_ParameterError,
 )
 from ..BaseOperations import BaseOperations, OperationsMethod, wrap_enumerable
+from .._occurrence_index import reindex_segments, segments_using
 
 # --- Approval Status Enum ---
 
 import enum
+from collections import namedtuple
 
 
 class ApprovalStatusTypes(enum.IntEnum):
@@ -90,6 +92,35 @@ def _coerce_approval_status(status):
     )
 
 
+AnalysisStatusRow = namedtuple(
+    "AnalysisStatusRow",
+    ("hvo", "wordform", "status", "parser_status", "gloss_count", "bundle_count"),
+)
+AnalysisStatusRow.__doc__ = """
+One row of ``WfiAnalysisOperations.GetStatusTable``.
+
+Fields:
+    hvo (int): HVO of the analysis.
+    wordform (int): HVO of the owning wordform.
+    status (ApprovalStatusTypes): Human approval status, as returned by
+        GetApprovalStatus.
+    parser_status (ApprovalStatusTypes): The same, from parser (non-human)
+        evaluations only.
+    gloss_count (int): Number of glosses (MeaningsOC).
+    bundle_count (int): Number of morph bundles (MorphBundlesOS).
+"""
+
+
+def _status_from_opinions(opinions):
+    """Fold (approves) flags the way GetApprovalStatus does: any approval
+    wins, otherwise any disapproval, otherwise unapproved."""
+    if True in opinions:
+        return ApprovalStatusTypes.APPROVED
+    if False in opinions:
+        return ApprovalStatusTypes.DISAPPROVED
+    return ApprovalStatusTypes.UNAPPROVED
+
+
 # --- WfiAnalysisOperations Class ---
 
 
@@ -413,7 +444,15 @@ class WfiAnalysisOperations(BaseOperations):
         # returns analysis.Owner as the base ICmObject, which has no
         # AnalysesOC; cast to IWfiWordform first (issue #32).
         wordform = IWfiWordform(analysis.Owner)
+        # Segments citing the analysis or its glosses are re-pointed by
+        # LCM; refresh them in the occurrence index, if there is one,
+        # afterwards.
+        affected = []
+        if self.project._occurrences is not None:
+            affected = segments_using(
+                self.project, [analysis.Hvo] + [g.Hvo for g in analysis.MeaningsOC])
         wordform.AnalysesOC.Remove(analysis)
+        reindex_segments(self.project, affected)
 
     @OperationsMethod
     def Duplicate(self, item_or_hvo, insert_after=False, deep=False):
@@ -1410,6 +1449,86 @@ class WfiAnalysisOperations(BaseOperations):
 
         return list(analysis.EvaluationsRC)
 
+    # --- Bulk Operations ---
+
+    @OperationsMethod
+    def GetStatusTable(self, wordforms=None):
+        """
+        Get the approval status and size of many analyses in one pass.
+
+        Resolves the project's agents and their approve/disapprove
+        evaluations once, then reads each analysis's evaluations, gloss
+        count and morph bundle count. Calling GetApprovalStatus,
+        IsComputerApproved, GetGlossCount and GetMorphBundleCount per
+        analysis resolves the evaluating agent separately on every call.
+
+        Args:
+            wordforms (iterable, optional): IWfiWordform objects or HVOs
+                whose analyses to report. If None, reports every analysis
+                in the project.
+
+        Returns:
+            list: One AnalysisStatusRow per analysis, with fields hvo,
+                wordform, status, parser_status, gloss_count and
+                bundle_count.
+
+        Example:
+            >>> rows = project.WfiAnalyses.GetStatusTable()
+            >>> parsed = sum(1 for r in rows
+            ...              if r.parser_status == ApprovalStatusTypes.APPROVED)
+            >>> print(f"Parser approved {parsed} of {len(rows)} analyses")
+            >>> unreviewed = [r.hvo for r in rows
+            ...               if r.status == ApprovalStatusTypes.UNAPPROVED]
+
+        Notes:
+            - status uses human evaluations only, like GetApprovalStatus
+            - parser_status uses parser evaluations only, like
+              IsComputerApproved (APPROVED means IsComputerApproved is True)
+
+        See Also:
+            GetApprovalStatus, IsHumanApproved, IsComputerApproved,
+            GetGlossCount, GetMorphBundleCount
+        """
+        # Evaluation HVO -> (human, approves). Each agent owns one
+        # approving and one disapproving evaluation that it references
+        # from every analysis it has an opinion on.
+        opinions_by_eval = {}
+        for agent in self.project.lp.AnalyzingAgentsOC:
+            human = bool(agent.Human)
+            if agent.ApprovesOA is not None:
+                opinions_by_eval[agent.ApprovesOA.Hvo] = (human, True)
+            if agent.DisapprovesOA is not None:
+                opinions_by_eval[agent.DisapprovesOA.Hvo] = (human, False)
+
+        if wordforms is None:
+            analyses = self._RepositoryObjects(IWfiAnalysisRepository)
+        else:
+            analyses = (analysis
+                        for wordform in wordforms
+                        for analysis in self.__GetWordformObject(wordform).AnalysesOC)
+
+        rows = []
+        for analysis in analyses:
+            human_opinions = set()
+            parser_opinions = set()
+            for evaluation in analysis.EvaluationsRC:
+                opinion = opinions_by_eval.get(evaluation.Hvo)
+                if opinion is None:
+                    # Not owned by a known agent; read the flags directly.
+                    opinion = (evaluation.Human, evaluation.Approves)
+                human, approves = opinion
+                (human_opinions if human else parser_opinions).add(bool(approves))
+
+            rows.append(AnalysisStatusRow(
+                analysis.Hvo,
+                analysis.Owner.Hvo,
+                _status_from_opinions(human_opinions),
+                _status_from_opinions(parser_opinions),
+                analysis.MeaningsOC.Count,
+                analysis.MorphBundlesOS.Count,
+            ))
+        return rows
+
     # --- Utility Operations ---
 
     @OperationsMethod
@@ -28,6 +28,7 @@ from ..FLExProject import (
     FP_ParameterError,
 )
 from ..BaseOperations import BaseOperations, OperationsMethod, wrap_enumerable
+from .._occurrence_index import reindex_segments, segments_using
 from ..Shared.string_utils import normalize_match_key
 
 # --- WfiGlossOperations Class ---
@@ -334,8 +335,13 @@ class WfiGlossOperations(BaseOperations):
         # cast unconditionally to surface the typed collection accessor.
         analysis = IWfiAnalysis(gloss.Owner)
 
-        # Remove from analysis's Meanings collection
+        # Remove from analysis's Meanings collection, then refresh the
+        # segments that cited the gloss in the occurrence index, if any.
+        affected = []
+        if self.project._occurrences is not None:
+            affected = segments_using(self.project, [gloss.Hvo])
         analysis.MeaningsOC.Remove(gloss)
+        reindex_segments(self.project, affected)
 
     @OperationsMethod
     def Duplicate(self, item_or_hvo, insert_after=False):
@@ -12,6 +12,7 @@
 #
 
 import logging
+from collections import Counter
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,8 @@ from SIL.LCModel import (
     IWfiAnalysisFactory,
     IWfiGlossFactory,
     IWfiMorphBundleFactory,
+    IStTxtPara,
+    IText,
 )
 
 from SIL.LCModel.Core.KernelInterfaces import ITsString
@@ -36,6 +39,12 @@ from ..FLExProject import (
 )
 from ..BaseOperations import BaseOperations, OperationsMethod, wrap_enumerable
 from ..Shared.string_utils import normalize_match_key
+from .._occurrence_index import (
+    _OccurrenceIndex,
+    reindex_segments,
+    segment_keys,
+    segments_using,
+)
 
 # --- Spelling Status Enum ---
 
@@ -99,6 +108,23 @@ class WordformOperations(BaseOperations):
             return self.project.project.DefaultVernWs
         return self.project._FLExProject__WSHandle(wsHandle, self.project.project.DefaultVernWs)
 
+    def __GetTextObject(self, text_or_hvo):
+        """
+        Resolve an item of a texts= argument to an IText object.
+
+        Raises:
+            FP_NullParameterError: If text_or_hvo is None.
+            FP_ParameterError: If the HVO doesn't refer to a text object.
+        """
+        self._ValidateParam(text_or_hvo, "text_or_hvo")
+
+        if isinstance(text_or_hvo, int):
+            obj = self.project.Object(text_or_hvo)
+            if not isinstance(obj, IText):
+                raise FP_ParameterError(f"HVO {text_or_hvo} does not refer to a text object")
+            return obj
+        return text_or_hvo
+
     @wrap_enumerable
     @OperationsMethod
     def GetAll(self):
@@ -117,14 +143,16 @@ class WordformOperations(BaseOperations):
             ...     print(form)
 
         Notes:
-            - Returns an iterator for memory efficiency with large projects
+            - Returns a lazy sequence: iteration streams from the repository,
+              len() reads the repository Count, and indexing or slicing
+              stop enumerating early
             - Wordforms are returned in database order (not alphabetical)
             - Use GetForm() to access the surface text
 
         See Also:
             Find, Create, GetForm
         """
-        return self.project.ObjectsIn(IWfiWordformRepository)
+        return self._RepositoryObjects(IWfiWordformRepository)
 
     @OperationsMethod
     def Create(self, form, wsHandle=None):
@@ -209,8 +237,18 @@ class WordformOperations(BaseOperations):
         else:
             wordform = wordform_or_hvo
 
-        # LCM Delete() removes the object from the repository
+        # LCM Delete() removes the object from the repository. Listing the
+        # analyses and glosses is only worth it if an occurrence index is
+        # being kept current.
+        affected = []
+        if self.project._occurrences is not None:
+            affected = segments_using(
+                self.project,
+                [wordform.Hvo]
+                + [a.Hvo for a in wordform.AnalysesOC]
+                + [g.Hvo for a in wordform.AnalysesOC for g in a.MeaningsOC])
         wordform.Delete()
+        reindex_segments(self.project, affected)
 
     @OperationsMethod
     def Exists(self, form, wsHandle=None):
@@ -520,7 +558,7 @@ class WordformOperations(BaseOperations):
             - Each occurrence represents a token in a text segment
 
         See Also:
-            GetOccurrences, GetAll
+            GetOccurrences, GetCorpusFrequencies, GetAll
         """
         # Resolve to wordform object
         if isinstance(wordform_or_hvo, int):
@@ -574,6 +612,225 @@ class WordformOperations(BaseOperations):
 
         return list(wordform.OccurrencesInTexts)
 
+    @OperationsMethod
+    def GetCorpusFrequencies(self, texts=None):
+        """
+        Count wordform tokens across the corpus in a single pass.
+
+        Walks every segment of every text once, reading each token's
+        wordform from the segment's analyses, instead of computing
+        OccurrencesInTexts separately for each wordform.
+
+        Args:
+            texts (iterable, optional): IText objects or HVOs to count. If
+                None, counts all texts in the project.
+
+        Returns:
+            dict: Frequency tables, keyed by HVO:
+                - 'tokens': total number of wordform tokens
+                - 'wordforms': Counter of wordform HVO -> token count
+                - 'by_text': dict of text HVO -> Counter of wordform HVO
+                - 'by_genre': dict of genre HVO -> Counter of wordform HVO;
+                  texts without a genre are counted under None, and a text
+                  with several genres counts toward each of them
+
+        Raises:
+            FP_NullParameterError: If an item of texts is None.
+            FP_ParameterError: If an HVO in texts is not a text.
+
+        Example:
+            >>> freq = project.Wordforms.GetCorpusFrequencies()
+            >>> for hvo, count in freq['wordforms'].most_common(10):
+            ...     wf = project.Object(hvo)
+            ...     print(f"{project.Wordforms.GetForm(wf)}: {count}")
+            the: 1523
+            and: 987
+
+        Notes:
+            - Punctuation tokens are not counted
+            - A token counts for its wordform whether it is unanalyzed or
+              has an analysis or gloss
+            - Counts are per wordform object, so forms that differ only in
+              case ("The", "the") are counted separately, as FLEx keeps
+              them as separate wordforms
+            - Cost is one linear pass over the corpus segments
+
+        See Also:
+            GetOccurrenceCount, GetOccurrences
+        """
+        if texts is None:
+            texts = self.project.Texts.GetAll()
+
+        totals = Counter()
+        by_text = {}
+        by_genre = {}
+
+        for text in texts:
+            text = self.__GetTextObject(text)
+
+            counts = Counter()
+            contents = text.ContentsOA
+            if contents is not None:
+                for para in contents.ParagraphsOS:
+                    for segment in IStTxtPara(para).SegmentsOS:
+                        for analysis in segment.AnalysesRS:
+                            wordform = analysis.Wordform
+                            if wordform is not None:
+                                counts[wordform.Hvo] += 1
+
+            by_text[text.Hvo] = counts
+            totals.update(counts)
+            genre_hvos = [genre.Hvo for genre in text.GenresRC] or [None]
+            for genre_hvo in genre_hvos:
+                by_genre.setdefault(genre_hvo, Counter()).update(counts)
+
+        return {
+            "tokens": sum(totals.values()),
+            "wordforms": totals,
+            "by_text": by_text,
+            "by_genre": by_genre,
+        }
+
+    @OperationsMethod
+    def BuildOccurrenceIndex(self, texts=None):
+        """
+        Build the occurrence index used by GetIndexedOccurrences().
+
+        Walks every segment once and records, for each wordform, analysis
+        and gloss HVO, which segments reference it and how often. The
+        index is kept on the project and patched by the operations that
+        change segment analyses: the SegmentOperations text and segment
+        edits, Paragraphs.SetText/Delete, Texts.Delete, and Delete in
+        WfiAnalysisOperations, WfiGlossOperations and
+        WordformOperations. Building replaces any previous index.
+
+        Args:
+            texts (iterable, optional): IText objects or HVOs to index. If
+                None, indexes all texts in the project.
+
+        Returns:
+            int: The number of segments indexed.
+
+        Raises:
+            FP_NullParameterError: If an item of texts is None.
+            FP_ParameterError: If an HVO in texts is not a text.
+
+        Example:
+            >>> project.Wordforms.BuildOccurrenceIndex()
+            1532
+            >>> wf = project.Wordforms.Find("running")
+            >>> project.Wordforms.GetIndexedOccurrenceCount(wf)
+            12
+
+        Notes:
+            - Changes made directly through LCM (rather than through these
+              operations) are not seen; rebuild afterwards
+            - A transaction rollback, Undo() or Redo() discards the index,
+              since the edits it tracked may have been reversed
+
+        See Also:
+            GetIndexedOccurrences, GetIndexedOccurrenceCount, DropOccurrenceIndex
+        """
+        if texts is None:
+            texts = self.project.Texts.GetAll()
+
+        index = _OccurrenceIndex()
+        for text in texts:
+            text = self.__GetTextObject(text)
+            contents = text.ContentsOA
+            if contents is None:
+                continue
+            for para in contents.ParagraphsOS:
+                para = IStTxtPara(para)
+                index.index_paragraph(
+                    para.Hvo, [(seg.Hvo, segment_keys(seg)) for seg in para.SegmentsOS])
+
+        self.project._occurrences = index
+        return len(index)
+
+    def __OccurrenceIndex(self):
+        index = getattr(self.project, "_occurrences", None)
+        if index is None:
+            self.BuildOccurrenceIndex()
+            index = self.project._occurrences
+        return index
+
+    @OperationsMethod
+    def GetIndexedOccurrences(self, item_or_hvo):
+        """
+        Get the segments where a wordform, analysis or gloss occurs.
+
+        Answers from the occurrence index (built on first use if
+        BuildOccurrenceIndex() has not been called) instead of scanning
+        the corpus as GetOccurrences() does.
+
+        Args:
+            item_or_hvo: An IWfiWordform, IWfiAnalysis or IWfiGloss, or
+                its HVO.
+
+        Returns:
+            list: HVOs of the segments that use the item, each listed once.
+
+        Raises:
+            FP_NullParameterError: If item_or_hvo is None.
+
+        Example:
+            >>> for seg_hvo in project.Wordforms.GetIndexedOccurrences(gloss):
+            ...     seg = project.Object(seg_hvo)
+            ...     print(project.Segments.GetBaselineText(seg))
+
+        Notes:
+            - An analysis occurs wherever it or one of its glosses is
+              assigned; a wordform wherever any of its analyses is, or it
+              is unanalyzed
+
+        See Also:
+            GetIndexedOccurrenceCount, BuildOccurrenceIndex, GetOccurrences
+        """
+        self._ValidateParam(item_or_hvo, "item_or_hvo")
+        hvo = item_or_hvo if isinstance(item_or_hvo, int) else item_or_hvo.Hvo
+        return self.__OccurrenceIndex().segments(hvo)
+
+    @OperationsMethod
+    def GetIndexedOccurrenceCount(self, item_or_hvo):
+        """
+        Count the tokens of a wordform, analysis or gloss in the corpus.
+
+        A constant-time lookup in the occurrence index (built on first use
+        if BuildOccurrenceIndex() has not been called), suitable for "used
+        in N places" counters.
+
+        Args:
+            item_or_hvo: An IWfiWordform, IWfiAnalysis or IWfiGloss, or
+                its HVO.
+
+        Returns:
+            int: The number of tokens that use the item.
+
+        Raises:
+            FP_NullParameterError: If item_or_hvo is None.
+
+        Example:
+            >>> count = project.Wordforms.GetIndexedOccurrenceCount(analysis)
+            >>> print(f"Used in {count} places")
+
+        See Also:
+            GetIndexedOccurrences, GetOccurrenceCount
+        """
+        self._ValidateParam(item_or_hvo, "item_or_hvo")
+        hvo = item_or_hvo if isinstance(item_or_hvo, int) else item_or_hvo.Hvo
+        return self.__OccurrenceIndex().count(hvo)
+
+    @OperationsMethod
+    def DropOccurrenceIndex(self):
+        """
+        Discard the occurrence index and stop maintaining it.
+
+        See Also:
+            BuildOccurrenceIndex
+        """
+        self.project._occurrences = None
+
     @OperationsMethod
     def GetChecksum(self, wordform_or_hvo):
         """
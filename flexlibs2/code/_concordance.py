@@ -0,0 +1,260 @@
+#
+#   _concordance.py
+#
+#   Class: _ConcordanceIndex
+#          In-memory keyword-in-context (KWIC) index over text segments,
+#          used by SegmentOperations.BuildConcordance() / Concordance().
+#          Module functions re-index or drop edited paragraphs for the
+#          Segment, Paragraph and Text operations.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import unicodedata
+
+from .Shared.string_utils import best_vernacular_text, normalize_match_key, utf16_offset
+
+
+def _is_word_char(ch):
+    # Letters, combining marks and digits form words; everything else
+    # (spaces, punctuation, symbols) separates them.
+    return unicodedata.category(ch)[0] in "LMN"
+
+
+def tokenize(text):
+    """
+    Split text into word tokens.
+
+    Returns:
+        list: (token, start, end) tuples, where start/end are character
+        offsets into text and token is text[start:end].
+    """
+    tokens = []
+    start = None
+    for i, ch in enumerate(text or ""):
+        if _is_word_char(ch):
+            if start is None:
+                start = i
+        elif start is not None:
+            tokens.append((text[start:i], start, i))
+            start = None
+    if start is not None:
+        tokens.append((text[start:], start, len(text)))
+    return tokens
+
+
+class _ConcordanceIndex:
+    """Inverted index from search keys to segment hits.
+
+    Keys are normalized word tokens (see normalize_match_key) taken from
+    each segment's baseline text, plus any extra keys (such as gloss or
+    morph HVOs) supplied with the segment. Each hit records the segment
+    and the character span of the match within the segment, so a query
+    is a dict lookup and the context is sliced from the stored baseline
+    without going back to LCM.
+
+    Segments are indexed whole: to update one after an edit, index it
+    again with add_segment() (which replaces the previous entry). Offsets
+    of later segments in the same paragraph shift when a segment's text
+    changes, so callers normally re-index the whole paragraph with
+    index_paragraph().
+    """
+
+    def __init__(self, include_analyses=False):
+        """
+        Args:
+            include_analyses (bool): Recorded for callers that build the
+                index: whether gloss and morph HVOs are indexed as well as
+                words.
+        """
+        self.include_analyses = include_analyses
+        self._postings = {}     # key -> {seg_hvo: [(start, end), ...]}
+        self._segments = {}     # seg_hvo -> (para_hvo, begin, text, keys)
+        self._paragraphs = {}   # para_hvo -> [seg_hvo, ...] in text order
+
+    def __len__(self):
+        return len(self._segments)
+
+    def __contains__(self, seg_hvo):
+        return seg_hvo in self._segments
+
+    def has_paragraph(self, para_hvo):
+        """True if the paragraph has been indexed (even with no segments)."""
+        return para_hvo in self._paragraphs
+
+    def index_paragraph(self, para_hvo, segments):
+        """
+        Replace everything indexed for a paragraph.
+
+        Args:
+            para_hvo: The paragraph HVO.
+            segments: Iterable of (seg_hvo, begin, text, extra_keys), as
+                for add_segment().
+        """
+        self.remove_paragraph(para_hvo)
+        self._paragraphs[para_hvo] = []
+        for seg_hvo, begin, text, extra_keys in segments:
+            self.add_segment(seg_hvo, para_hvo, begin, text, extra_keys)
+
+    def add_segment(self, seg_hvo, para_hvo, begin, text, extra_keys=()):
+        """
+        Index (or re-index) one segment.
+
+        Args:
+            seg_hvo: The segment HVO.
+            para_hvo: The owning paragraph HVO.
+            begin (int): The segment's begin offset within the paragraph.
+            text (str): The segment's baseline text.
+            extra_keys: Iterable of (key, start, end) for non-word keys,
+                with start/end relative to the segment text.
+        """
+        if seg_hvo in self._segments:
+            self.remove_segment(seg_hvo)
+        text = text or ""
+
+        hits = [(normalize_match_key(token), start, end)
+                for token, start, end in tokenize(text)]
+        hits.extend(extra_keys)
+
+        keys = set()
+        for key, start, end in hits:
+            self._postings.setdefault(key, {}).setdefault(seg_hvo, []).append((start, end))
+            keys.add(key)
+
+        self._segments[seg_hvo] = (para_hvo, begin, text, keys)
+        self._paragraphs.setdefault(para_hvo, []).append(seg_hvo)
+
+    def remove_segment(self, seg_hvo):
+        """Drop a segment and all of its hits. Unknown HVOs are ignored."""
+        entry = self._segments.pop(seg_hvo, None)
+        if entry is None:
+            return
+        para_hvo, _begin, _text, keys = entry
+        for key in keys:
+            by_segment = self._postings[key]
+            del by_segment[seg_hvo]
+            if not by_segment:
+                del self._postings[key]
+        self._paragraphs[para_hvo].remove(seg_hvo)
+
+    def remove_paragraph(self, para_hvo):
+        """Drop a paragraph and every segment indexed under it."""
+        for seg_hvo in list(self._paragraphs.get(para_hvo, ())):
+            self.remove_segment(seg_hvo)
+        self._paragraphs.pop(para_hvo, None)
+
+    def clear(self):
+        self._postings.clear()
+        self._segments.clear()
+        self._paragraphs.clear()
+
+    def lookup(self, query):
+        """
+        Return the hits for a query.
+
+        Args:
+            query: A word (str, normalized before lookup) or an extra key
+                such as an HVO (int).
+
+        Returns:
+            list: (seg_hvo, start, end) tuples, start/end relative to the
+            segment text, ordered by segment HVO then position.
+        """
+        if isinstance(query, str):
+            query = normalize_match_key(query)
+        by_segment = self._postings.get(query, {})
+        return [(seg_hvo, start, end)
+                for seg_hvo in sorted(by_segment)
+                for start, end in sorted(by_segment[seg_hvo])]
+
+    def kwic(self, query, width=40):
+        """
+        Return keyword-in-context lines for a query.
+
+        Args:
+            query: As for lookup().
+            width (int): Maximum number of context characters on each side.
+
+        Returns:
+            list: One dict per hit with 'segment', 'paragraph', 'begin' and
+            'end' (offsets within the paragraph, in UTF-16 code units like
+            ISegment.BeginOffset), and 'left', 'match' and 'right' (the
+            text before, of, and after the hit).
+        """
+        lines = []
+        for seg_hvo, start, end in self.lookup(query):
+            para_hvo, begin, text, _keys = self._segments[seg_hvo]
+            lines.append({
+                "segment": seg_hvo,
+                "paragraph": para_hvo,
+                "begin": begin + utf16_offset(text, start),
+                "end": begin + utf16_offset(text, end),
+                "left": text[max(0, start - width):start],
+                "match": text[start:end],
+                "right": text[end:end + width],
+            })
+        return lines
+
+
+def analysis_keys(segment, text):
+    """
+    Return (hvo, start, end) keys for the glosses and morphs of a
+    segment's analyses. Each token's span is found by searching for its
+    wordform in the baseline; if not found, the whole segment is used.
+    """
+    keys = []
+    lowered = text.lower()
+    cursor = 0
+    for token in segment.AnalysesRS:
+        wordform = token.Wordform
+        if wordform is None:
+            continue    # punctuation
+        form = best_vernacular_text(wordform.Form)
+        pos = lowered.find(form.lower(), cursor) if form else -1
+        if pos < 0:
+            start, end = 0, len(text)
+        else:
+            start, end = pos, pos + len(form)
+            cursor = end
+
+        if token.ClassName == "WfiGloss":
+            keys.append((token.Hvo, start, end))
+        analysis = token.Analysis
+        if analysis is not None:
+            for bundle in analysis.MorphBundlesOS:
+                if bundle.MorphRA is not None:
+                    keys.append((bundle.MorphRA.Hvo, start, end))
+    return keys
+
+
+def paragraph_segments(para, include_analyses=False):
+    """
+    Read a paragraph's segments in the form index_paragraph() takes.
+
+    Returns:
+        list: (seg_hvo, begin, baseline text, extra_keys) tuples.
+    """
+    segments = []
+    for segment in para.SegmentsOS:
+        text = segment.BaselineText.Text or ""
+        extra_keys = analysis_keys(segment, text) if include_analyses else ()
+        segments.append((segment.Hvo, segment.BeginOffset, text, extra_keys))
+    return segments
+
+
+def refresh_concordance(project, para):
+    """Re-index an edited paragraph if the project's concordance covers it."""
+    index = getattr(project, "_concordance", None)
+    if isinstance(index, _ConcordanceIndex) and index.has_paragraph(para.Hvo):
+        index.index_paragraph(para.Hvo, paragraph_segments(para, index.include_analyses))
+
+
+def drop_from_concordance(project, para_hvos):
+    """Remove deleted paragraphs from the project's concordance, if any."""
+    index = getattr(project, "_concordance", None)
+    if isinstance(index, _ConcordanceIndex):
+        for para_hvo in para_hvos:
+            index.remove_paragraph(para_hvo)
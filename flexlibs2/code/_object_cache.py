@@ -0,0 +1,104 @@
+#
+#   _object_cache.py
+#
+#   Class: _ObjectCache
+#          Bounded, weak-reference cache used by FLExProject.Object() to
+#          avoid repeated ServiceLocator.GetObject() calls.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import weakref
+from collections import OrderedDict
+
+
+class _ObjectCache:
+    """Bounded LRU map from an Hvo or Guid key to an LCM object.
+
+    Values are held through weak references so the cache never keeps an
+    LCM object alive on its own; an entry disappears as soon as the last
+    Python reference to its object goes away. Objects that cannot be
+    weakly referenced are held strongly, and are still evicted once the
+    cache grows past ``maxsize``.
+
+    The cache does not know about LCM object lifetimes: callers must
+    check that a returned object is still valid (``IsValidObject``) and
+    ``discard()`` it if not.
+    """
+
+    def __init__(self, maxsize=4096):
+        """
+        Args:
+            maxsize: Maximum number of entries kept (least recently used
+                entries are evicted first).
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached object for key, or None."""
+        ref = self._entries.get(key)
+        if ref is not None:
+            obj = ref()
+            if obj is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return obj
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, obj):
+        """Cache obj under key, evicting the oldest entry if full."""
+        if self.maxsize <= 0:
+            return
+        try:
+            ref = weakref.ref(obj, self._make_reaper(key))
+        except TypeError:
+            ref = _StrongRef(obj)
+        self._entries[key] = ref
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key):
+        """Remove key from the cache, if present."""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _make_reaper(self, key):
+        entries_ref = weakref.ref(self._entries)
+
+        def reap(dead_ref):
+            entries = entries_ref()
+            # Only remove the entry if it still points at the dead object;
+            # the key may have been re-cached since.
+            if entries is not None and entries.get(key) is dead_ref:
+                del entries[key]
+
+        return reap
+
+
+class _StrongRef:
+    """weakref.ref look-alike for objects that don't support weak references."""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __call__(self):
+        return self._obj
@@ -0,0 +1,187 @@
+#
+#   _occurrence_index.py
+#
+#   Class: _OccurrenceIndex
+#          In-memory reverse index from wordform, analysis and gloss HVOs
+#          to the segments whose AnalysesRS reference them, used by
+#          WordformOperations.BuildOccurrenceIndex() and kept current by
+#          the Segment, Paragraph, Text, WfiAnalysis and WfiGloss
+#          operations through the module functions below.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from collections import Counter
+
+
+def segment_keys(segment):
+    """
+    Return the occurrence keys for one segment.
+
+    Each token in segment.AnalysesRS contributes its wordform HVO, its
+    analysis HVO (if analyzed) and its gloss HVO (if glossed); a
+    punctuation token contributes nothing.
+
+    Returns:
+        list: HVOs, one per token and level (so repeats count).
+    """
+    keys = []
+    for token in segment.AnalysesRS:
+        wordform = token.Wordform
+        if wordform is None:
+            continue
+        keys.append(wordform.Hvo)
+        analysis = token.Analysis
+        if analysis is not None:
+            keys.append(analysis.Hvo)
+        if token.ClassName == "WfiGloss":
+            keys.append(token.Hvo)
+    return keys
+
+
+class _OccurrenceIndex:
+    """Reverse index from an HVO to the segments that use it.
+
+    Each indexed segment is stored with the Counter of its keys, so a
+    segment can be replaced or removed without scanning the rest of the
+    index, and per-key totals are kept so counts are O(1).
+
+    As with _ConcordanceIndex, paragraphs are the unit of re-indexing:
+    index_paragraph() replaces everything known about a paragraph, and
+    has_paragraph() tells callers whether a paragraph is covered at all.
+    """
+
+    def __init__(self):
+        self._by_key = {}        # hvo -> {seg_hvo: count}
+        self._totals = Counter() # hvo -> total occurrences
+        self._segments = {}      # seg_hvo -> (para_hvo, Counter of keys)
+        self._paragraphs = {}    # para_hvo -> [seg_hvo, ...]
+
+    def __len__(self):
+        return len(self._segments)
+
+    def __contains__(self, seg_hvo):
+        return seg_hvo in self._segments
+
+    def has_paragraph(self, para_hvo):
+        """True if the paragraph has been indexed (even with no segments)."""
+        return para_hvo in self._paragraphs
+
+    def index_paragraph(self, para_hvo, segments):
+        """
+        Replace everything indexed for a paragraph.
+
+        Args:
+            para_hvo: The paragraph HVO.
+            segments: Iterable of (seg_hvo, keys) pairs.
+        """
+        self.remove_paragraph(para_hvo)
+        self._paragraphs[para_hvo] = []
+        for seg_hvo, keys in segments:
+            self.set_segment(seg_hvo, para_hvo, keys)
+
+    def set_segment(self, seg_hvo, para_hvo, keys):
+        """Index (or re-index) one segment with the given keys."""
+        if seg_hvo in self._segments:
+            self.remove_segment(seg_hvo)
+        counts = Counter(keys)
+        for key, n in counts.items():
+            self._by_key.setdefault(key, {})[seg_hvo] = n
+        self._totals.update(counts)
+        self._segments[seg_hvo] = (para_hvo, counts)
+        self._paragraphs.setdefault(para_hvo, []).append(seg_hvo)
+
+    def update_segment(self, seg_hvo, keys):
+        """Re-index a segment already in the index, keeping its paragraph."""
+        para_hvo, _counts = self._segments[seg_hvo]
+        self.set_segment(seg_hvo, para_hvo, keys)
+
+    def remove_segment(self, seg_hvo):
+        """Drop a segment. Unknown HVOs are ignored."""
+        entry = self._segments.pop(seg_hvo, None)
+        if entry is None:
+            return
+        para_hvo, counts = entry
+        for key in counts:
+            by_segment = self._by_key[key]
+            del by_segment[seg_hvo]
+            if not by_segment:
+                del self._by_key[key]
+        self._totals.subtract(counts)
+        for key in counts:
+            if self._totals[key] <= 0:
+                del self._totals[key]
+        self._paragraphs[para_hvo].remove(seg_hvo)
+
+    def remove_paragraph(self, para_hvo):
+        """Drop a paragraph and every segment indexed under it."""
+        for seg_hvo in list(self._paragraphs.get(para_hvo, ())):
+            self.remove_segment(seg_hvo)
+        self._paragraphs.pop(para_hvo, None)
+
+    def clear(self):
+        self._by_key.clear()
+        self._totals.clear()
+        self._segments.clear()
+        self._paragraphs.clear()
+
+    def count(self, hvo):
+        """Total number of occurrences of hvo across indexed segments."""
+        return self._totals.get(hvo, 0)
+
+    def segments(self, hvo):
+        """HVOs of the segments that use hvo (each listed once)."""
+        return list(self._by_key.get(hvo, ()))
+
+
+def segments_using(project, hvos):
+    """
+    Return the indexed segments that reference any of hvos.
+
+    Called before deleting a wordform, analysis or gloss: LCM updates the
+    segments that referenced it, and those segments are then passed to
+    reindex_segments(). Returns [] if the project has no occurrence index.
+    """
+    index = getattr(project, "_occurrences", None)
+    if not isinstance(index, _OccurrenceIndex):
+        return []
+    found = set()
+    for hvo in hvos:
+        found.update(index.segments(hvo))
+    return list(found)
+
+
+def reindex_segments(project, seg_hvos):
+    """Re-read the analyses of already-indexed segments."""
+    index = getattr(project, "_occurrences", None)
+    if not isinstance(index, _OccurrenceIndex):
+        return
+    for seg_hvo in seg_hvos:
+        try:
+            segment = project.Object(seg_hvo)
+        except Exception:
+            # .NET KeyNotFoundException: the segment itself is gone.
+            segment = None
+        if segment is None or not segment.IsValidObject:
+            index.remove_segment(seg_hvo)
+        else:
+            index.update_segment(seg_hvo, segment_keys(segment))
+
+
+def refresh_occurrences(project, para):
+    """Re-index an edited paragraph if the project's occurrence index covers it."""
+    index = getattr(project, "_occurrences", None)
+    if isinstance(index, _OccurrenceIndex) and index.has_paragraph(para.Hvo):
+        index.index_paragraph(
+            para.Hvo, [(seg.Hvo, segment_keys(seg)) for seg in para.SegmentsOS])
+
+
+def drop_from_occurrences(project, para_hvos):
+    """Remove deleted paragraphs from the project's occurrence index, if any."""
+    index = getattr(project, "_occurrences", None)
+    if isinstance(index, _OccurrenceIndex):
+        for para_hvo in para_hvos:
+            index.remove_paragraph(para_hvo)
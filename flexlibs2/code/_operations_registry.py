@@ -0,0 +1,78 @@
+#
+#   _operations_registry.py
+#
+#   Class: _OperationsProperty
+#          Cached, lazily-imported Operations accessor for FLExProject.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import importlib
+
+
+class _OperationsProperty:
+    """Lazy accessor for one Operations class on FLExProject.
+
+    On first access the Operations module is imported, the class is
+    instantiated with the project, and the instance is stored in the
+    project's ``__dict__`` under the property name. Because this is a
+    non-data descriptor, every later access is a plain instance attribute
+    lookup - the descriptor is never consulted again.
+
+    Each property registers itself in the owning class's
+    ``_operations_registry`` (``{property name: (module, class name)}``),
+    which ``FLExProject.warm()`` uses to pre-instantiate Operations.
+    """
+
+    def __init__(self, module, class_name, doc=None):
+        """
+        Args:
+            module:     Module path relative to ``flexlibs2.code``,
+                        e.g. ``"Grammar.POSOperations"``.
+            class_name: Name of the Operations class in that module.
+            doc:        Docstring shown for the property.
+        """
+        self.module = module
+        self.class_name = class_name
+        self.name = None
+        self.__doc__ = doc
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        registry = owner.__dict__.get("_operations_registry")
+        if registry is None:
+            # Copy rather than mutate an inherited registry.
+            registry = dict(getattr(owner, "_operations_registry", {}))
+            owner._operations_registry = registry
+        registry[name] = (self.module, self.class_name)
+
+    def load_class(self):
+        """Import and return the Operations class."""
+        module = importlib.import_module("." + self.module, __package__)
+        return getattr(module, self.class_name)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        ops = self.load_class()(instance)
+        instance.__dict__[self.name] = ops
+        return ops
+
+
+def _operations_property(module, class_name):
+    """Decorator form of _OperationsProperty.
+
+    The decorated function only supplies the docstring::
+
+        @_operations_property("Grammar.POSOperations", "POSOperations")
+        def POS(self):
+            \"\"\"Access to Parts of Speech operations.\"\"\"
+    """
+
+    def decorator(func):
+        return _OperationsProperty(module, class_name, doc=func.__doc__)
+
+    return decorator
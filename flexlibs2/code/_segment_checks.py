@@ -0,0 +1,98 @@
+#
+#   _segment_checks.py
+#
+#   Function: check_segment_offsets
+#          Pure offset/text consistency checks for the segments of one
+#          paragraph, shared by SegmentOperations.ValidateSegments() and
+#          ValidateCorpus(). Works on plain tuples, not LCM objects, so
+#          ValidateCorpus() can hand the checks to worker processes.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+
+def check_segment_offsets(segments, text_length=None):
+    """
+    Check the segments of one paragraph for offset consistency.
+
+    Args:
+        segments: Sequence of (begin, end, baseline) tuples in paragraph
+            order. begin/end may be None for a segment whose offsets
+            could not be read.
+        text_length (int, optional): Length of the paragraph text. If
+            given, segments ending past it are reported as errors.
+
+    Returns:
+        tuple: (errors, warnings), two lists of message strings.
+    """
+    errors = []
+    warnings = []
+
+    if not segments:
+        warnings.append("Paragraph has no segments")
+        return errors, warnings
+
+    prev_end = -1
+    for i, (begin, end, baseline) in enumerate(segments):
+        if begin is None or end is None:
+            warnings.append(f"Segment {i} missing offset attributes")
+            continue
+
+        if begin < 0 or end < 0:
+            errors.append(f"Segment {i} has negative offset (begin={begin}, end={end})")
+
+        if begin >= end:
+            errors.append(f"Segment {i} has invalid offsets (begin={begin} >= end={end})")
+
+        if text_length is not None and end > text_length:
+            errors.append(
+                f"Segment {i} extends past the paragraph text "
+                f"(end={end}, length={text_length})"
+            )
+
+        if prev_end >= 0:
+            if begin > prev_end + 1:
+                warnings.append(
+                    f"Gap between segment {i-1} and {i} "
+                    f"(prev_end={prev_end}, begin={begin})"
+                )
+            elif begin < prev_end:
+                errors.append(
+                    f"Overlap between segment {i-1} and {i} "
+                    f"(prev_end={prev_end}, begin={begin})"
+                )
+
+        if not baseline:
+            warnings.append(f"Segment {i} has empty baseline text")
+
+        prev_end = end
+
+    return errors, warnings
+
+
+def check_paragraph(record):
+    """
+    Run check_segment_offsets() on one extracted paragraph.
+
+    The unit of work for ValidateCorpus() worker processes.
+
+    Args:
+        record: (paragraph_hvo, text_length, segments) as described for
+            check_segment_offsets().
+
+    Returns:
+        dict: 'paragraph', 'valid', 'errors', 'warnings' and
+        'segment_count'.
+    """
+    para_hvo, text_length, segments = record
+    errors, warnings = check_segment_offsets(segments, text_length)
+    return {
+        "paragraph": para_hvo,
+        "valid": not errors,
+        "errors": errors,
+        "warnings": warnings,
+        "segment_count": len(segments),
+    }
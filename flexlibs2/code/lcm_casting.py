@@ -285,6 +285,26 @@ def _ensure_interfaces() -> None:
     _interfaces_loaded = True
 
 
+def _interface_for(obj):
+    """
+    Return the interface to cast obj to, or None if there is none.
+
+    Reads ClassName once (a single .NET call returning a Python str) and
+    looks it up in _interface_cache. Keying on obj.GetType() instead would
+    cost a call for the System.Type plus hashing it across the bridge, and
+    type(obj) cannot be used: pythonnet wraps objects by their declared
+    interface, so e.g. every .Owner has the same Python type.
+
+    Returns:
+        The interface type, or None if obj has no ClassName or its class is
+        not in _interface_cache.
+    """
+    if not _interfaces_loaded:
+        _ensure_interfaces()
+
+    return _interface_cache.get(getattr(obj, "ClassName", None))
+
+
 def cast_to_concrete(obj):
     """
     Cast an LCM object to its concrete interface type based on ClassName.
@@ -329,17 +349,10 @@ def cast_to_concrete(obj):
         - Returns the original object if casting fails for any reason
         - Thread-safe for the interface loading (uses lazy initialization)
         - The interface cache is loaded on first call
+        - ClassName is read once per call
     """
-    _ensure_interfaces()
-
-    # Get the class name from the object
-    if not hasattr(obj, "ClassName"):
-        return obj
-
-    class_name = obj.ClassName
-
     # Look up the interface type
-    interface_type = _interface_cache.get(class_name)
+    interface_type = _interface_for(obj)
     if interface_type is None:
         return obj
 
@@ -609,15 +622,8 @@ def cast_phonological_rule(rule_obj):
             if concrete_rule.ClassName == 'PhRegularRule':
                 rhs_count = concrete_rule.RightHandSidesOS.Count
     """
-    _ensure_interfaces()
-
-    if not hasattr(rule_obj, "ClassName"):
-        return rule_obj
-
-    class_name = rule_obj.ClassName
-
     # Look up the interface for this rule type
-    interface_type = _interface_cache.get(class_name)
+    interface_type = _interface_for(rule_obj)
     if interface_type is None:
         # Not a recognized rule type, return original
         return rule_obj
@@ -3,6 +3,8 @@
 #
 #   Class: _FLExTransaction
 #          Context manager for safe rollback transactions within a FLEx project.
+#   Class: _FLExBatch
+#          Context manager grouping many operations into one transaction.
 #
 #   Platform: Python.NET
 #             FieldWorks Version 9+
@@ -34,6 +36,9 @@ class _NestingAwareTransaction:
           already groups every inner mutation into its single named task, which
           is exactly the Phase 2 contract (recover via FLEx Ctrl+Z), so the inner
           block must touch no undo API at all.
+        * Inside a ``project.Batch()`` (``project._batch_depth`` > 0), every
+          NESTED block is a NO-OP in both phases: the batch's outer block is
+          the only transaction boundary.
 
     Depth is tracked on the project (``project._transaction_depth``) rather than
     on the Operations instance, because nesting routinely crosses Operations
@@ -53,8 +58,13 @@ class _NestingAwareTransaction:
             # may not carry a real counter; treat it as the outermost block.
             depth = 0
         undoable = getattr(project, "_undoable", False)
+        batch_depth = getattr(project, "_batch_depth", 0)
+        in_batch = isinstance(batch_depth, int) and batch_depth > 0
 
-        if undoable and depth > 0:
+        if in_batch and depth > 0:
+            # Inside a Batch: the batch's outer block owns these mutations.
+            self._inner = None
+        elif undoable and depth > 0:
             # Nested Phase 2: no-op. Outer UndoableOperation owns these mutations.
             self._inner = None
             logger.debug(
@@ -184,6 +194,10 @@ class _FLExTransaction:
                     f"Transaction '{self._label}': ROLLBACK FAILED: {rollback_err}. "
                     f"Project may be in inconsistent state. Consider closing without saving."
                 )
+            # The concordance and occurrence indexes were updated by the
+            # writes just undone. Drop them; they are rebuilt on next use.
+            self._project._concordance = None
+            self._project._occurrences = None
         else:
             logger.warning(
                 f"Transaction '{self._label}': no mark available, "
@@ -191,3 +205,56 @@ class _FLExTransaction:
             )
 
         return False  # Re-raise the original exception
+
+
+class _FLExBatch:
+    """
+    Context manager that runs many operations as one transaction.
+
+    Opens a single outer ``_NestingAwareTransaction``; while it is active,
+    every ``_TransactionCM`` block entered by an Operations method is a no-op,
+    so a bulk import pays for one transaction boundary (one Mark, or one undo
+    task in Phase 2) instead of one per Create/Set*/Delete call. The
+    write-enabled check is made once, on entry.
+
+    On exit without an exception, the outermost batch optionally saves the
+    project. If an exception escapes the batch, the outer transaction rolls
+    back everything done inside it (Phase 1). Exceptions caught inside the
+    batch do NOT roll back the failed call's partial writes, because the
+    per-call rollback points are what the batch removes.
+
+    Batches nest: an inner batch joins the outer one.
+
+    Note:
+        This class is internal. Obtain instances via FLExProject.Batch().
+    """
+
+    def __init__(self, project, label: str, save: bool = False) -> None:
+        self._project = project
+        self._label = label
+        self._save = save
+        self._outer = _NestingAwareTransaction(project, label)
+
+    def __enter__(self) -> "_FLExBatch":
+        from .exceptions import FP_ReadOnlyError
+
+        project = self._project
+        if not project.writeEnabled:
+            raise FP_ReadOnlyError()
+
+        self._outer.__enter__()
+        project._batch_depth = getattr(project, "_batch_depth", 0) + 1
+        logger.debug(f"Batch '{self._label}': started (depth {project._batch_depth})")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        project = self._project
+        project._batch_depth = getattr(project, "_batch_depth", 1) - 1
+        try:
+            suppress = self._outer.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            logger.debug(f"Batch '{self._label}': ended (depth {project._batch_depth})")
+
+        if exc_type is None and self._save and project._batch_depth == 0:
+            project.SaveChanges()
+        return suppress
@@ -291,11 +291,30 @@ def pytest_configure(config):
 # ========== MOCK PROJECT FIXTURE ==========
 
 
+class _CountingTransaction:
+    """Transaction stand-in that records its boundaries on the mock project."""
+
+    def __init__(self, project, label):
+        self._project = project
+        self._label = label
+
+    def __enter__(self):
+        self._project.transactions_opened += 1
+        self._project.transaction_labels.append(self._label)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._project.transactions_closed += 1
+        return False
+
+
 class MockFLExProject:
     """
     Mock FLExProject for testing validation without actual database.
 
     Simulates write-enabled/read-only states and CanModify() behavior.
+    Transaction() and Batch() record every transaction boundary, so tests
+    can count how many transactions a sequence of operations opens.
     """
 
     def __init__(self, write_enabled=True):
@@ -306,16 +325,39 @@ class MockFLExProject:
             write_enabled: If True, project can be modified. If False, read-only.
         """
         self.write_enabled = write_enabled
+        self.writeEnabled = write_enabled
         self._can_modify = write_enabled
         self.project = Mock()
+        self._undoable = False
+        self._transaction_depth = 0
+        self._batch_depth = 0
+        self.transactions_opened = 0
+        self.transactions_closed = 0
+        self.transaction_labels = []
+        self.saves = 0
 
     def CanModify(self):
         """Return whether project can be modified."""
         return self._can_modify
 
+    def Transaction(self, label="transaction"):
+        """Return a context manager that counts its boundaries."""
+        return _CountingTransaction(self, label)
+
+    def Batch(self, label="batch", save=False):
+        """Return the real batch context manager, bound to this mock."""
+        from flexlibs2.code.transaction import _FLExBatch
+
+        return _FLExBatch(self, label, save)
+
+    def SaveChanges(self):
+        """Count saves instead of writing to disk."""
+        self.saves += 1
+
     def set_write_enabled(self, enabled):
         """Change write-enabled state."""
         self.write_enabled = enabled
+        self.writeEnabled = enabled
         self._can_modify = enabled
 
     def set_can_modify(self, can_modify):
@@ -198,17 +198,22 @@ class TestLexEntryOperationsMockBehavior:
     """Test operations behavior with mock objects."""
 
     def test_getall_with_mock_repository(self, mock_flex_project):
-        """Test GetAll returns iterator from mock repository."""
+        """Test GetAll returns a sequence over the mock repository."""
         from flexlibs2.code.Lexicon.LexEntryOperations import LexEntryOperations
 
         # Setup mock to return test entries
         mock_entries = [MockLCMObject(hvo=i) for i in range(3)]
 
-        with patch.object(mock_flex_project, "ObjectsIn", return_value=iter(mock_entries)):
+        repository = Mock(Count=3)
+        repository.AllInstances.return_value = mock_entries
+
+        with patch.object(mock_flex_project, "ObjectRepository", return_value=repository):
             ops = LexEntryOperations(mock_flex_project)
             result = list(ops.GetAll())
 
             assert len(result) == 3
+            # len() reads the repository Count without enumerating
+            assert len(ops.GetAll()) == 3
             assert all(isinstance(e, MockLCMObject) for e in result)
 
     def test_getsensecount_with_mock_entry(self, mock_flex_project, mock_lex_entry):
@@ -168,17 +168,22 @@ class TestTextOperationsMockBehavior:
         assert hasattr(mock_text, "Guid")
 
     def test_getall_with_mock_repository(self, mock_flex_project):
-        """Test GetAll returns iterator from mock repository."""
+        """Test GetAll returns a sequence over the mock repository."""
         from flexlibs2.code.TextsWords.TextOperations import TextOperations
 
         # Setup mock to return test texts
         mock_texts = [MockLCMObject(hvo=4000 + i) for i in range(2)]
 
-        with patch.object(mock_flex_project, "ObjectsIn", return_value=iter(mock_texts)):
+        repository = Mock(Count=2)
+        repository.AllInstances.return_value = mock_texts
+
+        with patch.object(mock_flex_project, "ObjectRepository", return_value=repository):
             ops = TextOperations(mock_flex_project)
             result = list(ops.GetAll())
 
             assert len(result) == 2
+            # len() reads the repository Count without enumerating
+            assert len(ops.GetAll()) == 2
 
 
 class TestTextOperationsValidation:
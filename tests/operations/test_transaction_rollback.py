@@ -151,6 +151,41 @@ class TestPhase1Rollback:
             with _NestingAwareTransaction(project, "test-reraise"):
                 raise _Sentinel("must propagate")
 
+    def test_rollback_drops_text_indexes(self):
+        """
+        A rollback may reverse edits the concordance and occurrence
+        indexes were updated for, so both must be discarded.
+        """
+        from flexlibs2.code.transaction import _NestingAwareTransaction
+
+        project, _, _ = _make_phase1_project()
+        project._concordance = object()
+        project._occurrences = object()
+
+        with pytest.raises(RuntimeError, match="intentional"):
+            with _NestingAwareTransaction(project, "test-indexes"):
+                raise RuntimeError("intentional")
+
+        assert project._concordance is None
+        assert project._occurrences is None
+
+    def test_clean_exit_keeps_text_indexes(self):
+        """
+        Committed edits were already applied to the indexes; keep them.
+        """
+        from flexlibs2.code.transaction import _NestingAwareTransaction
+
+        project, _, _ = _make_phase1_project()
+        concordance, occurrences = object(), object()
+        project._concordance = concordance
+        project._occurrences = occurrences
+
+        with _NestingAwareTransaction(project, "test-indexes"):
+            pass
+
+        assert project._concordance is concordance
+        assert project._occurrences is occurrences
+
 
 # ---------------------------------------------------------------------------
 # Phase 1: (None, None) mark API -- no rollback available
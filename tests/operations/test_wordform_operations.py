@@ -168,17 +168,22 @@ class TestWordformOperationsMockBehavior:
         assert hasattr(mock_wordform, "Guid")
 
     def test_getall_with_mock_repository(self, mock_flex_project):
-        """Test GetAll returns iterator from mock repository."""
+        """Test GetAll returns a sequence over the mock repository."""
         from flexlibs2.code.TextsWords.WordformOperations import WordformOperations as WfiWordformOperations
 
         # Setup mock to return test wordforms
         mock_wordforms = [MockLCMObject(hvo=5000 + i) for i in range(3)]
 
-        with patch.object(mock_flex_project, "ObjectsIn", return_value=iter(mock_wordforms)):
+        repository = Mock(Count=3)
+        repository.AllInstances.return_value = mock_wordforms
+
+        with patch.object(mock_flex_project, "ObjectRepository", return_value=repository):
             ops = WfiWordformOperations(mock_flex_project)
             result = list(ops.GetAll())
 
             assert len(result) == 3
+            # len() reads the repository Count without enumerating
+            assert len(ops.GetAll()) == 3
 
     def test_getform_with_mock_wordform(self, mock_flex_project, mock_wordform):
         """Test GetForm with mock wordform."""
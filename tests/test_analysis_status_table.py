@@ -0,0 +1,124 @@
+#
+#   test_analysis_status_table.py
+#
+#   Class: TestGetStatusTable
+#          WfiAnalysisOperations.GetStatusTable() agrees, row for row,
+#          with GetApprovalStatus(), IsComputerApproved(), GetGlossCount()
+#          and GetMorphBundleCount() for human-approved, parser-approved,
+#          disapproved, unevaluated and mixed analyses.
+#
+#          Stand-in LCM objects; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+def _evaluation(hvo, human, approves):
+    return SimpleNamespace(Hvo=hvo, Human=human, Approves=approves)
+
+
+HUMAN_YES = _evaluation(1, True, True)
+HUMAN_NO = _evaluation(2, True, False)
+PARSER_YES = _evaluation(3, False, True)
+PARSER_NO = _evaluation(4, False, False)
+# Owned by no agent in AnalyzingAgentsOC; read from its own flags.
+STRAY_HUMAN_NO = _evaluation(5, True, False)
+
+AGENTS = [
+    SimpleNamespace(Human=True, ApprovesOA=HUMAN_YES, DisapprovesOA=HUMAN_NO),
+    SimpleNamespace(Human=False, ApprovesOA=PARSER_YES, DisapprovesOA=PARSER_NO),
+]
+
+
+class _IWfiWordform:
+    def __init__(self, hvo):
+        self.Hvo = hvo
+        self.AnalysesOC = []
+
+
+def _analysis(hvo, wordform, evaluations, glosses=0, bundles=0):
+    analysis = SimpleNamespace(
+        Hvo=hvo,
+        Owner=wordform,
+        EvaluationsRC=list(evaluations),
+        MeaningsOC=SimpleNamespace(Count=glosses),
+        MorphBundlesOS=SimpleNamespace(Count=bundles),
+    )
+    wordform.AnalysesOC.append(analysis)
+    return analysis
+
+
+def _lexicon():
+    famba, enda = _IWfiWordform(100), _IWfiWordform(101)
+    analyses = [
+        _analysis(200, famba, [HUMAN_YES], glosses=2, bundles=1),          # human-approved
+        _analysis(201, famba, [PARSER_YES], glosses=0, bundles=3),         # parser-approved
+        _analysis(202, famba, [HUMAN_NO, PARSER_NO], glosses=1),           # disapproved by both
+        _analysis(203, enda, [], bundles=2),                               # unevaluated
+        _analysis(204, enda, [HUMAN_NO, PARSER_YES], glosses=1, bundles=1),
+        _analysis(205, enda, [HUMAN_NO, HUMAN_YES, PARSER_NO]),
+        _analysis(206, enda, [STRAY_HUMAN_NO]),
+    ]
+    return [famba, enda], analyses
+
+
+@pytest.fixture
+def analyses():
+    from flexlibs2.code.TextsWords import WfiAnalysisOperations as module
+
+    project = Mock()
+    project.lp.AnalyzingAgentsOC = AGENTS
+    wordforms, all_analyses = _lexicon()
+    project.Object.side_effect = {wf.Hvo: wf for wf in wordforms}.__getitem__
+    ops = module.WfiAnalysisOperations(project)
+    ops._RepositoryObjects = lambda repository: iter(all_analyses)
+
+    with patch.object(module, "IWfiWordform", _IWfiWordform):
+        yield module, ops, wordforms, all_analyses
+
+
+class TestGetStatusTable:
+
+    def test_rows_match_per_analysis_methods(self, analyses):
+        module, ops, _wordforms, all_analyses = analyses
+        APPROVED = module.ApprovalStatusTypes.APPROVED
+
+        rows = ops.GetStatusTable()
+
+        assert [row.hvo for row in rows] == [a.Hvo for a in all_analyses]
+        for row, analysis in zip(rows, all_analyses):
+            assert row.wordform == analysis.Owner.Hvo
+            assert row.status == ops.GetApprovalStatus(analysis), row
+            assert (row.parser_status == APPROVED) == ops.IsComputerApproved(analysis), row
+            assert row.gloss_count == ops.GetGlossCount(analysis)
+            assert row.bundle_count == ops.GetMorphBundleCount(analysis)
+
+    def test_statuses(self, analyses):
+        module, ops, _wordforms, _all_analyses = analyses
+        Status = module.ApprovalStatusTypes
+
+        table = {row.hvo: (row.status, row.parser_status) for row in ops.GetStatusTable()}
+
+        assert table == {
+            200: (Status.APPROVED, Status.UNAPPROVED),
+            201: (Status.UNAPPROVED, Status.APPROVED),
+            202: (Status.DISAPPROVED, Status.DISAPPROVED),
+            203: (Status.UNAPPROVED, Status.UNAPPROVED),
+            204: (Status.DISAPPROVED, Status.APPROVED),
+            205: (Status.APPROVED, Status.DISAPPROVED),
+            206: (Status.DISAPPROVED, Status.UNAPPROVED),
+        }
+
+    def test_wordforms_subset_by_object_or_hvo(self, analyses):
+        _module, ops, (famba, enda), _all_analyses = analyses
+
+        assert [row.hvo for row in ops.GetStatusTable([enda.Hvo])] == [203, 204, 205, 206]
+        assert [row.hvo for row in ops.GetStatusTable([famba])] == [200, 201, 202]
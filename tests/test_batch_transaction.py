@@ -0,0 +1,97 @@
+#
+#   test_batch_transaction.py
+#
+#   Class: TestBatch
+#          Unit tests for FLExProject.Batch(): Operations methods run inside
+#          a batch share its single outer transaction instead of opening
+#          one each. Uses the counting MockFLExProject from conftest; no
+#          live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import pytest
+
+
+@pytest.fixture
+def ops(mock_project):
+    from flexlibs2.code.BaseOperations import BaseOperations, OperationsMethod
+
+    class FakeOperations(BaseOperations):
+        @OperationsMethod
+        def Create(self, name):
+            self._EnsureWriteEnabled()
+            with self._TransactionCM(f"Create '{name}'"):
+                return name
+
+        @OperationsMethod
+        def Fail(self):
+            with self._TransactionCM("Fail"):
+                raise ValueError("boom")
+
+    return FakeOperations(mock_project)
+
+
+class TestBatch:
+
+    def test_each_call_opens_a_transaction_without_batch(self, ops):
+        for i in range(3):
+            ops.Create(str(i))
+
+        assert ops.project.transactions_opened == 3
+
+    def test_batch_is_the_only_boundary(self, ops):
+        project = ops.project
+
+        with project.Batch("Import"):
+            for i in range(100):
+                ops.Create(str(i))
+
+        assert project.transactions_opened == 1
+        assert project.transactions_closed == 1
+        assert project.transaction_labels == ["Import"]
+        assert (project._batch_depth, project._transaction_depth) == (0, 0)
+
+    def test_nested_batches_join_the_outer_one(self, ops):
+        project = ops.project
+
+        with project.Batch("outer"):
+            with project.Batch("inner"):
+                ops.Create("a")
+            ops.Create("b")
+
+        assert project.transaction_labels == ["outer"]
+
+    def test_exception_closes_the_batch(self, ops):
+        project = ops.project
+
+        with pytest.raises(ValueError):
+            with project.Batch("Import", save=True):
+                ops.Create("a")
+                ops.Fail()
+
+        assert project.transactions_closed == 1
+        assert project._batch_depth == 0
+        assert project.saves == 0
+
+    def test_save_once_at_the_end(self, ops):
+        project = ops.project
+
+        with project.Batch("Import", save=True):
+            with project.Batch("inner", save=True):
+                ops.Create("a")
+            assert project.saves == 0
+
+        assert project.saves == 1
+
+    def test_read_only_project_rejected(self, mock_project_read_only):
+        from flexlibs2.code.exceptions import FP_ReadOnlyError
+
+        with pytest.raises(FP_ReadOnlyError):
+            with mock_project_read_only.Batch():
+                pass
+
+        assert mock_project_read_only.transactions_opened == 0
@@ -0,0 +1,84 @@
+#
+#   test_cast_lookup.py
+#
+#   Class: TestCastLookup
+#          Unit tests for the interface lookup behind cast_to_concrete()
+#          in flexlibs2.code.lcm_casting: one ClassName read per cast, no
+#          GetType() call (a .NET round trip the lookup does not need),
+#          and no caching by Python wrapper type, which pythonnet shares
+#          between LCM classes returned through the same interface. Uses
+#          stand-in objects and a stand-in interface map; no live FLEx
+#          project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import pytest
+
+
+class _LcmObject:
+    """Stand-in LCM object that counts its .NET member reads."""
+
+    class_name_reads = 0
+    get_type_calls = 0
+
+    def __init__(self, class_name):
+        self._class_name = class_name
+
+    def GetType(self):
+        type(self).get_type_calls += 1
+        return type(self)
+
+    @property
+    def ClassName(self):
+        type(self).class_name_reads += 1
+        return self._class_name
+
+
+class _IFake:
+    """Stand-in interface: calling it 'casts' by wrapping the object."""
+
+    def __init__(self, obj):
+        self.obj = obj
+
+
+@pytest.fixture
+def casting(monkeypatch):
+    from flexlibs2.code import lcm_casting
+
+    monkeypatch.setattr(lcm_casting, "_interfaces_loaded", True)
+    monkeypatch.setattr(lcm_casting, "_interface_cache", {"MoStemMsa": _IFake})
+    _LcmObject.class_name_reads = 0
+    _LcmObject.get_type_calls = 0
+    return lcm_casting
+
+
+class TestCastLookup:
+
+    def test_one_class_name_read_per_cast(self, casting):
+        objs = [_LcmObject("MoStemMsa") for _ in range(50)]
+
+        cast = [casting.cast_to_concrete(obj) for obj in objs]
+
+        assert all(isinstance(c, _IFake) for c in cast)
+        assert [c.obj for c in cast] == objs
+        assert _LcmObject.class_name_reads == 50
+        assert _LcmObject.get_type_calls == 0
+
+    def test_same_wrapper_type_different_classes(self, casting):
+        # Both objects share a Python type, as pythonnet wrappers returned
+        # through the same interface (e.g. .Owner) do.
+        stem = _LcmObject("MoStemMsa")
+        entry = _LcmObject("LexEntry")
+
+        assert isinstance(casting.cast_to_concrete(stem), _IFake)
+        assert casting.cast_to_concrete(entry) is entry
+        assert isinstance(casting.cast_to_concrete(stem), _IFake)
+
+    def test_object_without_class_name_returned_unchanged(self, casting):
+        obj = object()
+
+        assert casting.cast_to_concrete(obj) is obj
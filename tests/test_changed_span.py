@@ -0,0 +1,72 @@
+#
+#   test_changed_span.py
+#
+#   Class: TestChangedSpan
+#          Unit tests for `changed_span()` in
+#          flexlibs2.code.Shared.string_utils, the prefix/suffix diff used
+#          by SegmentOperations.IncrementalReparse to replace only the
+#          part of a paragraph that changed.
+#
+#          These tests are pure Python — no SIL.LCModel / FieldWorks
+#          dependency — so they run in any environment.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+import pytest
+
+from flexlibs2.code.Shared.string_utils import changed_span
+
+
+def _apply(old, new):
+    start, old_end, new_end = changed_span(old, new)
+    return old[:start] + new[start:new_end] + old[old_end:]
+
+
+class TestChangedSpan:
+
+    def test_equal_strings(self):
+        assert changed_span("same", "same") is None
+        assert changed_span(None, "") is None
+
+    def test_insertion(self):
+        assert changed_span("The dog ran.", "The dogs ran.") == (7, 7, 8)
+
+    def test_deletion(self):
+        assert changed_span("Hi , there.", "Hi, there.") == (2, 3, 2)
+
+    def test_replacement_in_middle(self):
+        assert changed_span("One. Two. Three.", "One. Too. Three.") == (6, 7, 7)
+
+    def test_prefix_and_suffix_do_not_overlap(self):
+        # "aaa" -> "aa": the common suffix must not reuse prefix chars.
+        start, old_end, new_end = changed_span("aaa", "aa")
+        assert start <= old_end and start <= new_end
+        assert (old_end - start) - (new_end - start) == 1
+
+    @pytest.mark.parametrize("old, new", [
+        ("", "abc"),
+        ("abc", ""),
+        ("abcabc", "abc"),
+        ("a. b. c.", "a! b. c?"),
+        ("xyz", "xyzxyz"),
+    ])
+    def test_applying_span_reproduces_new(self, old, new):
+        assert _apply(old, new) == new
+
+
+class TestUtf16Offset:
+
+    def test_bmp_text_is_unchanged(self):
+        from flexlibs2.code.Shared.string_utils import utf16_offset
+
+        assert utf16_offset("café", 4) == 4
+
+    def test_astral_characters_count_twice(self):
+        from flexlibs2.code.Shared.string_utils import utf16_offset
+
+        text = "a\U0001D11Eb\U00020000c"
+        for index in range(len(text) + 1):
+            assert utf16_offset(text, index) == len(text[:index].encode("utf-16-le")) // 2
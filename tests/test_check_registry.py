@@ -0,0 +1,197 @@
+#
+#   test_check_registry.py
+#
+#   Class: TestRegisterCheck
+#          CheckOperations.RegisterCheck() / UnregisterCheck(): a
+#          registered row or grouping check runs under its check type's
+#          name, and unregistering it removes it.
+#
+#   Class: TestIncrementalRun
+#          RunCheck(..., incremental=True) rechecks only entries whose
+#          DateModified is later than the last run and merges them into the
+#          cached results: stale issues for entries that now pass, and
+#          deleted entries, are dropped.
+#
+#          Stand-in LCM objects; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+class _Entry:
+    """A stand-in ILexEntry with a citation form and a DateModified."""
+
+    def __init__(self, hvo, citation="", modified=None):
+        self.Hvo = hvo
+        self.citation = citation
+        self.SensesOS = []
+        self.DateModified = modified or datetime.now() - timedelta(days=1)
+        self.IsValidObject = True
+
+    def edit(self, citation):
+        self.citation = citation
+        self.DateModified = datetime.now() + timedelta(hours=1)
+
+
+def _check(name):
+    name_string = SimpleNamespace(get_String=lambda ws: SimpleNamespace(Text=name))
+    return SimpleNamespace(Guid=f"guid-{name}", Name=name_string, SubPossibilitiesOS=[])
+
+
+class _CountingCheck:
+    """Row check: "error" for an entry without a citation form."""
+
+    def __init__(self):
+        self.seen = []
+
+    def __call__(self, entry, senses, ws):
+        self.seen.append(entry.Hvo)
+        return None if entry.citation else "error"
+
+
+@pytest.fixture
+def checks():
+    from flexlibs2.code.System import CheckOperations as module
+
+    ops = module.CheckOperations(Mock())
+    check_types = [_check("Missing Citation"), _check("Same Citation"), _check("Missing Gloss")]
+    ops._GetCheckList = lambda: SimpleNamespace(PossibilitiesOS=check_types)
+    for check_type in check_types:
+        ops._check_enabled[check_type.Guid] = True
+
+    with patch.object(module, "ILexEntry", _Entry), \
+         patch.object(module, "ICmPossibility", lambda obj: obj), \
+         patch.object(module, "ITsString", lambda ts: ts), \
+         patch.object(module, "_to_net_datetime", lambda timestamp: timestamp):
+        yield module, ops, {ops.GetName(c): c for c in check_types}
+
+
+class TestRegisterCheck:
+
+    def test_registered_check_runs_by_name(self, checks):
+        _module, ops, by_name = checks
+        ops.RegisterCheck("Missing Citation", _CountingCheck())
+        entries = [_Entry(1, "famba"), _Entry(2), _Entry(3, "enda")]
+
+        results = ops.RunCheck(by_name["Missing Citation"], entries)
+
+        assert list(results["errors"]) == [2]
+        assert results["passed_count"] == 2
+
+    def test_unregister_removes_check(self, checks):
+        _module, ops, by_name = checks
+        ops.RegisterCheck("Missing Citation", _CountingCheck())
+        entries = [_Entry(1), _Entry(2)]
+        ops.RunCheck(by_name["Missing Citation"], entries)
+
+        assert ops.UnregisterCheck("Missing Citation") is True
+        # Its cached results go with it ...
+        assert ops.GetCheckResults(by_name["Missing Citation"]) is None
+        # ... and an unregistered name passes every entry.
+        results = ops.RunCheck(by_name["Missing Citation"], entries)
+        assert results["errors"] == {} and results["passed_count"] == 2
+        assert ops.UnregisterCheck("Missing Citation") is False
+
+    def test_register_replaces_builtin(self, checks):
+        _module, ops, by_name = checks
+        ops.RegisterCheck("Missing Gloss", lambda entry, senses, ws: "warning")
+
+        results = ops.RunCheck(by_name["Missing Gloss"], [_Entry(1)])
+
+        assert list(results["warnings"]) == [1]
+
+    def test_grouping_check(self, checks):
+        _module, ops, by_name = checks
+        ops.RegisterCheck("Same Citation", lambda entry, senses, ws: entry.citation or None,
+                          grouping=True, severity="error")
+        entries = [_Entry(1, "ka"), _Entry(2, "la"), _Entry(3, "ka"), _Entry(4)]
+
+        results = ops.RunCheck(by_name["Same Citation"], entries)
+
+        assert set(results["errors"]) == {1, 3}
+        assert results["warnings"] == {}
+
+    @pytest.mark.parametrize("kwargs", [{"check_func": "not callable"},
+                                        {"check_func": len, "severity": "info"}])
+    def test_bad_registration(self, checks, kwargs):
+        module, ops, _by_name = checks
+
+        with pytest.raises(module.FP_ParameterError):
+            ops.RegisterCheck("Missing Citation", **kwargs)
+
+
+class TestIncrementalRun:
+
+    def test_rechecks_only_modified_entries(self, checks):
+        _module, ops, by_name = checks
+        check_func = _CountingCheck()
+        ops.RegisterCheck("Missing Citation", check_func)
+        entries = [_Entry(1, "famba"), _Entry(2), _Entry(3), _Entry(4, "enda")]
+        ops.RunCheck(by_name["Missing Citation"], entries)
+        check_func.seen.clear()
+
+        entries[3].edit("")
+        results = ops.RunCheck(by_name["Missing Citation"], entries, incremental=True)
+
+        assert check_func.seen == [4]
+        assert set(results["errors"]) == {2, 3, 4}
+        assert results["passed_count"] == 1
+
+    def test_stale_errors_dropped(self, checks):
+        _module, ops, by_name = checks
+        ops.RegisterCheck("Missing Citation", _CountingCheck())
+        entries = [_Entry(1), _Entry(2), _Entry(3, "enda")]
+        ops.RunCheck(by_name["Missing Citation"], entries)
+
+        entries[0].edit("famba")
+        results = ops.RunCheck(by_name["Missing Citation"], entries, incremental=True)
+
+        assert list(results["errors"]) == [2]
+        assert results["passed_count"] == 2
+        assert ops.GetIssuesForObject(by_name["Missing Citation"], 1) == []
+
+    def test_deleted_entries_dropped(self, checks):
+        _module, ops, by_name = checks
+        ops.RegisterCheck("Missing Citation", _CountingCheck())
+        entries = [_Entry(1), _Entry(2)]
+        ops.RunCheck(by_name["Missing Citation"], entries)
+
+        entries[0].IsValidObject = False
+        results = ops.RunCheck(by_name["Missing Citation"], entries[1:], incremental=True)
+
+        assert list(results["errors"]) == [2]
+
+    def test_no_cached_results_runs_in_full(self, checks):
+        _module, ops, by_name = checks
+        check_func = _CountingCheck()
+        ops.RegisterCheck("Missing Citation", check_func)
+
+        ops.RunCheck(by_name["Missing Citation"], [_Entry(1), _Entry(2)], incremental=True)
+
+        assert check_func.seen == [1, 2]
+
+    def test_grouping_checks_always_see_every_entry(self, checks):
+        _module, ops, by_name = checks
+        check_func = _CountingCheck()
+        ops.RegisterCheck("Missing Citation", check_func)
+        ops.RegisterCheck("Same Citation", lambda entry, senses, ws: entry.citation or None,
+                          grouping=True)
+        entries = [_Entry(1, "ka"), _Entry(2, "la"), _Entry(3, "ma")]
+        both = [by_name["Missing Citation"], by_name["Same Citation"]]
+        ops.RunChecks(both, target_objects=entries)
+        check_func.seen.clear()
+
+        entries[2].edit("ka")
+        all_results = ops.RunChecks(both, target_objects=iter(entries), incremental=True)
+
+        assert check_func.seen == [3]
+        assert set(all_results["Same Citation"]["warnings"]) == {1, 3}
@@ -0,0 +1,243 @@
+#
+#   test_compiled_filters.py
+#
+#   Class: TestCompiledCriteria
+#          The compiled predicates behind FilterOperations.CompileFilter()
+#          give the same answer, criterion by criterion, as the per-object
+#          interpreter they replaced (_MatchLexEntryCriteria,
+#          _MatchWordformCriteria, _MatchTextCriteria).
+#
+#   Class: TestCompileFilterCache
+#          CompileFilter() reuses a compiled predicate per filter GUID and
+#          recompiles when date_modified or the criteria change; an invalid
+#          regex is reported as FP_ParameterError.
+#
+#   Class: TestNativeFilterTypes
+#          Example, NotebookRecord and ReversalEntry filters match on
+#          their own criteria and stream their own repositories.
+#
+#          Stand-in LCM objects; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+def _ms(text):
+    """A stand-in multi-string with the same text in every alternative."""
+    alt = SimpleNamespace(Text=text)
+    return SimpleNamespace(BestAnalysisAlternative=alt, BestVernacularAlternative=alt)
+
+
+def _possibility(hvo, name):
+    return SimpleNamespace(Hvo=hvo, Name=_ms(name), SubPossibilitiesOS=[])
+
+
+STEM = _possibility(1, "stem")
+ROOT = _possibility(2, "root")
+NARRATIVE = _possibility(3, "Narrative")
+PROCEDURAL = _possibility(4, "Procedural")
+INTERVIEW = _possibility(5, "Interview")
+OBSERVATION = _possibility(6, "Observation")
+REV_NOUN = _possibility(7, "noun")
+REV_VERB = _possibility(8, "verb")
+
+
+def _entry(form="famba", morph_type=STEM):
+    lexeme = SimpleNamespace(Form=_ms(form), MorphTypeRA=morph_type)
+    return SimpleNamespace(LexemeFormOA=lexeme, SensesOS=[])
+
+
+def _wordform(form="famba", status=1):
+    return SimpleNamespace(Form=_ms(form), SpellingStatus=status)
+
+
+def _text(title="Hare and Tortoise", genres=()):
+    return SimpleNamespace(Title=_ms(title), GenresRC=list(genres))
+
+
+def _filter(filter_type, criteria, guid=None, modified="2026-01-01 10:00:00"):
+    filter_obj = {"filter_type": filter_type, "criteria": criteria}
+    if guid is not None:
+        filter_obj.update(guid=guid, date_modified=modified)
+    return filter_obj
+
+
+@pytest.fixture
+def filters():
+    from flexlibs2.code.Shared import FilterOperations as module
+
+    project = Mock()
+    project.lexDB.MorphTypesOA.PossibilitiesOS = [STEM, ROOT]
+    project.lp.GenreListOA.PossibilitiesOS = [NARRATIVE, PROCEDURAL]
+    project.lp.ResearchNotebookOA.RecTypesOA.PossibilitiesOS = [INTERVIEW, OBSERVATION]
+    project.lexDB.ReversalIndexesOC = [
+        SimpleNamespace(PartsOfSpeechOA=SimpleNamespace(PossibilitiesOS=[REV_NOUN])),
+        SimpleNamespace(PartsOfSpeechOA=SimpleNamespace(PossibilitiesOS=[REV_VERB])),
+    ]
+
+    with patch.object(module, "ITsString", lambda ts: ts):
+        yield module, module.FilterOperations(project)
+
+
+# (filter type, criteria, object, what the old interpreter returned)
+_PARITY_CASES = [
+    ("LexEntry", {"morph_type": "Stem"}, _entry(morph_type=STEM), True),
+    ("LexEntry", {"morph_type": "stem"}, _entry(morph_type=ROOT), False),
+    ("LexEntry", {"morph_type": "stem"}, _entry(morph_type=None), True),
+    ("LexEntry", {"morph_type": "stem"}, SimpleNamespace(LexemeFormOA=None), True),
+    ("LexEntry", {"form_pattern": "^fa"}, _entry("famba"), True),
+    ("LexEntry", {"form_pattern": "^fa"}, _entry("enda"), False),
+    ("LexEntry", {"form_pattern": "^fa"}, _entry("***"), True),
+    ("LexEntry", {"form_pattern": "^fa"}, SimpleNamespace(LexemeFormOA=None), False),
+    ("LexEntry", {"morph_type": "root", "form_pattern": "^fa"}, _entry("famba", ROOT), True),
+    ("LexEntry", {"morph_type": "root", "form_pattern": "^fa"}, _entry("famba", STEM), False),
+    ("Wordform", {"spelling_status": 1}, _wordform(status=1), True),
+    ("Wordform", {"spelling_status": 2}, _wordform(status=1), False),
+    ("Wordform", {"form_pattern": "mb"}, _wordform("famba"), True),
+    ("Wordform", {"form_pattern": "mb"}, _wordform("enda"), False),
+    ("Wordform", {"form_pattern": "mb"}, _wordform(None), True),
+    ("Text", {"genre": "narrative"}, _text(genres=[PROCEDURAL, NARRATIVE]), True),
+    ("Text", {"genre": "narrative"}, _text(genres=[PROCEDURAL]), False),
+    ("Text", {"genre": "narrative"}, _text(genres=[]), False),
+    ("Text", {"title_pattern": "Hare"}, _text("Hare and Tortoise"), True),
+    ("Text", {"title_pattern": "Hare"}, _text("The Lion"), False),
+    ("Text", {"title_pattern": "Hare"}, _text(""), True),
+    ("Custom", {"anything": "at all"}, object(), True),
+]
+
+
+class TestCompiledCriteria:
+
+    @pytest.mark.parametrize("filter_type, criteria, obj, expected", _PARITY_CASES)
+    def test_matches_old_interpreter(self, filters, filter_type, criteria, obj, expected):
+        _module, ops = filters
+
+        assert ops.CompileFilter(_filter(filter_type, criteria))(obj) is expected
+
+    def test_apply_filter_keeps_collection_order(self, filters):
+        _module, ops = filters
+        entries = [_entry("famba"), _entry("enda"), _entry("fala")]
+
+        matched = ops.ApplyFilter(_filter("LexEntry", {"form_pattern": "^fa"}), entries)
+
+        assert matched == [entries[0], entries[2]]
+
+
+class TestCompileFilterCache:
+
+    def test_cache_hit_per_guid(self, filters):
+        _module, ops = filters
+        verbs = _filter("LexEntry", {"form_pattern": "^fa"}, guid="g1")
+
+        with patch.object(ops, "_CompileCriteria", wraps=ops._CompileCriteria) as compile_criteria:
+            first = ops.CompileFilter(verbs)
+            ops.ApplyFilter(verbs, [_entry()])
+            ops.GetMatchCount(verbs, [_entry()])
+
+        assert ops.CompileFilter(verbs) is first
+        assert compile_criteria.call_count == 1
+
+    def test_date_modified_invalidates(self, filters):
+        _module, ops = filters
+        verbs = _filter("LexEntry", {"form_pattern": "^fa"}, guid="g1")
+        first = ops.CompileFilter(verbs)
+
+        verbs["date_modified"] = "2026-01-01 10:00:05"
+
+        assert ops.CompileFilter(verbs) is not first
+
+    def test_criteria_edit_invalidates_within_same_second(self, filters):
+        _module, ops = filters
+        verbs = _filter("LexEntry", {"form_pattern": "^fa"}, guid="g1")
+        ops.CompileFilter(verbs)
+
+        verbs["criteria"]["form_pattern"] = "^en"
+
+        assert ops.CompileFilter(verbs)(_entry("enda"))
+
+    def test_filters_cached_separately(self, filters):
+        _module, ops = filters
+        fa = ops.CompileFilter(_filter("LexEntry", {"form_pattern": "^fa"}, guid="g1"))
+        en = ops.CompileFilter(_filter("LexEntry", {"form_pattern": "^en"}, guid="g2"))
+
+        assert fa(_entry("famba")) and not en(_entry("famba"))
+        assert ops.CompileFilter(_filter("LexEntry", {"form_pattern": "^fa"}, guid="g1")) is fa
+
+    @pytest.mark.parametrize("method", ["CompileFilter", "ApplyFilter", "GetMatchCount"])
+    def test_invalid_regex_raises_parameter_error(self, filters, method):
+        module, ops = filters
+        bad = _filter("LexEntry", {"form_pattern": "(unclosed"}, guid="g1")
+        args = (bad,) if method == "CompileFilter" else (bad, [_entry()])
+
+        with pytest.raises(module.FP_ParameterError, match="Invalid regular expression"):
+            getattr(ops, method)(*args)
+
+
+def _example(text="Alifamba.", translations=0):
+    return SimpleNamespace(Example=_ms(text), TranslationsOC=SimpleNamespace(Count=translations))
+
+
+def _record(title="Market day", record_type=INTERVIEW):
+    return SimpleNamespace(Title=_ms(title), TypeRA=record_type)
+
+
+def _reversal(form="walk", pos=REV_VERB):
+    return SimpleNamespace(ReversalForm=_ms(form), PartOfSpeechRA=pos)
+
+
+class TestNativeFilterTypes:
+
+    @pytest.mark.parametrize("criteria, match, non_match", [
+        ({"has_translation": True}, _example(translations=1), _example(translations=0)),
+        ({"example_pattern": "famba"}, _example("Alifamba."), _example("Nyumba.")),
+    ])
+    def test_example(self, filters, criteria, match, non_match):
+        _module, ops = filters
+        matches = ops.CompileFilter(_filter("Example", criteria))
+
+        assert matches(match)
+        assert not matches(non_match)
+
+    @pytest.mark.parametrize("criteria, match, non_match", [
+        ({"record_type": "interview"}, _record(record_type=INTERVIEW), _record(record_type=OBSERVATION)),
+        ({"title_pattern": "^Market"}, _record("Market day"), _record("Harvest")),
+    ])
+    def test_notebook_record(self, filters, criteria, match, non_match):
+        _module, ops = filters
+        matches = ops.CompileFilter(_filter("NotebookRecord", criteria))
+
+        assert matches(match)
+        assert not matches(non_match)
+
+    @pytest.mark.parametrize("criteria, match, non_match", [
+        # The POS name is looked up in every reversal index's own list.
+        ({"pos": "Verb"}, _reversal(pos=REV_VERB), _reversal(pos=REV_NOUN)),
+        ({"form_pattern": "^wa"}, _reversal("walk"), _reversal("house")),
+    ])
+    def test_reversal_entry(self, filters, criteria, match, non_match):
+        _module, ops = filters
+        matches = ops.CompileFilter(_filter("ReversalEntry", criteria))
+
+        assert matches(match)
+        assert not matches(non_match)
+
+    @pytest.mark.parametrize("filter_type, repository", [
+        ("Example", "ILexExampleSentenceRepository"),
+        ("NotebookRecord", "IRnGenericRecRepository"),
+        ("ReversalEntry", "IReversalIndexEntryRepository"),
+        ("Sense", "ILexSenseRepository"),
+    ])
+    def test_streams_own_repository(self, filters, filter_type, repository):
+        module, ops = filters
+        ops.project.ObjectsIn.return_value = iter([object(), object()])
+
+        assert ops.GetMatchCount(_filter(filter_type, {})) == 2
+        ops.project.ObjectsIn.assert_called_once_with(getattr(module, repository))
@@ -0,0 +1,162 @@
+#
+#   test_concordance_index.py
+#
+#   Class: TestConcordanceIndex
+#          Unit tests for the in-memory KWIC index (_ConcordanceIndex)
+#          behind SegmentOperations.BuildConcordance() / Concordance():
+#          tokenizing, lookup, context slicing and paragraph re-indexing,
+#          and the refresh/drop hooks used by the Segment, Paragraph and
+#          Text operations. Stand-in LCM objects; no live FLEx project
+#          required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import unicodedata
+from types import SimpleNamespace
+
+
+def _index(include_analyses=False):
+    from flexlibs2.code._concordance import _ConcordanceIndex
+    return _ConcordanceIndex(include_analyses)
+
+
+class TestTokenize:
+
+    def test_words_and_offsets(self):
+        from flexlibs2.code._concordance import tokenize
+
+        assert tokenize("Hi, there! 42x") == [
+            ("Hi", 0, 2), ("there", 4, 9), ("42x", 11, 14),
+        ]
+
+    def test_combining_marks_stay_in_word(self):
+        from flexlibs2.code._concordance import tokenize
+
+        word = unicodedata.normalize("NFD", "café")
+        assert tokenize(word + ".") == [(word, 0, len(word))]
+
+    def test_empty(self):
+        from flexlibs2.code._concordance import tokenize
+
+        assert tokenize("") == []
+        assert tokenize(None) == []
+
+
+class TestConcordanceIndex:
+
+    def test_kwic_offsets_and_context(self):
+        index = _index()
+        index.index_paragraph(10, [
+            (1, 0, "The dog ran.", ()),
+            (2, 13, "A dog sat.", ()),
+        ])
+
+        lines = index.kwic("DOG", width=4)
+
+        assert [(l["segment"], l["begin"], l["end"]) for l in lines] == [
+            (1, 4, 7), (2, 15, 18),
+        ]
+        assert (lines[0]["left"], lines[0]["match"], lines[0]["right"]) == (
+            "The ", "dog", " ran",
+        )
+        assert lines[1]["paragraph"] == 10
+
+    def test_offsets_count_utf16_code_units(self):
+        # U+1D11E and the Deseret letters are outside the BMP, so each
+        # takes two UTF-16 code units, as ISegment.BeginOffset counts.
+        index = _index()
+        index.add_segment(1, 10, 5, "\U0001D11E dog \U00010428\U00010429 ran.")
+
+        dog = index.kwic("dog")[0]
+        deseret = index.kwic("\U00010428\U00010429")[0]
+
+        assert (dog["begin"], dog["end"]) == (5 + 3, 5 + 6)
+        assert (deseret["begin"], deseret["end"]) == (5 + 7, 5 + 11)
+        assert (dog["left"], dog["match"]) == ("\U0001D11E ", "dog")
+        assert deseret["match"] == "\U00010428\U00010429"
+
+    def test_nfc_query_matches_nfd_text(self):
+        index = _index()
+        index.add_segment(1, 10, 0, unicodedata.normalize("NFD", "Un café."))
+
+        assert len(index.kwic(unicodedata.normalize("NFC", "Café"))) == 1
+
+    def test_extra_hvo_keys(self):
+        index = _index(include_analyses=True)
+        index.add_segment(1, 10, 0, "dogs ran", extra_keys=[(5001, 0, 4)])
+
+        assert index.lookup(5001) == [(1, 0, 4)]
+        assert index.kwic(5001)[0]["match"] == "dogs"
+
+    def test_reindex_paragraph_replaces_old_hits(self):
+        index = _index()
+        index.index_paragraph(10, [(1, 0, "old words", ())])
+        index.index_paragraph(10, [(1, 0, "new", ()), (2, 4, "words", ())])
+
+        assert index.lookup("old") == []
+        assert index.lookup("words") == [(2, 0, 5)]
+        assert len(index) == 2
+
+    def test_empty_paragraph_stays_registered(self):
+        index = _index()
+        index.index_paragraph(10, [])
+
+        assert index.has_paragraph(10)
+        assert not index.has_paragraph(11)
+
+    def test_remove_segment_and_paragraph(self):
+        index = _index()
+        index.index_paragraph(10, [(1, 0, "a b", ()), (2, 4, "b c", ())])
+
+        index.remove_segment(1)
+        assert index.lookup("a") == []
+        assert index.lookup("b") == [(2, 0, 1)]
+        assert 1 not in index
+
+        index.remove_paragraph(10)
+        assert len(index) == 0
+        assert not index.has_paragraph(10)
+        assert index._postings == {}
+
+
+class TestParagraphHooks:
+
+    @staticmethod
+    def _para(hvo, *texts):
+        segments = []
+        begin = 0
+        for i, text in enumerate(texts):
+            segments.append(SimpleNamespace(
+                Hvo=hvo * 10 + i, BeginOffset=begin,
+                BaselineText=SimpleNamespace(Text=text), AnalysesRS=[]))
+            begin += len(text)
+        return SimpleNamespace(Hvo=hvo, SegmentsOS=segments)
+
+    def test_refresh_only_covered_paragraphs(self):
+        from flexlibs2.code._concordance import paragraph_segments, refresh_concordance
+
+        project = SimpleNamespace(_concordance=_index())
+        project._concordance.index_paragraph(5, paragraph_segments(self._para(5, "old words")))
+
+        refresh_concordance(project, self._para(5, "new ", "words"))
+        refresh_concordance(project, self._para(6, "other"))
+
+        assert project._concordance.lookup("old") == []
+        assert project._concordance.kwic("words")[0]["begin"] == 4
+        assert not project._concordance.has_paragraph(6)
+
+    def test_drop_paragraphs(self):
+        from flexlibs2.code._concordance import drop_from_concordance, paragraph_segments
+
+        project = SimpleNamespace(_concordance=_index())
+        for hvo in (5, 6):
+            project._concordance.index_paragraph(hvo, paragraph_segments(self._para(hvo, "dog")))
+
+        drop_from_concordance(project, [5])
+
+        assert [hit[0] for hit in project._concordance.lookup("dog")] == [60]
+        drop_from_concordance(SimpleNamespace(), [5])
@@ -0,0 +1,127 @@
+#
+#   test_corpus_frequencies.py
+#
+#   Class: TestGetCorpusFrequencies
+#          Wordforms.GetCorpusFrequencies(): token counts per wordform, per
+#          text and per genre in one pass; punctuation is skipped, forms
+#          differing only in case are separate wordforms, texts= limits
+#          the count, and an HVO that is not a text raises
+#          FP_ParameterError.
+#
+#          Stand-in LCM objects; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+class _IText:
+    """Stand-in for the IText interface; texts below are instances."""
+
+    def __init__(self, hvo, segments, genres=()):
+        self.Hvo = hvo
+        self.GenresRC = [SimpleNamespace(Hvo=g) for g in genres]
+        paragraph = SimpleNamespace(SegmentsOS=[SimpleNamespace(AnalysesRS=tokens) for tokens in segments])
+        self.ContentsOA = SimpleNamespace(ParagraphsOS=[paragraph])
+
+
+THE, THE_UPPER, DOG, RAN = (SimpleNamespace(Hvo=h) for h in (100, 101, 102, 103))
+
+
+def _word(wordform):
+    """A token: a wordform, or an analysis or gloss of one."""
+    return SimpleNamespace(Wordform=wordform)
+
+
+PUNCTUATION = SimpleNamespace(Wordform=None)
+
+
+def _corpus():
+    # "The dog ran. the dog."  /  "Ran!"
+    text1 = _IText(1, [
+        [_word(THE_UPPER), _word(DOG), _word(RAN), PUNCTUATION],
+        [_word(THE), _word(DOG), PUNCTUATION],
+    ], genres=[50])
+    text2 = _IText(2, [[_word(RAN), PUNCTUATION]])
+    text3 = _IText(3, [], genres=[50, 51])
+    text3.ContentsOA = None
+    return text1, text2, text3
+
+
+@pytest.fixture
+def wordforms():
+    from flexlibs2.code.TextsWords import WordformOperations as module
+
+    project = Mock()
+    corpus = _corpus()
+    objects = {text.Hvo: text for text in corpus}
+    objects[900] = SimpleNamespace(Hvo=900)
+    project.Object.side_effect = objects.__getitem__
+    project.Texts.GetAll.return_value = list(corpus)
+
+    with patch.object(module, "IStTxtPara", lambda para: para), \
+         patch.object(module, "IText", _IText):
+        yield module, module.WordformOperations(project)
+
+
+class TestGetCorpusFrequencies:
+
+    def test_counts(self, wordforms):
+        _module, ops = wordforms
+
+        freq = ops.GetCorpusFrequencies()
+
+        assert freq["tokens"] == 6
+        assert freq["wordforms"] == Counter({102: 2, 103: 2, 100: 1, 101: 1})
+        assert freq["by_text"] == {
+            1: Counter({102: 2, 101: 1, 103: 1, 100: 1}),
+            2: Counter({103: 1}),
+            3: Counter(),
+        }
+        assert freq["by_genre"] == {
+            50: Counter({102: 2, 101: 1, 103: 1, 100: 1}),
+            None: Counter({103: 1}),
+            51: Counter(),
+        }
+
+    def test_case_variants_are_separate_wordforms(self, wordforms):
+        _module, ops = wordforms
+
+        counts = ops.GetCorpusFrequencies([1])["wordforms"]
+
+        assert counts[THE.Hvo] == 1
+        assert counts[THE_UPPER.Hvo] == 1
+
+    def test_texts_subset_by_object_or_hvo(self, wordforms):
+        _module, ops = wordforms
+        _text1, text2, _text3 = _corpus()
+
+        by_hvo = ops.GetCorpusFrequencies([2])
+        by_object = ops.GetCorpusFrequencies([text2])
+
+        assert by_hvo == by_object
+        assert by_hvo["tokens"] == 1
+        assert list(by_hvo["by_text"]) == [2]
+        ops.project.Texts.GetAll.assert_not_called()
+
+    def test_non_text_hvo_rejected(self, wordforms):
+        module, ops = wordforms
+
+        with pytest.raises(module.FP_ParameterError, match="HVO 900"):
+            ops.GetCorpusFrequencies([1, 900])
+
+    def test_none_text_rejected(self, wordforms):
+        from flexlibs2.code.FLExProject import FP_NullParameterError
+
+        _module, ops = wordforms
+
+        with pytest.raises(FP_NullParameterError):
+            ops.GetCorpusFrequencies([None])
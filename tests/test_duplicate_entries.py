@@ -0,0 +1,142 @@
+#
+#   test_duplicate_entries.py
+#
+#   Class: TestDuplicateEntryKey
+#          Unit tests for the grouping key behind the "Duplicate Entries"
+#          checks: lexeme forms are compared after NFD normalization,
+#          casefolding and whitespace collapsing; morph type (and, with
+#          match_pos, the set of sense POS) must also agree.
+#
+#   Class: TestFindDuplicateEntries
+#          CheckOperations.FindDuplicateEntries() and the registered
+#          "Duplicate Entries" / "Duplicate Entries (Same POS)" checks
+#          report only groups of two or more entries.
+#
+#          Stand-in LCM objects; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import unicodedata
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+STEM = SimpleNamespace(Hvo=1)
+SUFFIX = SimpleNamespace(Hvo=2)
+NOUN = SimpleNamespace(Hvo=10)
+VERB = SimpleNamespace(Hvo=11)
+
+
+class _Entry:
+    """A stand-in ILexEntry; each sense's MSA carries its POS."""
+
+    def __init__(self, hvo, form, morph_type=STEM, pos=()):
+        self.Hvo = hvo
+        self.LexemeFormOA = SimpleNamespace(
+            Form=SimpleNamespace(BestVernacularAlternative=SimpleNamespace(Text=form)),
+            MorphTypeRA=morph_type,
+        )
+        self.SensesOS = [SimpleNamespace(MorphoSyntaxAnalysisRA=SimpleNamespace(pos=p)) for p in pos]
+
+
+def _check(name):
+    return SimpleNamespace(Guid=name, Name=SimpleNamespace(get_String=lambda ws: SimpleNamespace(Text=name)))
+
+
+@pytest.fixture
+def checks():
+    from flexlibs2.code.System import CheckOperations as module
+
+    with patch.object(module, "ILexEntry", _Entry), \
+         patch.object(module, "ICmPossibility", lambda obj: obj), \
+         patch.object(module, "ITsString", lambda ts: ts), \
+         patch.object(module, "get_pos_from_msa", lambda msa: msa.pos):
+        yield module, module.CheckOperations(Mock())
+
+
+class TestDuplicateEntryKey:
+
+    @pytest.mark.parametrize("a, b", [
+        ("Bank", "bank"),
+        (unicodedata.normalize("NFC", "café"), unicodedata.normalize("NFD", "café")),
+        ("ice cream", " ice  cream "),
+        ("ice cream", "ice\tcream"),
+    ])
+    def test_forms_fold_together(self, checks, a, b):
+        module, _ops = checks
+
+        assert module._duplicate_entry_key(_Entry(1, a), [], None) == \
+            module._duplicate_entry_key(_Entry(2, b), [], None)
+
+    def test_morph_type_is_part_of_key(self, checks):
+        module, _ops = checks
+
+        assert module._duplicate_entry_key(_Entry(1, "ka", STEM), [], None) != \
+            module._duplicate_entry_key(_Entry(2, "ka", SUFFIX), [], None)
+
+    @pytest.mark.parametrize("form", ["", "***", "   "])
+    def test_blank_form_has_no_key(self, checks, form):
+        module, _ops = checks
+
+        assert module._duplicate_entry_key(_Entry(1, form), [], None) is None
+
+    def test_match_pos_compares_pos_sets(self, checks):
+        module, _ops = checks
+        noun_verb = _Entry(1, "bank", pos=[NOUN, VERB])
+        verb_noun = _Entry(2, "bank", pos=[VERB, NOUN, VERB])
+        noun = _Entry(3, "bank", pos=[NOUN])
+
+        def key(entry):
+            return module._duplicate_entry_key(entry, entry.SensesOS, None, match_pos=True)
+
+        assert key(noun_verb) == key(verb_noun)
+        assert key(noun_verb) != key(noun)
+
+
+class TestFindDuplicateEntries:
+
+    def test_groups_only_shared_forms(self, checks):
+        _module, ops = checks
+        entries = [_Entry(1, "Bank"), _Entry(2, "river"), _Entry(3, "bank "), _Entry(4, "fish")]
+
+        groups = ops.FindDuplicateEntries(target_objects=entries)
+
+        assert [[e.Hvo for e in group] for group in groups] == [[1, 3]]
+
+    def test_no_group_for_singletons(self, checks):
+        _module, ops = checks
+        entries = [_Entry(1, "bank"), _Entry(2, "river"), _Entry(3, "bank", SUFFIX)]
+
+        assert ops.FindDuplicateEntries(target_objects=entries) == []
+
+    def test_match_pos(self, checks):
+        _module, ops = checks
+        entries = [_Entry(1, "bank", pos=[NOUN]), _Entry(2, "bank", pos=[VERB]),
+                   _Entry(3, "Bank", pos=[NOUN])]
+
+        assert len(ops.FindDuplicateEntries(target_objects=entries)) == 1
+        groups = ops.FindDuplicateEntries(match_pos=True, target_objects=entries)
+        assert [[e.Hvo for e in group] for group in groups] == [[1, 3]]
+
+    @pytest.mark.parametrize("name, flagged", [
+        ("Duplicate Entries", {1, 2, 3}),
+        ("Duplicate Entries (Same POS)", {1, 3}),
+    ])
+    def test_registered_checks(self, checks, name, flagged):
+        _module, ops = checks
+        check = _check(name)
+        ops._check_enabled[check.Guid] = True
+        entries = [_Entry(1, "bank", pos=[NOUN]), _Entry(2, "bank", pos=[VERB]),
+                   _Entry(3, "Bank", pos=[NOUN]), _Entry(4, "river", pos=[NOUN])]
+
+        results = ops.RunCheck(check, entries)
+
+        assert set(results["warnings"]) == flagged
+        assert results["errors"] == {}
+        assert results["passed_count"] == len(entries) - len(flagged)
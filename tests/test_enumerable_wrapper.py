@@ -0,0 +1,190 @@
+#
+#   test_enumerable_wrapper.py
+#
+#   Class: TestEnumerableWrapperLazy
+#          Unit tests for the lazy, count-aware EnumerableWrapper in
+#          flexlibs2.code.BaseOperations. Verifies that len(), indexing,
+#          'in' and slicing answer without materializing the wrapped
+#          collection, and that lazy=False keeps the snapshot behaviour.
+#          No live FLEx project or pythonnet required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import pytest
+
+
+# ---------------------------------------------------------------------------
+# Helpers: .NET-like enumerables that record how far they were enumerated
+# ---------------------------------------------------------------------------
+
+
+class _CountingEnumerable:
+    """
+    Stand-in for a .NET IEnumerable<T> (e.g. repository.AllInstances()).
+
+    Re-enumerable, exposes GetEnumerator, has no Count and no indexer.
+    Records how many items each enumeration pulled.
+    """
+
+    def __init__(self, items):
+        self._items = list(items)
+        self.pulled = 0
+        self.enumerations = 0
+
+    def GetEnumerator(self):
+        return iter(self)
+
+    def __iter__(self):
+        self.enumerations += 1
+        for item in self._items:
+            self.pulled += 1
+            yield item
+
+
+class _MockSequence(_CountingEnumerable):
+    """Stand-in for an ILcmOwningSequence: has Count and a native indexer."""
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.indexed = []
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        self.indexed.append(index)
+        return self._items[index]
+
+
+def _wrapper(*args, **kwargs):
+    from flexlibs2.code.BaseOperations import EnumerableWrapper
+    return EnumerableWrapper(*args, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestEnumerableWrapperLazy:
+    """Lazy mode (default) answers simple questions in O(1) or O(k)."""
+
+    def test_len_uses_count_callable(self):
+        source = _CountingEnumerable(range(1000))
+        wrapped = _wrapper(source, count=lambda: 1000)
+
+        assert len(wrapped) == 1000
+        assert wrapped.Count == 1000
+        assert source.pulled == 0
+
+    def test_len_uses_native_count(self):
+        source = _MockSequence(range(50))
+        wrapped = _wrapper(source)
+
+        assert len(wrapped) == 50
+        assert source.pulled == 0
+
+    def test_len_without_count_does_counting_pass(self):
+        source = _CountingEnumerable(range(20))
+        wrapped = _wrapper(source)
+
+        assert len(wrapped) == 20
+        assert wrapped._cached_list is None
+
+    def test_index_stops_early(self):
+        source = _CountingEnumerable(range(1000))
+        wrapped = _wrapper(source)
+
+        assert wrapped[3] == 3
+        assert source.pulled == 4
+
+    def test_index_uses_native_indexer(self):
+        source = _MockSequence(["a", "b", "c"])
+        wrapped = _wrapper(source)
+
+        assert wrapped[1] == "b"
+        assert wrapped[-1] == "c"
+        assert source.indexed == [1, 2]
+        assert source.pulled == 0
+
+    def test_index_out_of_range(self):
+        wrapped = _wrapper(_CountingEnumerable(range(3)))
+
+        with pytest.raises(IndexError):
+            wrapped[5]
+        with pytest.raises(IndexError):
+            wrapped[-4]
+
+    def test_contains_short_circuits(self):
+        source = _CountingEnumerable(range(1000))
+        wrapped = _wrapper(source)
+
+        assert 2 in wrapped
+        assert source.pulled == 3
+
+    def test_slice_stops_at_stop(self):
+        source = _CountingEnumerable(range(1000))
+        wrapped = _wrapper(source)
+
+        assert wrapped[2:5] == [2, 3, 4]
+        assert source.pulled == 5
+
+    def test_negative_slice(self):
+        wrapped = _wrapper(_CountingEnumerable(range(10)), count=10)
+
+        assert wrapped[-3:] == [7, 8, 9]
+        assert wrapped[::-4] == [9, 5, 1]
+
+    def test_iteration_is_repeatable(self):
+        source = _CountingEnumerable(range(4))
+        wrapped = _wrapper(source, count=4)
+
+        assert list(wrapped) == [0, 1, 2, 3]
+        assert list(wrapped) == [0, 1, 2, 3]
+        assert source.enumerations == 2
+
+
+class TestEnumerableWrapperOneShot:
+    """Generators are buffered incrementally, never more than needed."""
+
+    def test_generator_prefix_only(self):
+        pulled = []
+
+        def gen():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        wrapped = _wrapper(gen())
+
+        assert wrapped[2] == 2
+        assert len(pulled) == 3
+        assert 1 in wrapped
+        assert len(pulled) == 3
+
+    def test_generator_iterates_twice(self):
+        wrapped = _wrapper(iter(range(5)))
+
+        assert wrapped[1] == 1
+        assert list(wrapped) == [0, 1, 2, 3, 4]
+        assert list(wrapped) == [0, 1, 2, 3, 4]
+        assert len(wrapped) == 5
+
+
+class TestEnumerableWrapperMaterializing:
+    """lazy=False keeps the snapshot-on-first-access behaviour."""
+
+    def test_snapshot(self):
+        source = _CountingEnumerable(range(5))
+        wrapped = _wrapper(source, lazy=False)
+
+        assert len(wrapped) == 5
+        assert wrapped[0] == 0
+        assert 4 in wrapped
+        assert list(wrapped) == [0, 1, 2, 3, 4]
+        assert source.enumerations == 1
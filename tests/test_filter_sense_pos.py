@@ -0,0 +1,74 @@
+#
+#   test_filter_sense_pos.py
+#
+#   Class: TestSensePOSFilter
+#          Unit tests for the compiled "pos" criterion of sense and entry
+#          filters (FilterOperations._SensePOSCheck): the POS name is
+#          resolved through project.POS once, then each sense's MSA is
+#          compared by Hvo. LCM string and MSA reads are patched out; no
+#          live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+def _pos(hvo, name):
+    return SimpleNamespace(Hvo=hvo, Name=name)
+
+
+def _sense(pos):
+    # get_pos_from_msa is patched to read msa.pos.
+    msa = SimpleNamespace(pos=pos) if pos is not None else None
+    return SimpleNamespace(MorphoSyntaxAnalysisRA=msa)
+
+
+@pytest.fixture
+def filters():
+    from flexlibs2.code.Shared import FilterOperations as module
+
+    project = Mock()
+    project.POS.GetAll.return_value = [_pos(1, "Noun"), _pos(2, "Verb")]
+
+    with patch.object(module, "_best_text", lambda ms, vernacular=False: ms), \
+         patch.object(module, "get_pos_from_msa", lambda msa: msa.pos):
+        yield module, module.FilterOperations(project)
+
+
+class TestSensePOSFilter:
+
+    def test_sense_filter_matches_by_pos_name(self, filters):
+        module, ops = filters
+        noun, verb = ops.project.POS.GetAll.return_value
+
+        matches = ops._CompileCriteria({"pos": "noun"}, module.FilterTypes.SENSE)
+
+        assert matches(_sense(noun))
+        assert not matches(_sense(verb))
+        assert not matches(_sense(None))
+        # Names are resolved once, when the filter is compiled.
+        assert ops.project.POS.GetAll.call_count == 1
+
+    def test_unknown_pos_matches_nothing(self, filters):
+        module, ops = filters
+        noun, _verb = ops.project.POS.GetAll.return_value
+
+        matches = ops._CompileCriteria({"pos": "Adverb"}, module.FilterTypes.SENSE)
+
+        assert not matches(_sense(noun))
+
+    def test_entry_filter_checks_every_sense(self, filters):
+        module, ops = filters
+        noun, verb = ops.project.POS.GetAll.return_value
+
+        matches = ops._CompileCriteria({"pos": "Verb"}, module.FilterTypes.LEXENTRY)
+
+        assert matches(SimpleNamespace(SensesOS=[_sense(noun), _sense(verb)]))
+        assert not matches(SimpleNamespace(SensesOS=[_sense(noun)]))
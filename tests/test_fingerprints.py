@@ -0,0 +1,157 @@
+#
+#   test_fingerprints.py
+#
+#   Class: TestParagraphFingerprint
+#          Unit tests for ParagraphOperations.GetFingerprint(): a text
+#          edit, a segment offset change, an analysis swap and a
+#          translation edit each change the fingerprint; unchanged data
+#          keeps it, even when writing system handles are numbered
+#          differently (as in another session).
+#
+#   Class: TestTextFingerprint
+#          TextOperations.GetFingerprint() / GetManifest() follow their
+#          paragraphs.
+#
+#          Stand-in LCM objects; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+class _MultiString:
+    """A stand-in IMultiString: {ws handle: text}."""
+
+    def __init__(self, alternatives):
+        self.alternatives = dict(alternatives)
+
+    @property
+    def StringCount(self):
+        return len(self.alternatives)
+
+    def GetStringFromIndex(self, i):
+        ws, text = list(self.alternatives.items())[i]
+        return SimpleNamespace(Text=text), ws
+
+
+def _paragraph(handles=None):
+    """One paragraph, two segments; handles maps ws tag -> handle."""
+    handles = handles or {"en": 1, "fr": 2}
+    en, fr = handles["en"], handles["fr"]
+    segments = [
+        SimpleNamespace(
+            BeginOffset=0, EndOffset=9,
+            AnalysesRS=[SimpleNamespace(Guid="g-famba"), SimpleNamespace(Guid="g-dot")],
+            FreeTranslation=_MultiString({en: "He walked.", fr: "Il a marché."}),
+            LiteralTranslation=_MultiString({}),
+        ),
+        SimpleNamespace(
+            BeginOffset=10, EndOffset=16,
+            AnalysesRS=[SimpleNamespace(Guid="g-nyumba")],
+            FreeTranslation=_MultiString({en: "House."}),
+            LiteralTranslation=None,
+        ),
+    ]
+    return SimpleNamespace(Contents=SimpleNamespace(Text="Alifamba. Nyumba"),
+                           SegmentsOS=segments)
+
+
+def _project(handles=None):
+    handles = handles or {"en": 1, "fr": 2}
+    tags = {handle: SimpleNamespace(Id=tag) for tag, handle in handles.items()}
+    project = Mock()
+    project.project.WritingSystemFactory.get_EngineOrNull.side_effect = tags.get
+    return project
+
+
+@pytest.fixture
+def fingerprint():
+    from flexlibs2.code.TextsWords import ParagraphOperations as module
+
+    def fingerprint(para, project=None):
+        ops = module.ParagraphOperations(project or _project())
+        ops._ParagraphOperations__GetParagraphObject = lambda p: p
+        return ops.GetFingerprint(para)
+
+    with patch.object(module, "ITsString", lambda ts: ts):
+        yield fingerprint
+
+
+class TestParagraphFingerprint:
+
+    def test_unchanged_paragraph_keeps_fingerprint(self, fingerprint):
+        fp = fingerprint(_paragraph())
+
+        assert len(fp) == 40
+        assert fingerprint(_paragraph()) == fp
+
+    def test_stable_across_ws_handle_numbering(self, fingerprint):
+        other = {"en": 7, "fr": 3}
+
+        assert fingerprint(_paragraph(other), _project(other)) == fingerprint(_paragraph())
+
+    def test_text_edit(self, fingerprint):
+        para = _paragraph()
+        para.Contents.Text = "Alifamba! Nyumba"
+
+        assert fingerprint(para) != fingerprint(_paragraph())
+
+    def test_segment_offset_change(self, fingerprint):
+        para = _paragraph()
+        para.SegmentsOS[1].BeginOffset = 9
+
+        assert fingerprint(para) != fingerprint(_paragraph())
+
+    def test_analysis_swap(self, fingerprint):
+        para = _paragraph()
+        para.SegmentsOS[0].AnalysesRS[0] = SimpleNamespace(Guid="g-famba-2")
+
+        assert fingerprint(para) != fingerprint(_paragraph())
+
+    def test_translation_edit(self, fingerprint):
+        para = _paragraph()
+        para.SegmentsOS[1].FreeTranslation.alternatives[2] = "Maison."
+
+        assert fingerprint(para) != fingerprint(_paragraph())
+
+
+@pytest.fixture
+def texts():
+    from flexlibs2.code.TextsWords import TextOperations as module
+
+    project = Mock()
+    project.Paragraphs.GetFingerprint.side_effect = lambda para: para.fp * 40
+    ops = module.TextOperations(project)
+    ops._TextOperations__GetTextObject = lambda text: text
+
+    with patch.object(module, "IStTxtPara", lambda para: para):
+        yield ops
+
+
+def _text(guid, fps):
+    paras = [SimpleNamespace(fp=fp) for fp in fps]
+    return SimpleNamespace(Guid=guid, ContentsOA=SimpleNamespace(ParagraphsOS=paras))
+
+
+class TestTextFingerprint:
+
+    def test_follows_paragraphs_and_order(self, texts):
+        fp = texts.GetFingerprint(_text("t1", "ab"))
+
+        assert texts.GetFingerprint(_text("t1", "ab")) == fp
+        assert texts.GetFingerprint(_text("t1", "ac")) != fp
+        assert texts.GetFingerprint(_text("t1", "ba")) != fp
+        assert texts.GetFingerprint(_text("t1", "abc")) != fp
+
+    def test_manifest_keyed_by_guid(self, texts):
+        manifest = texts.GetManifest([_text("t1", "a"), _text("t2", "b")])
+
+        assert set(manifest) == {"t1", "t2"}
+        assert manifest["t1"] == texts.GetFingerprint(_text("t1", "a"))
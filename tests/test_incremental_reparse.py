@@ -0,0 +1,104 @@
+#
+#   test_incremental_reparse.py
+#
+#   Class: TestIncrementalReparse
+#          Unit tests for SegmentOperations.IncrementalReparse(): the
+#          changed span is passed to the string builder, and compared with
+#          segment offsets, in UTF-16 code units (as LCM counts them), not
+#          Python code points. Uses the counting MockFLExProject from
+#          conftest and stand-in paragraphs; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+
+import pytest
+
+
+def _utf16_len(text):
+    return len(text.encode("utf-16-le")) // 2
+
+
+class _Builder:
+    """Records Replace() calls on a copy of the text, in UTF-16 units."""
+
+    def __init__(self, text):
+        self.units = text.encode("utf-16-le")
+        self.replaced = []
+
+    def Replace(self, start, end, text, props):
+        self.replaced.append((start, end, text))
+        self.units = self.units[:2 * start] + text.encode("utf-16-le") + self.units[2 * end:]
+
+    def GetString(self):
+        return _String(self.units.decode("utf-16-le"))
+
+
+class _String:
+    def __init__(self, text):
+        self.Text = text
+        self.Length = _utf16_len(text)
+        self.builder = None
+
+    def GetBldr(self):
+        self.builder = _Builder(self.Text)
+        return self.builder
+
+
+def _paragraph(sentences):
+    """A stand-in IStTxtPara with one segment per sentence."""
+    segments = []
+    begin = 0
+    for i, sentence in enumerate(sentences):
+        end = begin + _utf16_len(sentence)
+        segments.append(SimpleNamespace(Hvo=100 + i, BeginOffset=begin, EndOffset=end))
+        begin = end
+    return SimpleNamespace(Hvo=50, Contents=_String("".join(sentences)), SegmentsOS=segments)
+
+
+@pytest.fixture
+def segments(mock_project):
+    from flexlibs2.code.TextsWords.SegmentOperations import SegmentOperations
+
+    ops = SegmentOperations(mock_project)
+    ops._SegmentOperations__GetParagraphObject = lambda para: para
+    return ops
+
+
+class TestIncrementalReparse:
+
+    def test_surrogate_pair_before_the_edit(self, segments):
+        # U+1D11E (musical G clef) is one code point but two UTF-16 units.
+        para = _paragraph(["\U0001D11E la. ", "Sol mi. ", "Fa re."])
+        old = para.Contents
+        new_text = "\U0001D11E la. Sol mi! Fa re."
+
+        result = segments.IncrementalReparse(para, new_text)
+
+        # "." -> "!" at code point 12, which is UTF-16 offset 13.
+        assert old.builder.replaced == [(13, 14, "!")]
+        assert para.Contents.Text == new_text
+        assert (result["start"], result["end"]) == (13, 14)
+        # Only the second segment (UTF-16 7..15) touches the span.
+        assert result["affected"] == [101]
+        assert result["preserved"] == 2
+
+    def test_bmp_text_offsets_match_code_points(self, segments):
+        para = _paragraph(["One. ", "Two."])
+
+        result = segments.IncrementalReparse(para, "One. Too.")
+
+        assert (result["start"], result["end"]) == (6, 7)
+        assert para.Contents.Text == "One. Too."
+
+    def test_unchanged_text_writes_nothing(self, segments):
+        para = _paragraph(["\U0001D11E."])
+
+        result = segments.IncrementalReparse(para, "\U0001D11E.")
+
+        assert result["changed"] is False
+        assert segments.project.transactions_opened == 0
@@ -0,0 +1,150 @@
+#
+#   test_index_maintenance.py
+#
+#   Class: TestParagraphEdits, TestTextDelete
+#          The concordance and occurrence indexes stay current when
+#          paragraphs and texts are edited outside SegmentOperations:
+#          Paragraphs.SetText re-indexes the paragraph, and
+#          Paragraphs.Delete / Texts.Delete drop it, so a lookup after the
+#          edit sees no stale hits. Uses the counting MockFLExProject from
+#          conftest and stand-in paragraphs that re-segment when their
+#          Contents are set; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import re
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from flexlibs2.code._concordance import _ConcordanceIndex, paragraph_segments
+from flexlibs2.code._occurrence_index import _OccurrenceIndex, segment_keys
+
+
+def _wordform(hvo):
+    return SimpleNamespace(Hvo=hvo, ClassName="WfiWordform", Wordform=None, Analysis=None)
+
+
+class _Paragraph:
+    """A stand-in IStTxtPara. Setting Contents re-segments at sentence
+    ends, and each word is analysed as wordform HVO 1000 + len(word)."""
+
+    def __init__(self, hvo, text):
+        self.Hvo = hvo
+        self.Contents = SimpleNamespace(Text=text)
+
+    @property
+    def Contents(self):
+        return self._contents
+
+    @Contents.setter
+    def Contents(self, ts):
+        self._contents = ts
+        self.SegmentsOS = []
+        for i, match in enumerate(re.finditer(r"[^.]+\.?", ts.Text)):
+            tokens = []
+            for word in re.findall(r"\w+", match.group()):
+                wordform = _wordform(1000 + len(word))
+                wordform.Wordform = wordform
+                tokens.append(wordform)
+            self.SegmentsOS.append(SimpleNamespace(
+                Hvo=self.Hvo * 10 + i,
+                BeginOffset=match.start(),
+                BaselineText=SimpleNamespace(Text=match.group()),
+                AnalysesRS=tokens,
+            ))
+
+
+def _indexed(project, *paragraphs):
+    concordance = _ConcordanceIndex()
+    occurrences = _OccurrenceIndex()
+    for para in paragraphs:
+        concordance.index_paragraph(para.Hvo, paragraph_segments(para))
+        occurrences.index_paragraph(
+            para.Hvo, [(seg.Hvo, segment_keys(seg)) for seg in para.SegmentsOS])
+    project._concordance = concordance
+    project._occurrences = occurrences
+    return concordance, occurrences
+
+
+@pytest.fixture
+def paragraphs(mock_project):
+    from flexlibs2.code.TextsWords import ParagraphOperations as module
+
+    ops = module.ParagraphOperations(mock_project)
+    ops._ParagraphOperations__GetParagraphObject = lambda para: para
+    make_string = SimpleNamespace(MakeString=lambda text, ws: SimpleNamespace(Text=text))
+    with patch.object(module, "TsStringUtils", make_string):
+        yield ops
+
+
+class TestParagraphEdits:
+
+    def test_set_text_reindexes_paragraph(self, paragraphs):
+        para = _Paragraph(5, "The dog ran. A cat sat.")
+        other = _Paragraph(6, "Dogs bark.")
+        concordance, occurrences = _indexed(paragraphs.project, para, other)
+
+        paragraphs.SetText(para, "The bird flew.")
+
+        assert concordance.lookup("dog") == []
+        assert [hit[0] for hit in concordance.lookup("bird")] == [50]
+        assert [hit[0] for hit in concordance.lookup("dogs")] == [60]
+        # "ran"/"cat"/"sat" (1003) are gone from paragraph 5; "bird"/"flew"
+        # (1004) now occur there alongside "Dogs"/"bark" in paragraph 6.
+        assert occurrences.count(1003) == 1
+        assert sorted(occurrences.segments(1004)) == [50, 60]
+
+    def test_set_text_on_unindexed_paragraph_leaves_index_alone(self, paragraphs):
+        para = _Paragraph(5, "The dog ran.")
+        concordance, _occurrences = _indexed(paragraphs.project)
+
+        paragraphs.SetText(para, "The bird flew.")
+
+        assert not concordance.has_paragraph(5)
+        assert len(concordance) == 0
+
+    def test_delete_drops_paragraph(self, paragraphs):
+        para = _Paragraph(5, "The dog ran.")
+        other = _Paragraph(6, "A dog sat.")
+        concordance, occurrences = _indexed(paragraphs.project, para, other)
+        owner = Mock()
+        paragraphs._GetTypedOwner = lambda obj: owner
+
+        paragraphs.Delete(para)
+
+        owner.ParagraphsOS.Remove.assert_called_once_with(para)
+        assert [hit[0] for hit in concordance.lookup("dog")] == [60]
+        assert not occurrences.has_paragraph(5)
+        assert occurrences.segments(1003) == [60]
+
+
+@pytest.fixture
+def texts(mock_project):
+    from flexlibs2.code.TextsWords import TextOperations as module
+
+    mock_project.lp = Mock()
+    ops = module.TextOperations(mock_project)
+    ops._TextOperations__GetTextObject = lambda text: text
+    return ops
+
+
+class TestTextDelete:
+
+    def test_delete_drops_all_paragraphs(self, texts):
+        kept = _Paragraph(7, "A dog sat.")
+        deleted = [_Paragraph(5, "The dog ran."), _Paragraph(6, "Dogs bark.")]
+        text = SimpleNamespace(ContentsOA=SimpleNamespace(ParagraphsOS=deleted))
+        concordance, occurrences = _indexed(texts.project, kept, *deleted)
+
+        texts.Delete(text)
+
+        texts.project.lp.Texts.Remove.assert_called_once_with(text)
+        assert [hit[0] for hit in concordance.lookup("dog")] == [70]
+        assert concordance.lookup("dogs") == []
+        assert len(occurrences) == 1
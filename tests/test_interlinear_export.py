@@ -0,0 +1,202 @@
+#
+#   test_interlinear_export.py
+#
+#   Class: TestIterInterlinear
+#          Texts.IterInterlinear(): one record per segment with the
+#          documented keys, punctuation and unanalyzed tokens, wordform vs
+#          analysis vs gloss tokens, and texts= checked when the method is
+#          called.
+#
+#   Class: TestExportInterlinearJSONL
+#          ExportInterlinearJSONL() writes one JSON line per segment and
+#          checks every text before it opens (and truncates) the file.
+#
+#          Stand-in LCM objects; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+RECORD_KEYS = {
+    "text", "paragraph", "paragraph_index", "segment", "segment_index",
+    "baseline", "free_translation", "literal_translation", "tokens",
+}
+
+
+class _IText:
+    """Stand-in for the IText interface; texts below are instances."""
+
+    def __init__(self, hvo, paragraphs):
+        self.Hvo = hvo
+        self.ContentsOA = SimpleNamespace(ParagraphsOS=paragraphs)
+
+
+def _wordform(hvo):
+    wordform = SimpleNamespace(Hvo=hvo, ClassName="WfiWordform", Analysis=None)
+    wordform.Wordform = wordform
+    return wordform
+
+
+def _analysis(hvo, wordform, bundles=()):
+    analysis = SimpleNamespace(Hvo=hvo, ClassName="WfiAnalysis", Wordform=wordform,
+                               MorphBundlesOS=[SimpleNamespace(Hvo=b) for b in bundles])
+    analysis.Analysis = analysis
+    return analysis
+
+
+def _gloss(hvo, analysis):
+    return SimpleNamespace(Hvo=hvo, ClassName="WfiGloss", Wordform=analysis.Wordform, Analysis=analysis)
+
+
+PUNCTUATION = SimpleNamespace(Hvo=9, ClassName="PunctuationForm", Wordform=None, Analysis=None)
+
+
+def _segment(hvo, baseline, tokens=()):
+    return SimpleNamespace(Hvo=hvo, baseline=baseline, AnalysesRS=list(tokens))
+
+
+def _corpus():
+    """Text 1: two paragraphs (2 + 1 segments). Text 2: one segment."""
+    wf = _wordform(100)
+    analysis = _analysis(200, wf, bundles=[301, 302])
+    gloss = _gloss(400, analysis)
+    text1 = _IText(1, [
+        SimpleNamespace(Hvo=10, SegmentsOS=[
+            _segment(1000, "Alifamba.", [wf, PUNCTUATION]),
+            _segment(1001, "Famba famba!", [analysis, gloss]),
+        ]),
+        SimpleNamespace(Hvo=11, SegmentsOS=[_segment(1100, "Enda.")]),
+    ])
+    text2 = _IText(2, [SimpleNamespace(Hvo=20, SegmentsOS=[_segment(2000, "Kula.")])])
+    return text1, text2
+
+
+@pytest.fixture
+def texts():
+    from flexlibs2.code.TextsWords import TextOperations as module
+
+    project = Mock()
+    text1, text2 = _corpus()
+    project.Object.side_effect = {1: text1, 2: text2, 10: SimpleNamespace(Hvo=10)}.__getitem__
+    project.Segments = SimpleNamespace(
+        GetBaselineText=lambda seg: seg.baseline,
+        GetFreeTranslation=lambda seg, ws: f"free {seg.Hvo}",
+        GetLiteralTranslation=lambda seg, ws: "",
+    )
+    ops = module.TextOperations(project)
+    ops.GetAll = lambda: [text1, text2]
+
+    with patch.object(module, "IStTxtPara", lambda para: para), \
+         patch.object(module, "IText", _IText):
+        yield module, ops
+
+
+class TestIterInterlinear:
+
+    def test_one_record_per_segment(self, texts):
+        _module, ops = texts
+
+        records = list(ops.IterInterlinear())
+
+        assert [r["segment"] for r in records] == [1000, 1001, 1100, 2000]
+        assert all(set(r) == RECORD_KEYS for r in records)
+
+    def test_record_schema(self, texts):
+        _module, ops = texts
+
+        record = list(ops.IterInterlinear([1]))[2]
+
+        assert record == {
+            "text": 1,
+            "paragraph": 11,
+            "paragraph_index": 1,
+            "segment": 1100,
+            "segment_index": 0,
+            "baseline": "Enda.",
+            "free_translation": "free 1100",
+            "literal_translation": "",
+            "tokens": [],
+        }
+        json.dumps(record)
+
+    def test_wordform_and_punctuation_tokens(self, texts):
+        _module, ops = texts
+
+        tokens = next(ops.IterInterlinear([1]))["tokens"]
+
+        assert tokens == [
+            {"wordform": 100, "analysis": None, "gloss": None, "morph_bundles": []},
+            {"wordform": None, "analysis": None, "gloss": None, "morph_bundles": []},
+        ]
+
+    def test_analysis_and_gloss_tokens(self, texts):
+        _module, ops = texts
+
+        tokens = list(ops.IterInterlinear([1]))[1]["tokens"]
+
+        assert tokens == [
+            {"wordform": 100, "analysis": 200, "gloss": None, "morph_bundles": [301, 302]},
+            {"wordform": 100, "analysis": 200, "gloss": 400, "morph_bundles": [301, 302]},
+        ]
+
+    def test_texts_subset_by_object_or_hvo(self, texts):
+        _module, ops = texts
+        _text1, text2 = ops.GetAll()
+
+        assert [r["segment"] for r in ops.IterInterlinear([text2])] == [2000]
+        assert [r["text"] for r in ops.IterInterlinear([2, 1])] == [2, 1, 1, 1]
+
+    def test_non_text_hvo_rejected_on_call(self, texts):
+        module, ops = texts
+
+        with pytest.raises(module.FP_ParameterError):
+            ops.IterInterlinear([1, 10])
+
+    def test_none_text_rejected_on_call(self, texts):
+        from flexlibs2.code.FLExProject import FP_NullParameterError
+
+        _module, ops = texts
+
+        with pytest.raises(FP_NullParameterError):
+            ops.IterInterlinear([None])
+
+
+class TestExportInterlinearJSONL:
+
+    def test_one_line_per_segment(self, texts, tmp_path):
+        _module, ops = texts
+        path = tmp_path / "corpus.jsonl"
+
+        count = ops.ExportInterlinearJSONL(str(path))
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert count == len(lines) == 4
+        assert [json.loads(line)["segment"] for line in lines] == [1000, 1001, 1100, 2000]
+
+    def test_writes_to_stream(self, texts):
+        import io
+
+        _module, ops = texts
+        stream = io.StringIO()
+
+        assert ops.ExportInterlinearJSONL(stream, texts=[2]) == 1
+        assert json.loads(stream.getvalue())["baseline"] == "Kula."
+
+    def test_bad_text_leaves_existing_file_untouched(self, texts, tmp_path):
+        module, ops = texts
+        path = tmp_path / "corpus.jsonl"
+        path.write_text("previous export\n", encoding="utf-8")
+
+        with pytest.raises(module.FP_ParameterError):
+            ops.ExportInterlinearJSONL(str(path), texts=[1, 10])
+
+        assert path.read_text(encoding="utf-8") == "previous export\n"
@@ -0,0 +1,142 @@
+#
+#   test_iter_filter.py
+#
+#   Class: TestIterFilter
+#          Unit tests for FilterOperations.IterFilter(): limit/offset
+#          paging, no reads past the last match asked for, and argument
+#          errors raised when the method is called (not at the first
+#          next()).
+#
+#   Class: TestGetMatchCount
+#          GetMatchCount() counts matches as the collection streams past,
+#          defaulting to every object of the filter's type.
+#
+#          Stand-in LCM objects; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+class _Collection:
+    """A stand-in repository enumeration that counts the objects read."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.read = 0
+
+    def __iter__(self):
+        for item in self.items:
+            self.read += 1
+            yield item
+
+
+def _entry(form):
+    alt = SimpleNamespace(Text=form)
+    lexeme = SimpleNamespace(Form=SimpleNamespace(BestVernacularAlternative=alt), MorphTypeRA=None)
+    return SimpleNamespace(form=form, LexemeFormOA=lexeme)
+
+
+# Matches every form starting with "fa".
+FA_FILTER = {"guid": "g1", "date_modified": "2026-01-01 10:00:00",
+             "filter_type": "LexEntry", "criteria": {"form_pattern": "^fa"}}
+
+FORMS = ["famba", "enda", "fala", "kula", "fanya", "fata", "nyumba"]
+
+
+@pytest.fixture
+def filters():
+    from flexlibs2.code.Shared import FilterOperations as module
+
+    with patch.object(module, "ITsString", lambda ts: ts):
+        yield module, module.FilterOperations(Mock())
+
+
+class TestIterFilter:
+
+    def test_limit_and_offset_page_through_matches(self, filters):
+        _module, ops = filters
+        entries = [_entry(form) for form in FORMS]
+
+        first = [e.form for e in ops.IterFilter(FA_FILTER, entries, limit=2)]
+        second = [e.form for e in ops.IterFilter(FA_FILTER, entries, limit=2, offset=2)]
+        rest = [e.form for e in ops.IterFilter(FA_FILTER, entries, offset=3)]
+
+        assert first == ["famba", "fala"]
+        assert second == ["fanya", "fata"]
+        assert rest == ["fata"]
+
+    def test_limit_stops_reading_the_collection(self, filters):
+        _module, ops = filters
+        entries = _Collection(_entry(form) for form in FORMS)
+
+        assert len(list(ops.IterFilter(FA_FILTER, entries, limit=2))) == 2
+        # "fala", the second match, is the third object.
+        assert entries.read == 3
+
+    def test_early_stop_reads_nothing_more(self, filters):
+        _module, ops = filters
+        entries = _Collection(_entry(form) for form in FORMS)
+
+        matches = ops.IterFilter(FA_FILTER, entries)
+        assert entries.read == 0
+        assert next(matches).form == "famba"
+        assert entries.read == 1
+
+    def test_defaults_to_repository_of_filter_type(self, filters):
+        module, ops = filters
+        ops.project.ObjectsIn.return_value = iter([_entry("famba"), _entry("enda")])
+
+        assert [e.form for e in ops.IterFilter(FA_FILTER)] == ["famba"]
+        ops.project.ObjectsIn.assert_called_once_with(module.ILexEntryRepository)
+
+    @pytest.mark.parametrize("kwargs", [{"limit": -1}, {"offset": -1}])
+    def test_negative_limit_or_offset_rejected_on_call(self, filters, kwargs):
+        module, ops = filters
+
+        with pytest.raises(module.FP_ParameterError):
+            ops.IterFilter(FA_FILTER, [], **kwargs)
+
+    def test_none_filter_rejected_on_call(self, filters):
+        from flexlibs2.code.FLExProject import FP_NullParameterError
+
+        _module, ops = filters
+
+        with pytest.raises(FP_NullParameterError):
+            ops.IterFilter(None, [])
+
+    def test_invalid_regex_rejected_on_call(self, filters):
+        module, ops = filters
+        bad = dict(FA_FILTER, guid="g2", criteria={"form_pattern": "(unclosed"})
+
+        with pytest.raises(module.FP_ParameterError, match="Invalid regular expression"):
+            ops.IterFilter(bad, [])
+
+
+class TestGetMatchCount:
+
+    def test_counts_streamed_matches(self, filters):
+        _module, ops = filters
+        entries = _Collection(_entry(form) for form in FORMS)
+
+        assert ops.GetMatchCount(FA_FILTER, entries) == 4
+        assert entries.read == len(FORMS)
+
+    def test_accepts_a_generator(self, filters):
+        _module, ops = filters
+
+        assert ops.GetMatchCount(FA_FILTER, (_entry(form) for form in FORMS)) == 4
+
+    def test_defaults_to_repository_of_filter_type(self, filters):
+        module, ops = filters
+        ops.project.ObjectsIn.return_value = iter([_entry(form) for form in FORMS])
+
+        assert ops.GetMatchCount(FA_FILTER) == 4
+        ops.project.ObjectsIn.assert_called_once_with(module.ILexEntryRepository)
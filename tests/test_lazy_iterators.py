@@ -0,0 +1,138 @@
+#
+#   test_lazy_iterators.py
+#
+#   Class: TestTextIterators, TestParagraphIterSegments
+#          Unit tests for Texts.IterParagraphs() / IterSegments() and
+#          Paragraphs.IterSegments(): arguments are checked when the
+#          method is called (not at the first next()), and stopping early
+#          with itertools.islice reads no further paragraphs or segments.
+#          Uses the counting MockFLExProject from conftest and stand-in
+#          LCM collections; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from itertools import islice
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+
+class _Sequence:
+    """A stand-in owning sequence that counts the items it hands out."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.read = 0
+
+    def __iter__(self):
+        for item in self.items:
+            self.read += 1
+            yield item
+
+
+def _text(paragraph_count, segments_per_paragraph):
+    paragraphs = _Sequence(
+        SimpleNamespace(Hvo=p, SegmentsOS=_Sequence(
+            SimpleNamespace(Hvo=p * 100 + s) for s in range(segments_per_paragraph)))
+        for p in range(paragraph_count)
+    )
+    return SimpleNamespace(ContentsOA=SimpleNamespace(ParagraphsOS=paragraphs))
+
+
+class _IText:
+    pass
+
+
+@pytest.fixture
+def texts(mock_project):
+    from flexlibs2.code.TextsWords import TextOperations as module
+
+    mock_project.Object = lambda hvo: SimpleNamespace(Hvo=hvo)
+    with patch.object(module, "IStTxtPara", lambda para: para), \
+         patch.object(module, "IText", _IText):
+        yield module.TextOperations(mock_project)
+
+
+class TestTextIterators:
+
+    def test_islice_stops_reading_paragraphs(self, texts):
+        text = _text(100, 2)
+        paragraphs = text.ContentsOA.ParagraphsOS
+
+        first = list(islice(texts.IterParagraphs(text), 3))
+
+        assert [p.Hvo for p in first] == [0, 1, 2]
+        assert paragraphs.read == 3
+
+    def test_islice_stops_reading_segments(self, texts):
+        text = _text(100, 4)
+        paragraphs = text.ContentsOA.ParagraphsOS
+
+        first = list(islice(texts.IterSegments(text), 6))
+
+        assert [s.Hvo for s in first] == [0, 1, 2, 3, 100, 101]
+        assert paragraphs.read == 2
+        assert paragraphs.items[1].SegmentsOS.read == 2
+        assert paragraphs.items[2].SegmentsOS.read == 0
+
+    def test_no_contents(self, texts):
+        text = SimpleNamespace(ContentsOA=None)
+
+        assert list(texts.IterParagraphs(text)) == []
+        assert list(texts.IterSegments(text)) == []
+
+    @pytest.mark.parametrize("method", ["IterParagraphs", "IterSegments"])
+    def test_none_rejected_on_call(self, texts, method):
+        from flexlibs2.code.FLExProject import FP_NullParameterError
+
+        with pytest.raises(FP_NullParameterError):
+            getattr(texts, method)(None)
+
+    @pytest.mark.parametrize("method", ["IterParagraphs", "IterSegments"])
+    def test_non_text_hvo_rejected_on_call(self, texts, method):
+        from flexlibs2.code.FLExProject import FP_ParameterError
+
+        with pytest.raises(FP_ParameterError):
+            getattr(texts, method)(4242)
+
+
+@pytest.fixture
+def paragraphs(mock_project):
+    from flexlibs2.code.TextsWords import ParagraphOperations as module
+
+    def cast(obj):
+        if not hasattr(obj, "SegmentsOS"):
+            raise AttributeError("not a paragraph")
+        return obj
+
+    mock_project.Object = lambda hvo: SimpleNamespace(Hvo=hvo)
+    with patch.object(module, "IStTxtPara", cast):
+        yield module.ParagraphOperations(mock_project)
+
+
+class TestParagraphIterSegments:
+
+    def test_islice_stops_reading_segments(self, paragraphs):
+        para = _text(1, 50).ContentsOA.ParagraphsOS.items[0]
+
+        first = list(islice(paragraphs.IterSegments(para), 2))
+
+        assert [s.Hvo for s in first] == [0, 1]
+        assert para.SegmentsOS.read == 2
+
+    def test_none_rejected_on_call(self, paragraphs):
+        from flexlibs2.code.FLExProject import FP_NullParameterError
+
+        with pytest.raises(FP_NullParameterError):
+            paragraphs.IterSegments(None)
+
+    def test_invalid_hvo_rejected_on_call(self, paragraphs):
+        from flexlibs2.code.FLExProject import FP_ParameterError
+
+        with pytest.raises(FP_ParameterError):
+            paragraphs.IterSegments(4242)
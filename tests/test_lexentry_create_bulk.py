@@ -0,0 +1,211 @@
+#
+#   test_lexentry_create_bulk.py
+#
+#   Class: TestCreateBulkPOS
+#          Unit tests for the 'pos' column of LexEntryOperations.CreateBulk():
+#          names are resolved through project.POS once per distinct value,
+#          HVOs through project.Object, and an unknown name fails before
+#          anything is created.
+#
+#   Class: TestCreateBulkDomains
+#          The 'semantic_domains' column: numbers are looked up in one
+#          pass over the domain list (made at most once per call), names
+#          through FindByName, and an unknown domain fails before anything
+#          is created.
+#
+#   Class: TestCreateBulkRows
+#          Row shapes: a 'senses' list gives one sense per item, and
+#          columns of different lengths are rejected.
+#
+#          Uses the counting MockFLExProject from conftest with LCM
+#          factories mocked; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+
+@pytest.fixture
+def entries(mock_project):
+    from flexlibs2.code.Lexicon import LexEntryOperations as module
+
+    project = mock_project
+    project.project.DefaultVernWs = 1
+    project.project.DefaultAnalWs = 2
+    # Each factory Create() returns a fresh object with mockable fields.
+    project.project.ServiceLocator.GetService.return_value.Create.side_effect = MagicMock
+    parts_of_speech = {"Verb": SimpleNamespace(Hvo=10), "Noun": SimpleNamespace(Hvo=11)}
+    project.POS = Mock()
+    project.POS.Find.side_effect = parts_of_speech.get
+    project.MSA = Mock()
+    project.Object = Mock(return_value=SimpleNamespace(Hvo=12))
+    numbered = {"1": SimpleNamespace(Hvo=21), "1.1": SimpleNamespace(Hvo=22)}
+    project.SemanticDomains = Mock()
+    project.SemanticDomains.GetAll.side_effect = lambda: list(numbered.values())
+    number_of = {domain.Hvo: number for number, domain in numbered.items()}
+    project.SemanticDomains.GetNumber.side_effect = lambda domain: number_of[domain.Hvo]
+    project.SemanticDomains.FindByName.side_effect = {"Sky": SimpleNamespace(Hvo=23)}.get
+
+    ops = module.LexEntryOperations(project)
+    stem = SimpleNamespace(Hvo=1)
+    ops._LexEntryOperations__FindMorphType = lambda name: stem
+    ops._LexEntryOperations__IsStemType = lambda morph_type: True
+
+    with patch.object(module, "TsStringUtils"):
+        yield module, ops
+
+
+class TestCreateBulkPOS:
+
+    def test_pos_names_resolved_once_each(self, entries):
+        _module, ops = entries
+        project = ops.project
+
+        created = ops.CreateBulk({
+            "lexeme_form": ["famba", "enda", "nyumba"],
+            "gloss": ["walk", "go", "house"],
+            "pos": ["Verb", "Verb", "Noun"],
+        })
+
+        assert len(created) == 3
+        assert sorted(c.args[0] for c in project.POS.Find.call_args_list) == ["Noun", "Verb"]
+        assert [c.args[1].Hvo for c in project.MSA.CreateStem.call_args_list] == [10, 10, 11]
+        assert project.transactions_opened == 1
+
+    def test_pos_by_hvo(self, entries):
+        _module, ops = entries
+        project = ops.project
+
+        ops.CreateBulk([{"lexeme_form": "kula", "gloss": "eat", "pos": 12}])
+
+        project.Object.assert_called_once_with(12)
+        project.POS.Find.assert_not_called()
+        assert project.MSA.CreateStem.call_args.args[1].Hvo == 12
+
+    def test_unknown_pos_fails_before_creating(self, entries):
+        module, ops = entries
+        project = ops.project
+
+        with pytest.raises(module.FP_ParameterError, match="Row 2: part of speech 'Adverb'"):
+            ops.CreateBulk([
+                {"lexeme_form": "famba", "pos": "Verb"},
+                {"lexeme_form": "sana", "pos": "Adverb"},
+            ])
+
+        assert project.transactions_opened == 0
+        project.MSA.CreateStem.assert_not_called()
+
+
+
+def _senses(entry):
+    return [c.args[0] for c in entry.SensesOS.Add.call_args_list]
+
+
+def _domain_hvos(sense):
+    return [c.args[0].Hvo for c in sense.SemanticDomainsRC.Add.call_args_list]
+
+
+class TestCreateBulkDomains:
+
+    def test_numbers_names_and_hvos(self, entries):
+        _module, ops = entries
+
+        created = ops.CreateBulk([
+            {"lexeme_form": "anga", "gloss": "sky", "semantic_domains": ["1", " 1.1 ", "Sky", 12]},
+        ])
+
+        assert _domain_hvos(_senses(created[0])[0]) == [21, 22, 23, 12]
+
+    def test_domain_list_read_once(self, entries):
+        _module, ops = entries
+        domain_ops = ops.project.SemanticDomains
+
+        ops.CreateBulk({
+            "lexeme_form": ["anga", "jua", "mvua"],
+            "gloss": ["sky", "sun", "rain"],
+            "semantic_domains": [["1.1"], ["1.1", "Sky"], ["1"]],
+        })
+
+        domain_ops.GetAll.assert_called_once()
+        domain_ops.FindByName.assert_called_once_with("Sky")
+
+    def test_no_numbered_domains_still_read_once(self, entries):
+        _module, ops = entries
+        domain_ops = ops.project.SemanticDomains
+        domain_ops.GetAll.side_effect = lambda: []
+
+        ops.CreateBulk([
+            {"lexeme_form": "anga", "gloss": "sky", "semantic_domains": ["Sky"]},
+            {"lexeme_form": "nyota", "gloss": "star", "semantic_domains": ["Sky"]},
+            {"lexeme_form": "jua", "gloss": "sun", "semantic_domains": ["Sky", "Sky"]},
+        ])
+
+        domain_ops.GetAll.assert_called_once()
+
+    def test_objects_and_hvos_skip_domain_list(self, entries):
+        _module, ops = entries
+        domain = SimpleNamespace(Hvo=30)
+
+        ops.CreateBulk([{"lexeme_form": "anga", "gloss": "sky", "semantic_domains": [domain, 12]}])
+
+        ops.project.SemanticDomains.GetAll.assert_not_called()
+
+    def test_unknown_domain_fails_before_creating(self, entries):
+        module, ops = entries
+        project = ops.project
+
+        with pytest.raises(module.FP_ParameterError, match="Row 2: semantic domain '9.9'"):
+            ops.CreateBulk([
+                {"lexeme_form": "anga", "semantic_domains": ["1"]},
+                {"lexeme_form": "jua", "semantic_domains": ["9.9"]},
+            ])
+
+        assert project.transactions_opened == 0
+
+
+class TestCreateBulkRows:
+
+    def test_senses_list_makes_one_sense_each(self, entries):
+        _module, ops = entries
+        project = ops.project
+
+        created = ops.CreateBulk([
+            {"lexeme_form": "benki", "senses": [
+                {"gloss": "bank", "pos": "Noun", "semantic_domains": ["1"]},
+                {"gloss": "lean", "pos": "Verb"},
+            ]},
+            {"lexeme_form": "sana"},
+        ])
+
+        first, second = _senses(created[0])
+        assert _domain_hvos(first) == [21]
+        assert _domain_hvos(second) == []
+        assert _senses(created[1]) == []
+        assert [c.args[0] for c in project.MSA.CreateStem.call_args_list] == [first, second]
+        assert [c.args[1].Hvo for c in project.MSA.CreateStem.call_args_list] == [11, 10]
+
+    def test_row_sense_keys_make_one_sense(self, entries):
+        _module, ops = entries
+
+        created = ops.CreateBulk([{"lexeme_form": "famba", "definition": "to walk"}])
+
+        assert len(_senses(created[0])) == 1
+
+    def test_columns_of_different_lengths(self, entries):
+        module, ops = entries
+        project = ops.project
+
+        with pytest.raises(module.FP_ParameterError, match="same length"):
+            ops.CreateBulk({
+                "lexeme_form": ["famba", "enda", "nyumba"],
+                "gloss": ["walk", "go"],
+            })
+
+        assert project.transactions_opened == 0
@@ -0,0 +1,91 @@
+#
+#   test_object_cache.py
+#
+#   Class: TestObjectCache
+#          Unit tests for the bounded, weak-reference Hvo/Guid cache
+#          (_ObjectCache) behind FLExProject.Object(). Pure Python; no
+#          live FLEx project or pythonnet required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import gc
+
+
+class _LcmObject:
+    """Weak-referenceable stand-in for an LCM object."""
+
+    def __init__(self, hvo):
+        self.Hvo = hvo
+        self.IsValidObject = True
+
+
+def _cache(maxsize=4096):
+    from flexlibs2.code._object_cache import _ObjectCache
+    return _ObjectCache(maxsize)
+
+
+class TestObjectCache:
+
+    def test_hit_and_miss(self):
+        cache = _cache()
+        obj = _LcmObject(101)
+
+        assert cache.get(101) is None
+        cache.put(101, obj)
+        assert cache.get(101) is obj
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_does_not_keep_objects_alive(self):
+        cache = _cache()
+        cache.put(101, _LcmObject(101))
+        gc.collect()
+
+        assert cache.get(101) is None
+        assert len(cache) == 0
+
+    def test_bounded_lru(self):
+        cache = _cache(maxsize=2)
+        a, b, c = _LcmObject(1), _LcmObject(2), _LcmObject(3)
+        cache.put(1, a)
+        cache.put(2, b)
+        cache.get(1)          # 1 is now most recently used
+        cache.put(3, c)
+
+        assert cache.get(2) is None
+        assert cache.get(1) is a
+        assert cache.get(3) is c
+
+    def test_discard_and_clear(self):
+        cache = _cache()
+        a, b = _LcmObject(1), _LcmObject(2)
+        cache.put(1, a)
+        cache.put("guid-b", b)
+
+        cache.discard(1)
+        assert cache.get(1) is None
+        assert cache.get("guid-b") is b
+
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_non_weakrefable_objects_held_strongly(self):
+        cache = _cache()
+        cache.put(7, 12345.5)
+
+        assert cache.get(7) == 12345.5
+
+    def test_recached_key_survives_old_object_death(self):
+        cache = _cache()
+        old = _LcmObject(1)
+        cache.put(1, old)
+        new = _LcmObject(1)
+        cache.put(1, new)
+        del old
+        gc.collect()
+
+        assert cache.get(1) is new
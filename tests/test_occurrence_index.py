@@ -0,0 +1,200 @@
+#
+#   test_occurrence_index.py
+#
+#   Class: TestOccurrenceIndex
+#          Unit tests for the wordform/analysis/gloss occurrence index
+#          (_OccurrenceIndex) behind WordformOperations.
+#          BuildOccurrenceIndex() / GetIndexedOccurrences(): key
+#          extraction, counts, re-indexing and the delete and paragraph
+#          hooks. Uses stand-in LCM objects; no live FLEx project
+#          required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+
+
+def _obj(hvo, class_name="WfiWordform"):
+    return SimpleNamespace(Hvo=hvo, ClassName=class_name, IsValidObject=True)
+
+
+def _token(wordform=None, analysis=None, gloss=None):
+    """A stand-in IAnalysis for one word (or punctuation, if all None)."""
+    if gloss is not None:
+        tok = _obj(gloss, "WfiGloss")
+    elif analysis is not None:
+        tok = _obj(analysis, "WfiAnalysis")
+    elif wordform is not None:
+        tok = _obj(wordform, "WfiWordform")
+    else:
+        tok = _obj(0, "PunctuationForm")
+    tok.Wordform = _obj(wordform) if wordform is not None else None
+    tok.Analysis = _obj(analysis, "WfiAnalysis") if analysis is not None else None
+    return tok
+
+
+def _segment(hvo, *tokens):
+    seg = _obj(hvo, "Segment")
+    seg.AnalysesRS = list(tokens)
+    return seg
+
+
+def _index():
+    from flexlibs2.code._occurrence_index import _OccurrenceIndex
+    return _OccurrenceIndex()
+
+
+class TestSegmentKeys:
+
+    def test_each_level_of_each_token(self):
+        from flexlibs2.code._occurrence_index import segment_keys
+
+        seg = _segment(
+            1,
+            _token(wordform=100),
+            _token(wordform=100, analysis=200),
+            _token(wordform=101, analysis=201, gloss=301),
+            _token(),   # punctuation
+        )
+
+        assert segment_keys(seg) == [100, 100, 200, 101, 201, 301]
+
+
+class TestOccurrenceIndex:
+
+    def test_counts_and_segments(self):
+        index = _index()
+        index.index_paragraph(10, [(1, [100, 100, 200]), (2, [100])])
+
+        assert index.count(100) == 3
+        assert index.count(200) == 1
+        assert index.count(999) == 0
+        assert sorted(index.segments(100)) == [1, 2]
+        assert index.segments(999) == []
+
+    def test_reindex_paragraph_replaces_counts(self):
+        index = _index()
+        index.index_paragraph(10, [(1, [100, 200]), (2, [100])])
+        index.index_paragraph(10, [(3, [101])])
+
+        assert index.count(100) == 0
+        assert index.segments(100) == []
+        assert index.count(101) == 1
+        assert len(index) == 1
+        assert 100 not in index._totals
+
+    def test_update_segment_keeps_paragraph(self):
+        index = _index()
+        index.index_paragraph(10, [(1, [100, 200])])
+
+        index.update_segment(1, [100])
+
+        assert index.count(200) == 0
+        assert index._paragraphs == {10: [1]}
+
+    def test_remove_paragraph(self):
+        index = _index()
+        index.index_paragraph(10, [(1, [100])])
+        index.index_paragraph(11, [])
+
+        index.remove_paragraph(10)
+
+        assert index.count(100) == 0
+        assert not index.has_paragraph(10)
+        assert index.has_paragraph(11)
+
+
+class TestDeleteHooks:
+
+    def test_reindex_after_analysis_removed(self):
+        from flexlibs2.code._occurrence_index import (
+            reindex_segments,
+            segment_keys,
+            segments_using,
+        )
+
+        seg1 = _segment(1, _token(wordform=100, analysis=200))
+        seg2 = _segment(2, _token(wordform=100))
+        objects = {1: seg1, 2: seg2}
+        project = SimpleNamespace(Object=objects.__getitem__, _occurrences=_index())
+        project._occurrences.index_paragraph(
+            10, [(s.Hvo, segment_keys(s)) for s in (seg1, seg2)])
+
+        affected = segments_using(project, [200])
+        # LCM re-points the token at the wordform when the analysis goes.
+        seg1.AnalysesRS = [_token(wordform=100)]
+        reindex_segments(project, affected)
+
+        assert affected == [1]
+        assert project._occurrences.count(200) == 0
+        assert project._occurrences.count(100) == 2
+
+    def test_no_index_is_a_no_op(self):
+        from flexlibs2.code._occurrence_index import reindex_segments, segments_using
+
+        project = SimpleNamespace(_occurrences=None)
+
+        assert segments_using(project, [200]) == []
+        reindex_segments(project, [1])
+
+    def test_delete_without_index_skips_lookup(self):
+        from unittest.mock import Mock, patch
+
+        from flexlibs2.code.TextsWords import WfiAnalysisOperations, WfiGlossOperations, WordformOperations
+
+        class _Unlisted:
+            """Fails if the delete enumerates it."""
+
+            def __iter__(self):
+                raise AssertionError("enumerated with no occurrence index")
+
+        project = Mock(_occurrences=None)
+        wordform = Mock(Hvo=100, AnalysesOC=_Unlisted())
+        analysis = Mock(Hvo=200, MeaningsOC=_Unlisted())
+        gloss = Mock(Hvo=300)
+
+        with patch.object(WfiAnalysisOperations, "IWfiWordform", Mock()), \
+             patch.object(WfiGlossOperations, "IWfiAnalysis", Mock()):
+            for module, cls, obj in [
+                (WordformOperations, "WordformOperations", wordform),
+                (WfiAnalysisOperations, "WfiAnalysisOperations", analysis),
+                (WfiGlossOperations, "WfiGlossOperations", gloss),
+            ]:
+                ops = getattr(module, cls)(project)
+                with patch.object(module, "segments_using") as lookup:
+                    ops.Delete(obj)
+                lookup.assert_not_called()
+
+
+class TestParagraphHooks:
+
+    def test_refresh_only_covered_paragraphs(self):
+        from flexlibs2.code._occurrence_index import refresh_occurrences
+
+        project = SimpleNamespace(_occurrences=_index())
+        project._occurrences.index_paragraph(10, [(1, [100])])
+        covered = SimpleNamespace(Hvo=10, SegmentsOS=[_segment(1, _token(wordform=101))])
+        uncovered = SimpleNamespace(Hvo=11, SegmentsOS=[_segment(2, _token(wordform=101))])
+
+        refresh_occurrences(project, covered)
+        refresh_occurrences(project, uncovered)
+
+        assert project._occurrences.count(100) == 0
+        assert project._occurrences.segments(101) == [1]
+        assert not project._occurrences.has_paragraph(11)
+
+    def test_drop_paragraphs(self):
+        from flexlibs2.code._occurrence_index import drop_from_occurrences
+
+        project = SimpleNamespace(_occurrences=_index())
+        project._occurrences.index_paragraph(10, [(1, [100])])
+        project._occurrences.index_paragraph(11, [(2, [100])])
+
+        drop_from_occurrences(project, [10, 12])
+
+        assert project._occurrences.segments(100) == [2]
+        drop_from_occurrences(SimpleNamespace(_occurrences=None), [10])
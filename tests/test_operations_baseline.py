@@ -156,14 +156,13 @@ SYSTEM_OPERATIONS = [
 
 SHARED_OPERATIONS = [
     ("MediaOperations", "flexlibs2.code.Shared.MediaOperations"),
-]
-
-# FilterOperations is a utility class that does not inherit from BaseOperations;
-# it is tracked separately so inheritance/reordering checks are not applied to it.
-UTILITY_OPERATIONS = [
     ("FilterOperations", "flexlibs2.code.Shared.FilterOperations"),
 ]
 
+# Utility classes that do not inherit from BaseOperations; tracked separately
+# so inheritance/reordering checks are not applied to them.
+UTILITY_OPERATIONS = []
+
 # All operations classes (BaseOperations subclasses)
 ALL_OPERATIONS = (
     GRAMMAR_OPERATIONS
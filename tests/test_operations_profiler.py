@@ -0,0 +1,170 @@
+#
+#   test_operations_profiler.py
+#
+#   Class: TestOperationsProfiler
+#          Unit tests for the opt-in OperationsProfiler in
+#          flexlibs2.code.BaseOperations: call counts, tottime/cumtime,
+#          .NET round-trip attribution and the pstats-style report.
+#          Runs against a mock project; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import io
+from unittest.mock import Mock
+
+import pytest
+
+
+class _Clock:
+    """Deterministic timer: each call advances by one second."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+def _lookup():
+    """Count a .NET lookup the way FLExProject.Object() does."""
+    from flexlibs2.code import BaseOperations as base_operations
+
+    if base_operations._active_profiler is not None:
+        base_operations._active_profiler._round_trip()
+
+
+@pytest.fixture
+def ops_class():
+    from flexlibs2.code.BaseOperations import BaseOperations, OperationsMethod
+
+    class FakeOperations(BaseOperations):
+        @OperationsMethod
+        def Outer(self):
+            _lookup()
+            return self.Inner() + 1
+
+        @OperationsMethod
+        def Inner(self):
+            _lookup()
+            _lookup()
+            return 41
+
+        @OperationsMethod
+        def Fail(self):
+            raise ValueError("boom")
+
+    return FakeOperations
+
+
+@pytest.fixture
+def profiler_class():
+    from flexlibs2.code.BaseOperations import OperationsProfiler
+    return OperationsProfiler
+
+
+class TestOperationsProfiler:
+
+    def test_disabled_returns_plain_bound_method(self, ops_class):
+        ops = ops_class(Mock())
+
+        assert ops.Inner.__func__ is ops_class.__dict__["Inner"].func
+        assert ops.Outer() == 42
+
+    def test_counts_and_times(self, ops_class, profiler_class):
+        ops = ops_class(Mock())
+
+        with profiler_class(timer=_Clock()) as prof:
+            assert ops.Outer() == 42
+            assert ops.Inner() == 41
+
+        outer = prof.stats["FakeOperations.Outer"]
+        inner = prof.stats["FakeOperations.Inner"]
+        assert (outer.ncalls, inner.ncalls) == (1, 2)
+        # Outer: start=1, Inner start=2/end=3, Outer end=4.
+        assert outer.cumtime == 3.0
+        assert outer.tottime == 2.0
+        assert inner.cumtime == 2.0
+
+    def test_round_trips_attributed_to_innermost(self, ops_class, profiler_class):
+        ops = ops_class(Mock())
+
+        with profiler_class(timer=_Clock()) as prof:
+            ops.Outer()
+
+        assert prof.stats["FakeOperations.Outer"].round_trips == 1
+        assert prof.stats["FakeOperations.Inner"].round_trips == 2
+
+    def test_class_level_calls_profiled(self, ops_class, profiler_class):
+        with profiler_class(timer=_Clock()) as prof:
+            assert ops_class.Inner(Mock()) == 41
+
+        assert prof.stats["FakeOperations.Inner"].ncalls == 1
+
+    def test_exception_still_recorded(self, ops_class, profiler_class):
+        ops = ops_class(Mock())
+
+        with profiler_class(timer=_Clock()) as prof:
+            with pytest.raises(ValueError):
+                ops.Fail()
+
+        assert prof.stats["FakeOperations.Fail"].ncalls == 1
+        assert prof._stack == []
+
+    def test_nothing_recorded_after_exit(self, ops_class, profiler_class):
+        ops = ops_class(Mock())
+
+        with profiler_class() as prof:
+            pass
+        ops.Outer()
+
+        assert prof.stats == {}
+
+    def test_only_one_active(self, profiler_class):
+        from flexlibs2.code.exceptions import FP_ParameterError
+
+        with profiler_class():
+            with pytest.raises(FP_ParameterError):
+                profiler_class().enable()
+
+    def test_print_stats(self, ops_class, profiler_class):
+        ops = ops_class(Mock())
+        with profiler_class(timer=_Clock()) as prof:
+            ops.Outer()
+
+        out = io.StringIO()
+        prof.print_stats(sort="tottime", stream=out)
+        report = out.getvalue()
+
+        assert "2 operation calls in 3.000 seconds" in report
+        assert "Ordered by: tottime" in report
+        assert report.index("FakeOperations.Outer") < report.index("FakeOperations.Inner")
+
+    def test_unknown_sort_key(self, profiler_class):
+        from flexlibs2.code.exceptions import FP_ParameterError
+
+        with pytest.raises(FP_ParameterError):
+            profiler_class().get_stats(sort="bogus")
+
+    def test_project_lookups_count_round_trips(self, profiler_class):
+        from flexlibs2.code.BaseOperations import BaseOperations, OperationsMethod
+        from flexlibs2.code.FLExProject import FLExProject
+
+        class LookupOperations(BaseOperations):
+            @OperationsMethod
+            def Lookup(self):
+                FLExProject.GetService(self.project, "IFactory")
+                return FLExProject.ObjectRepository(self.project, "IRepository")
+
+        # GetService/ObjectRepository only use project.project.ServiceLocator.
+        ops = LookupOperations(Mock())
+        ops.Lookup()
+
+        with profiler_class(timer=_Clock()) as prof:
+            ops.Lookup()
+
+        assert prof.stats["LookupOperations.Lookup"].round_trips == 2
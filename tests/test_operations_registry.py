@@ -0,0 +1,156 @@
+#
+#   test_operations_registry.py
+#
+#   Class: TestOperationsProperty
+#          Unit tests for the cached, lazily-imported Operations accessor
+#          (_OperationsProperty) that backs FLExProject.POS, .LexEntry, ...
+#          Uses a stand-in owner class, so no live FLEx project or
+#          pythonnet is required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import pytest
+
+
+class _FakeOps:
+    created = 0
+
+    def __init__(self, project):
+        type(self).created += 1
+        self.project = project
+
+
+@pytest.fixture
+def owner_class(monkeypatch):
+    from flexlibs2.code._operations_registry import (
+        _OperationsProperty,
+        _operations_property,
+    )
+
+    monkeypatch.setattr(_OperationsProperty, "load_class", lambda self: _FakeOps)
+    _FakeOps.created = 0
+
+    class Owner:
+        @_operations_property("Grammar.POSOperations", "POSOperations")
+        def POS(self):
+            """Access to Parts of Speech operations."""
+
+        @_operations_property("Lexicon.LexEntryOperations", "LexEntryOperations")
+        def LexEntry(self):
+            """Access to Lexical Entry operations."""
+
+    return Owner
+
+
+class TestOperationsProperty:
+
+    def test_registry_collects_properties(self, owner_class):
+        assert owner_class._operations_registry == {
+            "POS": ("Grammar.POSOperations", "POSOperations"),
+            "LexEntry": ("Lexicon.LexEntryOperations", "LexEntryOperations"),
+        }
+
+    def test_docstring_preserved(self, owner_class):
+        assert owner_class.POS.__doc__ == "Access to Parts of Speech operations."
+
+    def test_instantiated_once_and_cached_on_instance(self, owner_class):
+        project = owner_class()
+
+        first = project.POS
+        second = project.POS
+
+        assert first is second
+        assert first.project is project
+        assert project.__dict__["POS"] is first
+        assert _FakeOps.created == 1
+
+    def test_instances_do_not_share_operations(self, owner_class):
+        a, b = owner_class(), owner_class()
+
+        assert a.POS is not b.POS
+        assert a.POS.project is a
+
+    def test_subclass_registry_is_separate(self, owner_class):
+        from flexlibs2.code._operations_registry import _operations_property
+
+        class Sub(owner_class):
+            @_operations_property("TextsWords.TextOperations", "TextOperations")
+            def Texts(self):
+                """Access to Text operations."""
+
+        assert set(Sub._operations_registry) == {"POS", "LexEntry", "Texts"}
+        assert "Texts" not in owner_class._operations_registry
+
+
+def _flexproject_class_ast():
+    import ast
+    from pathlib import Path
+
+    source = Path(__file__).resolve().parent.parent / "flexlibs2" / "code" / "FLExProject.py"
+    tree = ast.parse(source.read_text(encoding="utf-8"))
+    return next(node for node in tree.body
+                if isinstance(node, ast.ClassDef) and node.name == "FLExProject")
+
+
+def _decorations(cls_node):
+    """{method name: ('property', None) or ('operations', (module, class))}."""
+    import ast
+
+    found = {}
+    for node in cls_node.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for dec in node.decorator_list:
+            if isinstance(dec, ast.Name) and dec.id == "property":
+                found[node.name] = ("property", None, node)
+            elif (isinstance(dec, ast.Call)
+                  and getattr(dec.func, "id", None) == "_operations_property"):
+                args = tuple(arg.value for arg in dec.args)
+                found[node.name] = ("operations", args, node)
+    return found
+
+
+class TestFLExProjectRegistry:
+    """Checks the real FLExProject source (parsed, not imported, so no
+    pythonnet is needed) for registry entries attached to the wrong
+    property."""
+
+    def test_each_entry_wraps_its_own_property(self):
+        import ast
+
+        for name, (kind, args, node) in _decorations(_flexproject_class_ast()).items():
+            if kind != "operations":
+                continue
+            module, class_name = args
+            assert module.endswith("." + class_name), name
+            # The wrapped property documents what it returns; a decorator
+            # shifted onto a neighbouring property fails this.
+            assert class_name in (ast.get_docstring(node) or ""), (
+                f"FLExProject.{name} is registered as {class_name}")
+
+    def test_known_properties(self):
+        decorations = _decorations(_flexproject_class_ast())
+
+        assert decorations["POS"][:2] == (
+            "operations", ("Grammar.POSOperations", "POSOperations"))
+        assert decorations["GramCat"][:2] == (
+            "operations", ("Grammar.GramCatOperations", "GramCatOperations"))
+        # Cache is the raw LcmCache and Features an alias; neither is an
+        # Operations registry entry.
+        assert decorations["Cache"][0] == "property"
+        assert decorations["Features"][0] == "property"
+
+    def test_plain_properties_have_bodies(self):
+        import ast
+
+        for name, (kind, _args, node) in _decorations(_flexproject_class_ast()).items():
+            if kind != "property":
+                continue
+            body = [stmt for stmt in node.body
+                    if not (isinstance(stmt, ast.Expr)
+                            and isinstance(stmt.value, ast.Constant))]
+            assert body, f"FLExProject.{name} is a @property with no body"
@@ -0,0 +1,315 @@
+#
+#   test_run_checks.py
+#
+#   Class: TestSinglePass
+#          CheckOperations.RunChecks() reads the lexicon, and each entry's
+#          senses, once however many checks it runs.
+#
+#   Class: TestBuiltinParity
+#          The built-in per-entry checks flag the same entries, and pass
+#          the same number, as the per-check loop they replaced
+#          (_legacy_check below is that loop, trimmed to one check).
+#
+#   Class: TestResultShape
+#          Each result is {'errors': {hvo: obj}, 'warnings': {hvo: obj},
+#          'passed_count': int, 'timestamp': datetime}, and is what
+#          GetCheckResults() returns afterwards.
+#
+#   Class: TestSelection
+#          checks= (objects, HVOs or names) and target_objects= choose what
+#          is run and on what; unknown or disabled checks raise
+#          FP_ParameterError.
+#
+#          Stand-in LCM objects; no live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import itertools
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+BUILTIN_PER_ENTRY = [
+    "Missing Gloss",
+    "Missing Definition",
+    "Missing Example",
+    "Missing Grammatical Info",
+    "Missing Part of Speech",
+    "Missing Etymology",
+]
+
+
+def _text(value):
+    return SimpleNamespace(get_String=lambda ws: SimpleNamespace(Text=value))
+
+
+def _sense(gloss="walk", definition="to walk", examples=1, msa=True):
+    return SimpleNamespace(
+        Gloss=_text(gloss),
+        Definition=_text(definition),
+        ExamplesOS=SimpleNamespace(Count=examples),
+        MorphoSyntaxAnalysisRA=SimpleNamespace() if msa else None,
+    )
+
+
+class _Entry:
+    """A stand-in ILexEntry that counts reads of SensesOS."""
+
+    def __init__(self, hvo, senses=(), etymologies=1):
+        self.Hvo = hvo
+        self._senses = list(senses)
+        self.EtymologyOS = SimpleNamespace(Count=etymologies)
+        self.sense_reads = 0
+
+    @property
+    def SensesOS(self):
+        self.sense_reads += 1
+        return self._senses
+
+
+class _Lexicon:
+    """A stand-in entry repository that counts full traversals."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        return iter(self.entries)
+
+
+def _check(hvo, name):
+    return SimpleNamespace(Hvo=hvo, Guid=f"guid-{hvo}", Name=_text(name), SubPossibilitiesOS=[])
+
+
+def _lexicon():
+    """One entry per combination of sense states, plus sense-less entries."""
+    sense_states = [
+        _sense(),
+        _sense(gloss=None),
+        _sense(gloss="   "),
+        _sense(definition=""),
+        _sense(examples=0),
+        _sense(msa=False),
+        _sense(gloss="", definition=None, examples=0, msa=False),
+    ]
+    entries = []
+    hvo = 100
+    for first, second in itertools.product(sense_states, [None] + sense_states[:3]):
+        for etymologies in (0, 1):
+            senses = [first] if second is None else [first, second]
+            entries.append(_Entry(hvo, senses, etymologies))
+            hvo += 1
+    entries.append(_Entry(hvo, [], 0))
+    entries.append(_Entry(hvo + 1, [], 1))
+    return entries
+
+
+def _legacy_check(check_name, entries, ws):
+    """The pre-registry _ExecuteCheck loop for the per-entry checks."""
+    errors, warnings, passed = [], [], []
+    for entry in entries:
+        has_issue = False
+        if check_name == "Missing Gloss":
+            for sense in entry.SensesOS:
+                gloss_text = sense.Gloss.get_String(ws).Text
+                if not gloss_text or not gloss_text.strip():
+                    errors.append(entry)
+                    has_issue = True
+                    break
+        elif check_name == "Missing Definition":
+            for sense in entry.SensesOS:
+                def_text = sense.Definition.get_String(ws).Text
+                if not def_text or not def_text.strip():
+                    warnings.append(entry)
+                    has_issue = True
+                    break
+        elif check_name == "Missing Example":
+            for sense in entry.SensesOS:
+                if sense.ExamplesOS.Count == 0:
+                    warnings.append(entry)
+                    has_issue = True
+                    break
+        elif check_name in ("Missing Grammatical Info", "Missing Part of Speech"):
+            for sense in entry.SensesOS:
+                if sense.MorphoSyntaxAnalysisRA is None:
+                    errors.append(entry)
+                    has_issue = True
+                    break
+        elif check_name == "Missing Etymology":
+            if entry.EtymologyOS.Count == 0:
+                warnings.append(entry)
+                has_issue = True
+        if not has_issue:
+            passed.append(entry)
+    return errors, warnings, passed
+
+
+@pytest.fixture
+def checks():
+    from flexlibs2.code.System import CheckOperations as module
+
+    project = Mock()
+    project.project.DefaultAnalWs = 1
+    ops = module.CheckOperations(project)
+    check_types = [_check(hvo, name) for hvo, name in enumerate(BUILTIN_PER_ENTRY + ["Duplicate Entries"], 1)]
+    ops._GetCheckList = lambda: SimpleNamespace(PossibilitiesOS=check_types)
+    for check_type in check_types:
+        ops._check_enabled[check_type.Guid] = True
+    project.Object.side_effect = {c.Hvo: c for c in check_types}.get
+
+    with patch.object(module, "ILexEntry", _Entry), \
+         patch.object(module, "ICmPossibility", lambda obj: obj), \
+         patch.object(module, "ITsString", lambda ts: ts):
+        yield module, ops, {ops.GetName(c): c for c in check_types}
+
+
+class TestSinglePass:
+
+    def test_one_lexicon_pass_for_all_checks(self, checks):
+        _module, ops, _by_name = checks
+        entries = _lexicon()
+        lexicon = _Lexicon(entries)
+
+        all_results = ops.RunChecks(target_objects=lexicon)
+
+        assert set(all_results) == set(BUILTIN_PER_ENTRY) | {"Duplicate Entries"}
+        assert lexicon.passes == 1
+        assert all(entry.sense_reads == 1 for entry in entries)
+
+    def test_default_targets_read_once(self, checks):
+        _module, ops, _by_name = checks
+        lexicon = _Lexicon(_lexicon())
+        ops.project.LexiconAllEntries.return_value = lexicon
+
+        ops.RunChecks(["Missing Gloss", "Missing Example", "Missing Etymology"])
+
+        assert lexicon.passes == 1
+
+
+class TestBuiltinParity:
+
+    @pytest.mark.parametrize("name", BUILTIN_PER_ENTRY)
+    def test_matches_legacy_check(self, checks, name):
+        _module, ops, _by_name = checks
+        entries = _lexicon()
+        errors, warnings, passed = _legacy_check(name, entries, 1)
+
+        results = ops.RunChecks(target_objects=entries)[name]
+
+        assert set(results["errors"]) == {e.Hvo for e in errors}
+        assert set(results["warnings"]) == {e.Hvo for e in warnings}
+        assert results["passed_count"] == len(passed)
+
+    def test_run_check_matches_run_checks(self, checks):
+        _module, ops, by_name = checks
+        entries = _lexicon()
+
+        together = ops.RunChecks(target_objects=entries)
+        for name in BUILTIN_PER_ENTRY:
+            alone = ops.RunCheck(by_name[name], entries)
+            assert {k: alone[k] for k in ("errors", "warnings", "passed_count")} == \
+                {k: together[name][k] for k in ("errors", "warnings", "passed_count")}
+
+
+class TestResultShape:
+
+    def test_result_keys_and_types(self, checks):
+        _module, ops, by_name = checks
+        no_gloss = _Entry(1, [_sense(gloss="")])
+        no_example = _Entry(2, [_sense(examples=0)])
+        fine = _Entry(3, [_sense()])
+
+        results = ops.RunCheck(by_name["Missing Gloss"], [no_gloss, no_example, fine])
+
+        assert set(results) == {"errors", "warnings", "passed_count", "timestamp"}
+        assert results["errors"] == {1: no_gloss}
+        assert results["warnings"] == {}
+        assert results["passed_count"] == 2
+        assert isinstance(results["timestamp"], datetime)
+
+    def test_issues_keyed_by_hvo(self, checks):
+        _module, ops, by_name = checks
+        entries = [_Entry(1, [_sense(examples=0)]), _Entry(2, [_sense()]), _Entry(3, [_sense(examples=0)])]
+
+        results = ops.RunCheck(by_name["Missing Example"], entries)
+
+        # Iterating the dict gives HVOs; .values() gives the objects.
+        assert list(results["warnings"]) == [1, 3]
+        assert list(results["warnings"].values()) == [entries[0], entries[2]]
+        assert 3 in results["warnings"] and 2 not in results["warnings"]
+
+    def test_stored_result_is_returned_result(self, checks):
+        _module, ops, by_name = checks
+
+        results = ops.RunChecks(["Missing Gloss"], target_objects=[_Entry(1, [_sense()])])
+
+        assert ops.GetCheckResults(by_name["Missing Gloss"]) == results["Missing Gloss"]
+
+
+class TestSelection:
+
+    def test_checks_by_object_hvo_and_name(self, checks):
+        _module, ops, by_name = checks
+
+        all_results = ops.RunChecks(
+            [by_name["Missing Gloss"], by_name["Missing Example"].Hvo, "missing etymology"],
+            target_objects=_lexicon(),
+        )
+
+        assert list(all_results) == ["Missing Gloss", "Missing Example", "Missing Etymology"]
+
+    def test_none_runs_only_enabled_checks(self, checks):
+        _module, ops, by_name = checks
+        ops._check_enabled[by_name["Missing Example"].Guid] = False
+
+        all_results = ops.RunChecks(target_objects=_lexicon())
+
+        assert "Missing Example" not in all_results
+        assert "Missing Gloss" in all_results
+
+    def test_target_objects_limit_the_run(self, checks):
+        _module, ops, _by_name = checks
+        no_gloss = _Entry(1, [_sense(gloss="")])
+        fine = _Entry(2, [_sense()])
+        other = _Entry(3, [_sense(gloss="")])
+
+        results = ops.RunChecks(["Missing Gloss"], target_objects=[no_gloss, fine])["Missing Gloss"]
+
+        assert list(results["errors"]) == [1]
+        assert results["passed_count"] == 1
+        assert other.sense_reads == 0
+
+    def test_results_stored_per_check(self, checks):
+        _module, ops, by_name = checks
+
+        ops.RunChecks(["Missing Gloss"], target_objects=[_Entry(1, [_sense(gloss="")])])
+
+        assert ops.GetErrorCount(by_name["Missing Gloss"]) == 1
+        assert ops.GetCheckResults(by_name["Missing Example"]) is None
+
+    def test_unknown_check_name(self, checks):
+        module, ops, _by_name = checks
+
+        with pytest.raises(module.FP_ParameterError, match="Unknown check type: 'Missing Tone'"):
+            ops.RunChecks(["Missing Gloss", "Missing Tone"], target_objects=[])
+
+    def test_disabled_check(self, checks):
+        module, ops, by_name = checks
+        ops._check_enabled[by_name["Missing Gloss"].Guid] = False
+
+        with pytest.raises(module.FP_ParameterError, match="enabled"):
+            ops.RunChecks(["Missing Gloss"], target_objects=[])
+
+    def test_empty_selection(self, checks):
+        _module, ops, _by_name = checks
+
+        assert ops.RunChecks([], target_objects=_Lexicon([])) == {}
@@ -0,0 +1,147 @@
+#
+#   test_segment_checks.py
+#
+#   Class: TestSegmentChecks
+#          Unit tests for the pure segment offset checks in
+#          flexlibs2.code._segment_checks, shared by
+#          SegmentOperations.ValidateSegments() and ValidateCorpus().
+#
+#   Class: TestValidateCorpusWorkers
+#          ValidateCorpus() checks in-process unless workers are asked
+#          for. The executor is replaced by an in-process stand-in:
+#          real worker processes import flexlibs2 (and pythonnet), which
+#          a unit test should not depend on.
+#
+#          Plain tuples and stand-in LCM objects; no live FLEx project
+#          required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from flexlibs2.code._segment_checks import check_paragraph, check_segment_offsets
+
+
+class TestSegmentChecks:
+
+    def test_clean_paragraph(self):
+        assert check_segment_offsets([(0, 10, "One. "), (10, 20, "Two.")], 20) == ([], [])
+
+    def test_no_segments_is_a_warning(self):
+        assert check_segment_offsets([]) == ([], ["Paragraph has no segments"])
+
+    def test_overlap_and_invalid_offsets(self):
+        errors, _warnings = check_segment_offsets([(0, 10, "a"), (8, 8, "b")])
+
+        assert any("Overlap between segment 0 and 1" in e for e in errors)
+        assert any("Segment 1 has invalid offsets" in e for e in errors)
+
+    def test_gap_and_empty_baseline_are_warnings(self):
+        errors, warnings = check_segment_offsets([(0, 5, "a"), (9, 12, "")])
+
+        assert errors == []
+        assert any("Gap between segment 0 and 1" in w for w in warnings)
+        assert "Segment 1 has empty baseline text" in warnings
+
+    def test_past_end_of_text_only_checked_with_length(self):
+        segments = [(0, 30, "text")]
+
+        assert check_segment_offsets(segments) == ([], [])
+        errors, _warnings = check_segment_offsets(segments, text_length=20)
+        assert "extends past the paragraph text" in errors[0]
+
+    def test_missing_offsets_skipped_with_warning(self):
+        errors, warnings = check_segment_offsets([(None, None, "a"), (0, 4, "b")])
+
+        assert errors == []
+        assert warnings == ["Segment 0 missing offset attributes"]
+
+    def test_check_paragraph_record(self):
+        result = check_paragraph((501, 4, [(0, 5, 5)]))
+
+        assert result["paragraph"] == 501
+        assert result["valid"] is False
+        assert result["segment_count"] == 1
+
+    def test_check_paragraph_is_picklable_by_reference(self):
+        import pickle
+
+        assert pickle.loads(pickle.dumps(check_paragraph)) is check_paragraph
+
+
+class _InlineExecutor:
+    """ProcessPoolExecutor stand-in that records use and maps in-process."""
+
+    instances = []
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self.chunksize = None
+        _InlineExecutor.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, records, chunksize=1):
+        self.chunksize = chunksize
+        return map(fn, records)
+
+
+def _text(hvo, paragraphs):
+    """A stand-in IText whose paragraphs each have one clean segment."""
+    paras = [
+        SimpleNamespace(
+            Hvo=para_hvo,
+            Contents=SimpleNamespace(Length=10),
+            SegmentsOS=[SimpleNamespace(BeginOffset=0, EndOffset=end)],
+        )
+        for para_hvo, end in paragraphs
+    ]
+    return SimpleNamespace(Hvo=hvo, ContentsOA=SimpleNamespace(ParagraphsOS=paras))
+
+
+@pytest.fixture
+def segments():
+    from flexlibs2.code.TextsWords import SegmentOperations as module
+
+    ops = object.__new__(module.SegmentOperations)
+    ops.GetBaselineText = lambda seg: "x" * seg.EndOffset
+    _InlineExecutor.instances = []
+    with patch.object(module, "ProcessPoolExecutor", _InlineExecutor), \
+         patch.object(module, "IStTxtPara", lambda para: para), \
+         patch.object(module, "_PARALLEL_MIN_PARAGRAPHS", 3):
+        yield ops
+
+
+class TestValidateCorpusWorkers:
+
+    def test_in_process_by_default(self, segments):
+        corpus = [_text(1, [(10, 10), (11, 10), (12, 10), (13, 10)])]
+
+        assert segments.ValidateCorpus(corpus) == []
+        assert _InlineExecutor.instances == []
+
+    def test_workers_use_executor(self, segments):
+        corpus = [_text(1, [(10, 10), (11, 10)]), _text(2, [(20, 12), (21, 10)])]
+
+        issues = segments.ValidateCorpus(corpus, workers=2, chunk_size=8)
+
+        [pool] = _InlineExecutor.instances
+        assert (pool.max_workers, pool.chunksize) == (2, 8)
+        # Paragraph 20's segment runs past its 10-character text.
+        assert [(i["text"], i["paragraph"], i["valid"]) for i in issues] == [(2, 20, False)]
+
+    def test_small_corpus_stays_in_process(self, segments):
+        segments.ValidateCorpus([_text(1, [(10, 10)])], workers=4)
+
+        assert _InlineExecutor.instances == []
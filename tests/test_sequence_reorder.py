@@ -0,0 +1,180 @@
+#
+#   test_sequence_reorder.py
+#
+#   Class: TestSequenceReorder
+#          Unit tests for BaseOperations.Sort() and SetOrder(): the new order
+#          is applied with the fewest MoveTo calls, inside one transaction.
+#          Uses a stand-in owning sequence with LCM MoveTo semantics; no
+#          live FLEx project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class _Item:
+    def __init__(self, hvo, name):
+        self.Hvo = hvo
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+class _Sequence:
+    """Owning sequence stand-in. MoveTo follows LCM: a forward move's
+    destination index is counted before the item is taken out."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.moves = 0
+
+    @property
+    def Count(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def MoveTo(self, start, end, dest, dest_index):
+        assert start == end and dest is self
+        item = self.items.pop(start)
+        if dest_index > start:
+            dest_index -= 1
+        self.items.insert(dest_index, item)
+        self.moves += 1
+
+
+@pytest.fixture
+def ops():
+    from flexlibs2.code.BaseOperations import BaseOperations
+
+    class FakeOperations(BaseOperations):
+        def _GetSequence(self, parent):
+            return parent
+
+    project = MagicMock()
+    project._transaction_depth = 0
+    project._undoable = False
+    project.writeEnabled = True
+    return FakeOperations(project)
+
+
+def _sequence(names):
+    return _Sequence(_Item(100 + i, name) for i, name in enumerate(names))
+
+
+class TestSequenceReorder:
+
+    def test_sort_orders_items(self, ops):
+        seq = _sequence("dbeca")
+
+        assert ops.Sort(seq, key_func=lambda item: item.name) == 5
+        assert "".join(item.name for item in seq) == "abcde"
+
+    def test_sort_reverse_is_stable(self, ops):
+        seq = _sequence(["b1", "a1", "b2", "a2"])
+
+        ops.Sort(seq, key_func=lambda item: item.name[0], reverse=True)
+
+        assert [item.name for item in seq] == ["b1", "b2", "a1", "a2"]
+
+    def test_sorted_sequence_is_not_written(self, ops):
+        seq = _sequence("abc")
+
+        ops.Sort(seq, key_func=lambda item: item.name)
+
+        assert seq.moves == 0
+        ops.project.Transaction.assert_not_called()
+
+    def test_one_misplaced_item_costs_one_move(self, ops):
+        seq = _sequence("bcdefghija")
+
+        ops.Sort(seq, key_func=lambda item: item.name)
+
+        assert "".join(item.name for item in seq) == "abcdefghij"
+        assert seq.moves == 1
+
+    def test_moves_run_in_one_transaction(self, ops):
+        seq = _sequence("edcba")
+
+        ops.Sort(seq, key_func=lambda item: item.name)
+
+        ops.project.Transaction.assert_called_once()
+
+    def test_random_permutations(self, ops):
+        rng = random.Random(7)
+        for _ in range(50):
+            names = [f"{i:03d}" for i in range(rng.randint(2, 40))]
+            rng.shuffle(names)
+            seq = _sequence(names)
+
+            ops.Sort(seq, key_func=lambda item: item.name)
+
+            assert [item.name for item in seq] == sorted(names)
+
+    def test_large_permutation_uses_fewest_moves(self, ops):
+        from flexlibs2.code.BaseOperations import _increasing_subsequence
+
+        rng = random.Random(11)
+        names = [f"{i:04d}" for i in range(2000)]
+        rng.shuffle(names)
+        seq = _sequence(names)
+        order = sorted(range(len(names)), key=names.__getitem__)
+
+        moves = ops._ApplyOrder(seq, order)
+
+        assert [item.name for item in seq] == sorted(names)
+        assert moves == seq.moves == len(names) - len(_increasing_subsequence(order))
+
+    @pytest.mark.parametrize("order", [
+        [4999] + list(range(4999)),           # last item to the front
+        list(range(1, 5000)) + [0],           # first item to the end
+        list(range(4999, -1, -1)),            # reversal
+    ])
+    def test_long_moves(self, ops, order):
+        seq = _sequence(f"{i:04d}" for i in range(len(order)))
+        expected = [seq.items[i] for i in order]
+
+        ops._ApplyOrder(seq, order)
+
+        assert seq.items == expected
+
+    def test_occupied_slots(self):
+        from flexlibs2.code.BaseOperations import _OccupiedSlots
+
+        slots = _OccupiedSlots(6)
+        for i in (0, 2, 3, 5):
+            slots.add(i, 1)
+        slots.add(2, -1)
+
+        assert [slots.before(i) for i in range(7)] == [0, 1, 1, 1, 2, 2, 3]
+
+    def test_reorder_accepts_objects_and_hvos(self, ops):
+        seq = _sequence("abc")
+        a, b, c = seq.items
+
+        assert ops.SetOrder(seq, [c.Hvo, a, b]) == 1
+        assert list(seq) == [c, a, b]
+
+    def test_reorder_rejects_non_permutations(self, ops):
+        from flexlibs2.code.exceptions import FP_ParameterError
+
+        seq = _sequence("abc")
+        a, b, c = seq.items
+
+        with pytest.raises(FP_ParameterError):
+            ops.SetOrder(seq, [a, b])
+        with pytest.raises(FP_ParameterError):
+            ops.SetOrder(seq, [a, a, b, c])
+        assert seq.moves == 0
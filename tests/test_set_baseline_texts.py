@@ -0,0 +1,168 @@
+#
+#   test_set_baseline_texts.py
+#
+#   Class: TestSetBaselineTexts
+#          SegmentOperations.SetBaselineTexts(): edits of different lengths
+#          are applied from the end of the paragraph backwards against the
+#          original offsets, Contents is assigned once, unchanged segments
+#          are not counted, and a segment from another paragraph or given
+#          twice is rejected before anything is written.
+#
+#   Class: TestSetBaselineText
+#          SetBaselineText() writes through the same transaction wrapper.
+#
+#          Stand-in paragraph with a TsStrBldr-like builder; no live FLEx
+#          project required.
+#
+#   Platform: Python.NET
+#             FieldWorks Version 9+
+#
+#   Copyright 2026
+#
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class _Builder:
+    """Applies ReplaceTsString to a plain string, recording each call."""
+
+    def __init__(self, text, calls):
+        self.text = text
+        self.calls = calls
+
+    def ReplaceTsString(self, begin, end, replacement):
+        self.calls.append((begin, end, replacement))
+        self.text = self.text[:begin] + replacement + self.text[end:]
+
+    def GetString(self):
+        return SimpleNamespace(Text=self.text, GetBldr=lambda: _Builder(self.text, self.calls))
+
+
+class _Segment:
+    """A stand-in ISegment (hashable, so it can key an edits dict)."""
+
+    def __init__(self, hvo, begin, text, paragraph):
+        self.Hvo = hvo
+        self.BeginOffset = begin
+        self.EndOffset = begin + len(text)
+        self.BaselineText = SimpleNamespace(Text=text)
+        self.Paragraph = paragraph
+
+
+class _Paragraph:
+    """A stand-in IStTxtPara whose segments cover the given pieces."""
+
+    def __init__(self, hvo, pieces):
+        self.Hvo = hvo
+        self.replacements = []
+        self.assignments = 0
+        self.SegmentsOS = []
+        offset = 0
+        for i, piece in enumerate(pieces):
+            self.SegmentsOS.append(_Segment(hvo * 10 + i, offset, piece, self))
+            offset += len(piece)
+        self._contents = _Builder("".join(pieces), self.replacements).GetString()
+
+    @property
+    def Contents(self):
+        return self._contents
+
+    @Contents.setter
+    def Contents(self, ts):
+        self.assignments += 1
+        self._contents = ts
+
+
+@pytest.fixture
+def segments():
+    from flexlibs2.code.TextsWords import SegmentOperations as module
+
+    project = MagicMock()
+    project.writeEnabled = True
+    project._undoable = False
+    project._transaction_depth = 0
+    project._concordance = None
+    project._occurrences = None
+
+    with patch.object(module, "TsStringUtils", SimpleNamespace(MakeString=lambda text, ws: text)):
+        yield module, module.SegmentOperations(project)
+
+
+class TestSetBaselineTexts:
+
+    def test_mixed_lengths_applied_right_to_left(self, segments):
+        _module, ops = segments
+        para = _Paragraph(1, ["One. ", "Three! ", "Two?"])
+        one, three, two = para.SegmentsOS
+
+        changed = ops.SetBaselineTexts(para, [
+            (one, "Uno. "),             # same length
+            (three, "Tres! "),          # shorter
+            (two, "Dos, y mas?"),       # longer
+        ])
+
+        assert changed == 3
+        assert para.Contents.Text == "Uno. Tres! Dos, y mas?"
+        assert [(b, e) for b, e, _text in para.replacements] == [(12, 16), (5, 12), (0, 5)]
+
+    def test_contents_assigned_once_in_one_transaction(self, segments):
+        _module, ops = segments
+        para = _Paragraph(1, ["a. ", "b. ", "c."])
+
+        ops.SetBaselineTexts(para, {seg: seg.BaselineText.Text.upper() for seg in para.SegmentsOS})
+
+        assert para.assignments == 1
+        ops.project.Transaction.assert_called_once()
+
+    def test_unchanged_segments_not_counted(self, segments):
+        _module, ops = segments
+        para = _Paragraph(1, ["Same. ", "Old."])
+        same, old = para.SegmentsOS
+
+        assert ops.SetBaselineTexts(para, {same: "Same. ", old: "New."}) == 1
+        assert para.Contents.Text == "Same. New."
+        assert para.replacements == [(6, 10, "New.")]
+
+    def test_all_unchanged_writes_nothing(self, segments):
+        _module, ops = segments
+        para = _Paragraph(1, ["Same. ", "Too."])
+
+        assert ops.SetBaselineTexts(para, {seg: seg.BaselineText.Text for seg in para.SegmentsOS}) == 0
+        assert para.assignments == 0
+        ops.project.Transaction.assert_not_called()
+
+    def test_segment_not_in_paragraph(self, segments):
+        module, ops = segments
+        para = _Paragraph(1, ["Here. "])
+        elsewhere = _Paragraph(2, ["There."]).SegmentsOS[0]
+
+        with pytest.raises(module.FP_ParameterError, match="not in this paragraph"):
+            ops.SetBaselineTexts(para, [(para.SegmentsOS[0], "Hier. "), (elsewhere, "Da.")])
+
+        assert para.assignments == 0
+
+    def test_segment_given_more_than_once(self, segments):
+        module, ops = segments
+        para = _Paragraph(1, ["Once. ", "More."])
+        once = para.SegmentsOS[0]
+
+        with pytest.raises(module.FP_ParameterError, match="more than once"):
+            ops.SetBaselineTexts(para, [(once, "One. "), (once, "Uno. ")])
+
+        assert para.assignments == 0
+
+
+class TestSetBaselineText:
+
+    def test_writes_in_a_transaction(self, segments):
+        _module, ops = segments
+        para = _Paragraph(1, ["One. ", "Two."])
+
+        ops.SetBaselineText(para.SegmentsOS[1], "Zwei.")
+
+        assert para.Contents.Text == "One. Zwei."
+        assert para.assignments == 1
+        ops.project.Transaction.assert_called_once()